@@ -0,0 +1,508 @@
+"""
+This script detects performance anti-patterns in the generated code with a rule engine over the syntax tree
+and correlates the number of their occurrences with the measured times (time_behaviour columns of results.csv).
+Every rule applies only to the functions matching its scope (e.g. TaskManager.search), so the counts
+refer to the code which is actually measured by the tests.
+Running: python code/analysis/antipatterns.py (from the root of the repository)
+Output: results/{challenge}/antipatterns.csv, results/{challenge}/antipattern_correlations.csv,
+        results/{challenge}/{prompt}/iteration_{i}/antipatterns-{model}.txt
+"""
+
+import ast
+import csv
+import os
+import statistics
+import time
+from fnmatch import fnmatch
+
+from config import (
+    ANTIPATTERN_COUNTS_FILE,
+    ANTIPATTERNS_FILE,
+    CHALLENGES,
+    CORRELATIONS_FILE,
+    GENERATED_DIR,
+    ITERATIONS,
+    MODEL_DETAILS,
+    MODELS,
+    PROMPTS,
+    RESULTS_DIR,
+    TIME_COLUMNS_PREFIX,
+)
+from helpers import get_implementations, get_spearman, parse_module
+
+COMPREHENSIONS = (ast.ListComp, ast.SetComp, ast.DictComp, ast.GeneratorExp)
+REGEX_FUNCTIONS = {"compile", "match", "fullmatch", "search", "findall", "finditer", "split", "sub", "subn"}
+CASE_FUNCTIONS = {"lower", "upper", "casefold"}
+
+
+# Helper functions
+def is_self_attribute(node: ast.AST) -> bool:
+    """
+    Checks whether the node is an attribute of the instance (self.name).
+
+    Args:
+        node (ast.AST): The node to be checked.
+
+    Returns:
+        bool: True if the node is an attribute of self, False otherwise.
+    """
+    return isinstance(node, ast.Attribute) and isinstance(node.value, ast.Name) and node.value.id == "self"
+
+
+def is_list_value(node: ast.AST) -> bool:
+    """
+    Checks whether the assigned value is a list.
+
+    Args:
+        node (ast.AST): The assigned value.
+
+    Returns:
+        bool: True if the value is a list literal, a list comprehension or a list() call.
+    """
+    if isinstance(node, (ast.List, ast.ListComp)):
+        return True
+
+    return isinstance(node, ast.Call) and isinstance(node.func, ast.Name) and node.func.id == "list"
+
+
+def is_str_value(node: ast.AST, names: set) -> bool:
+    """
+    Checks whether the expression evaluates to a string.
+
+    Args:
+        node (ast.AST): The expression.
+        names (set): The names of the local variables known to hold strings.
+
+    Returns:
+        bool: True if the expression is a string, False if it is not or the type is unknown.
+    """
+    if isinstance(node, ast.Constant):
+        return isinstance(node.value, str)
+    if isinstance(node, ast.JoinedStr):
+        return True
+    if isinstance(node, ast.Name):
+        return node.id in names
+    if isinstance(node, ast.BinOp) and isinstance(node.op, (ast.Add, ast.Mult)):
+        return is_str_value(node.left, names) or is_str_value(node.right, names)
+    if isinstance(node, ast.Call) and isinstance(node.func, ast.Name):
+        return node.func.id == "str"
+    if isinstance(node, ast.Call) and isinstance(node.func, ast.Attribute):
+        return node.func.attr == "join" and isinstance(node.func.value, ast.Constant)
+    return False
+
+
+def get_assignments(node: ast.AST) -> list[tuple]:
+    """
+    Returns all simple assignments in the subtree.
+
+    Args:
+        node (ast.AST): The root of the subtree.
+
+    Returns:
+        list[tuple]: A list of (target, value) tuples.
+    """
+    assignments = []
+    for child in ast.walk(node):
+        if isinstance(child, ast.Assign):
+            assignments.extend((target, child.value) for target in child.targets)
+        elif isinstance(child, ast.AnnAssign) and child.value is not None:
+            assignments.append((child.target, child.value))
+    return assignments
+
+
+def is_list(node: ast.AST, engine: "RuleEngine") -> bool:
+    """
+    Checks whether the expression refers to a local variable or an attribute of the instance holding a list.
+
+    Args:
+        node (ast.AST): The expression.
+        engine (RuleEngine): The engine with the known lists.
+
+    Returns:
+        bool: True if the expression is a known list, False otherwise.
+    """
+    if isinstance(node, ast.Name):
+        return node.id in engine.list_names
+    return is_self_attribute(node) and node.attr in engine.list_attributes
+
+
+def is_instance_collection(node: ast.AST) -> bool:
+    """
+    Checks whether the iterated expression is a collection stored in the instance
+    (self.tasks, self.tasks.values(), list(self.tasks.items()), ...).
+
+    Args:
+        node (ast.AST): The iterated expression.
+
+    Returns:
+        bool: True if the expression iterates over an attribute of self, False otherwise.
+    """
+    if is_self_attribute(node):
+        return True
+    if isinstance(node, ast.Call) and isinstance(node.func, ast.Attribute) and node.func.attr in ("values", "items"):
+        return is_self_attribute(node.func.value)
+    if isinstance(node, ast.Call) and isinstance(node.func, ast.Name) and node.func.id in ("list", "enumerate"):
+        return bool(node.args) and is_instance_collection(node.args[0])
+    return False
+
+
+def get_loop_iterators(node: ast.AST) -> list[ast.AST]:
+    """
+    Returns the iterated expressions of a loop or a comprehension.
+
+    Args:
+        node (ast.AST): The node.
+
+    Returns:
+        list[ast.AST]: The iterated expressions (empty if the node is not a loop).
+    """
+    if isinstance(node, (ast.For, ast.AsyncFor)):
+        return [node.iter]
+    if isinstance(node, COMPREHENSIONS):
+        return [generator.iter for generator in node.generators]
+    return []
+
+
+# Rules
+def check_string_concatenation_in_loop(node: ast.AST, engine: "RuleEngine") -> bool:
+    """
+    Finds strings built by repeated += in a loop (quadratic copying instead of one join).
+    """
+    return (
+        engine.loop_depth > 0
+        and isinstance(node, ast.AugAssign)
+        and isinstance(node.op, ast.Add)
+        and (is_str_value(node.target, engine.str_names) or is_str_value(node.value, engine.str_names))
+    )
+
+
+def check_list_remove_in_loop(node: ast.AST, engine: "RuleEngine") -> bool:
+    """
+    Finds list.remove (a linear scan and shift of the list) called in a loop.
+    """
+    return (
+        engine.loop_depth > 0
+        and isinstance(node, ast.Call)
+        and isinstance(node.func, ast.Attribute)
+        and node.func.attr == "remove"
+        and is_list(node.func.value, engine)
+    )
+
+
+def check_list_membership_in_loop(node: ast.AST, engine: "RuleEngine") -> bool:
+    """
+    Finds membership tests (in / not in) of a list in a loop.
+    """
+    return (
+        engine.loop_depth > 0
+        and isinstance(node, ast.Compare)
+        and any(
+            isinstance(operator, (ast.In, ast.NotIn)) and is_list(comparator, engine)
+            for operator, comparator in zip(node.ops, node.comparators)
+        )
+    )
+
+
+def check_regex_per_call(node: ast.AST, engine: "RuleEngine") -> bool:
+    """
+    Finds regular expressions compiled (or looked up in the cache of the re module) on every call.
+    """
+    return (
+        isinstance(node, ast.Call)
+        and isinstance(node.func, ast.Attribute)
+        and isinstance(node.func.value, ast.Name)
+        and node.func.value.id == "re"
+        and node.func.attr in REGEX_FUNCTIONS
+    )
+
+
+def check_linear_scan(node: ast.AST, engine: "RuleEngine") -> bool:
+    """
+    Finds loops and comprehensions iterating over all tasks stored in the instance.
+    """
+    return any(is_instance_collection(iterator) for iterator in get_loop_iterators(node))
+
+
+def check_case_conversion_in_loop(node: ast.AST, engine: "RuleEngine") -> bool:
+    """
+    Finds case conversions (lower, upper, casefold) repeated for every scanned task.
+    """
+    return (
+        engine.loop_depth > 0
+        and isinstance(node, ast.Call)
+        and isinstance(node.func, ast.Attribute)
+        and node.func.attr in CASE_FUNCTIONS
+    )
+
+
+# RULES - the rules of the engine: the challenge, the scopes (patterns of qualified function names) and the check
+RULES = {
+    "string_concatenation_in_loop": {
+        "challenge": "ascii_art",
+        "scopes": ["*draw_*"],
+        "check": check_string_concatenation_in_loop,
+    },
+    "list_remove_in_loop": {
+        "challenge": "todo_list",
+        "scopes": ["TaskManager.*"],
+        "check": check_list_remove_in_loop,
+    },
+    "list_membership_in_loop": {
+        "challenge": "todo_list",
+        "scopes": ["TaskManager.*"],
+        "check": check_list_membership_in_loop,
+    },
+    "linear_scan_in_search": {
+        "challenge": "todo_list",
+        "scopes": ["TaskManager.search"],
+        "check": check_linear_scan,
+    },
+    "case_conversion_in_search_loop": {
+        "challenge": "todo_list",
+        "scopes": ["TaskManager.search"],
+        "check": check_case_conversion_in_loop,
+    },
+    "linear_scan_by_id": {
+        "challenge": "todo_list",
+        "scopes": ["TaskManager.remove", "TaskManager.finish"],
+        "check": check_linear_scan,
+    },
+    "regex_per_call_in_tokenize": {
+        "challenge": "calculator",
+        "scopes": ["*tokenize"],
+        "check": check_regex_per_call,
+    },
+}
+
+
+class RuleEngine(ast.NodeVisitor):
+    """
+    Walks the syntax tree of one module once and applies the rules in their scopes.
+    The engine tracks the qualified name of the current function, the depth of loops
+    and the local variables and attributes of the instance known to hold lists or strings.
+    """
+
+    def __init__(self, rules: dict):
+        self.rules = rules
+        self.counts = {name: 0 for name in rules}
+        self.lines = {name: [] for name in rules}
+        self.class_name = None
+        self.function_name = None
+        self.active_rules = []
+        self.loop_depth = 0
+        self.list_names = set()
+        self.str_names = set()
+        self.list_attributes = set()
+
+    def visit(self, node: ast.AST) -> None:
+        for name in self.active_rules:
+            if self.rules[name]["check"](node, self):
+                self.counts[name] += 1
+                self.lines[name].append(getattr(node, "lineno", 0))
+
+        super().visit(node)
+
+    def visit_ClassDef(self, node: ast.ClassDef) -> None:
+        outer = self.class_name, self.list_attributes
+        self.class_name = node.name
+        self.list_attributes = {
+            target.attr for target, value in get_assignments(node) if is_self_attribute(target) and is_list_value(value)
+        }
+        self.generic_visit(node)
+        self.class_name, self.list_attributes = outer
+
+    def visit_FunctionDef(self, node: ast.FunctionDef) -> None:
+        outer = self.function_name, self.active_rules, self.loop_depth, self.list_names, self.str_names
+        qualified_name = f"{self.class_name}.{node.name}" if self.class_name else node.name
+        self.function_name = qualified_name
+        self.active_rules = [
+            name for name, rule in self.rules.items() if any(fnmatch(qualified_name, scope) for scope in rule["scopes"])
+        ]
+        self.loop_depth = 0
+
+        assignments = [(target.id, value) for target, value in get_assignments(node) if isinstance(target, ast.Name)]
+        self.list_names = {name for name, value in assignments if is_list_value(value)}
+        self.str_names = set()
+        for name, value in assignments:
+            if is_str_value(value, self.str_names):
+                self.str_names.add(name)
+
+        self.generic_visit(node)
+        self.function_name, self.active_rules, self.loop_depth, self.list_names, self.str_names = outer
+
+    visit_AsyncFunctionDef = visit_FunctionDef
+
+    def visit_For(self, node: ast.For) -> None:
+        self.visit(node.target)
+        self.visit(node.iter)
+        self.loop_depth += 1
+        for statement in node.body + node.orelse:
+            self.visit(statement)
+        self.loop_depth -= 1
+
+    visit_AsyncFor = visit_For
+
+    def visit_While(self, node: ast.While) -> None:
+        self.loop_depth += 1
+        self.generic_visit(node)
+        self.loop_depth -= 1
+
+    def visit_comprehension_node(self, node: ast.AST) -> None:
+        self.loop_depth += 1
+        self.generic_visit(node)
+        self.loop_depth -= 1
+
+    visit_ListComp = visit_SetComp = visit_DictComp = visit_GeneratorExp = visit_comprehension_node
+
+
+def get_times(challenge: str) -> tuple[list[str], dict]:
+    """
+    Reads the measured times of all modules from results.csv.
+
+    Args:
+        challenge (str): The name of the challenge.
+
+    Returns:
+        tuple[list[str], dict]: The names of the time columns and the times keyed by (prompt_type, iteration, model).
+    """
+    file_path = f"{RESULTS_DIR}/{challenge}/results.csv"
+    if not os.path.exists(file_path):
+        return [], {}
+
+    with open(file_path, "r", encoding="utf-8") as file:
+        rows = list(csv.DictReader(file))
+
+    columns = [column for column in (rows[0] if rows else {}) if column.startswith(TIME_COLUMNS_PREFIX)]
+    models = {details["model"]: model for model, details in MODEL_DETAILS.items()}
+    times = {}
+    for row in rows:
+        model = models.get(row["model"])
+        times[(row["prompt_type"], int(row["iteration"]), model)] = {
+            column: float(row[column]) for column in columns if row[column] != ""
+        }
+    return columns, times
+
+
+def get_correlations(rules: list[str], records: dict, columns: list[str], times: dict) -> list[dict]:
+    """
+    Correlates the counts of each rule with each measured time.
+
+    Args:
+        rules (list[str]): The names of the rules.
+        records (dict): The counts of the rules keyed by (prompt_type, iteration, model).
+        columns (list[str]): The names of the time columns.
+        times (dict): The measured times keyed by (prompt_type, iteration, model).
+
+    Returns:
+        list[dict]: One record per rule and time column.
+    """
+    correlations = []
+    for rule in rules:
+        for column in columns:
+            pairs = [
+                (counts[rule], times[key][column])
+                for key, counts in records.items()
+                if column in times.get(key, {})
+            ]
+            if not pairs:
+                continue
+
+            with_pattern = [measured for count, measured in pairs if count > 0]
+            without_pattern = [measured for count, measured in pairs if count == 0]
+            spearman = get_spearman([count for count, _ in pairs], [measured for _, measured in pairs])
+            correlations.append(
+                {
+                    "rule": rule,
+                    "operation": column[len(TIME_COLUMNS_PREFIX) :],
+                    "modules": len(pairs),
+                    "modules_with_pattern": len(with_pattern),
+                    "median_time_with_pattern": statistics.median(with_pattern) if with_pattern else "",
+                    "median_time_without_pattern": statistics.median(without_pattern) if without_pattern else "",
+                    "spearman": "" if spearman is None else round(spearman, 4),
+                }
+            )
+    return correlations
+
+
+def write_cell_file(prompt_type: str, iteration: int, model: str, challenge: str, counts: dict | None) -> None:
+    """
+    Writes the anti-pattern counts of one module into its iteration directory (read by the convertor).
+
+    Args:
+        prompt_type (str): The type of the prompt.
+        iteration (int): The iteration number.
+        model (str): The name of the model.
+        challenge (str): The name of the challenge.
+        counts (dict | None): The counts of the rules or None if the module cannot be parsed.
+
+    Returns:
+        None
+    """
+    file_name = ANTIPATTERNS_FILE.replace("{model}", model)
+    with open(f"{RESULTS_DIR}/{challenge}/{prompt_type}/iteration_{iteration}/{file_name}", "w") as file:
+        file.write(f"Testing module: {model}\n")
+        if counts is None:
+            file.write("The module cannot be parsed.\n")
+            return
+
+        for rule, count in counts.items():
+            file.write(f"Number of {rule}: {count}\n")
+
+
+def main() -> None:
+    for challenge in CHALLENGES:
+        rules = {name: rule for name, rule in RULES.items() if rule["challenge"] == challenge}
+
+        start = time.perf_counter()
+        records, lines = {}, {}
+        for prompt_type, iteration, model, path in get_implementations(
+            GENERATED_DIR, challenge, PROMPTS, ITERATIONS, MODELS
+        ):
+            tree = parse_module(path)
+            if tree is None:
+                write_cell_file(prompt_type, iteration, model, challenge, None)
+                continue
+
+            engine = RuleEngine(rules)
+            engine.visit(tree)
+            records[(prompt_type, iteration, model)] = engine.counts
+            lines[(prompt_type, iteration, model)] = engine.lines
+            write_cell_file(prompt_type, iteration, model, challenge, engine.counts)
+        elapsed = time.perf_counter() - start
+
+        with open(f"{RESULTS_DIR}/{challenge}/{ANTIPATTERN_COUNTS_FILE}", "w", encoding="utf-8", newline="") as file:
+            writer = csv.writer(file)
+            writer.writerow(["prompt_type", "iteration", "model", *rules, *[f"{rule}-lines" for rule in rules]])
+            for (prompt_type, iteration, model), counts in records.items():
+                found = lines[(prompt_type, iteration, model)]
+                writer.writerow(
+                    [
+                        prompt_type,
+                        iteration,
+                        model,
+                        *counts.values(),
+                        *[" ".join(map(str, found[rule])) for rule in rules],
+                    ]
+                )
+
+        columns, times = get_times(challenge)
+        correlations = get_correlations(list(rules), records, columns, times)
+        if correlations:
+            with open(f"{RESULTS_DIR}/{challenge}/{CORRELATIONS_FILE}", "w", encoding="utf-8", newline="") as file:
+                writer = csv.writer(file)
+                writer.writerow(correlations[0].keys())
+                for correlation in correlations:
+                    writer.writerow(correlation.values())
+
+        print(f"{challenge}: {len(records)} modules checked in {elapsed:.3f}s")
+        for rule in rules:
+            affected = sum(1 for counts in records.values() if counts[rule])
+            total = sum(counts[rule] for counts in records.values())
+            print(f"  {rule}: {total} occurrences in {affected} modules")
+            for correlation in correlations:
+                if correlation["rule"] == rule and correlation["spearman"] != "":
+                    print(f"    {correlation['operation']}: Spearman {correlation['spearman']:+.2f}")
+
+
+if __name__ == "__main__":
+    main()
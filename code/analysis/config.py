@@ -0,0 +1,69 @@
+# Constants for the analysis module
+
+# RESULTS_DIR - the directory where the results are stored
+RESULTS_DIR = "results"
+
+# GENERATED_DIR - the directory with the generated code
+GENERATED_DIR = "generated/code"
+
+# CHALLENGES - list of challenges used in scraper
+CHALLENGES = ["calculator", "todo_list", "ascii_art"]
+
+# PROMPTS - list of prompts used in scraper
+PROMPTS = [
+    "1-zero_shot",
+    "2-few_shot",
+    "3-chain_of_thoughts-zero_shot",
+    "4-chain_of_thoughts-few_shot",
+    "5-role-zero_shot",
+    "6-role-few_shot",
+]
+
+# MODELS - list of models used in scraper
+MODELS = ["chatgpt", "claude", "gemini"]
+
+# MODEL_DETAILS - dictionary with model details (the same as in the results csv)
+MODEL_DETAILS = {
+    "chatgpt": {"provider": "OpenAI", "model": "o3-mini-high"},
+    "claude": {"provider": "Anthropic", "model": "Claude 3.7 Sonnet"},
+    "gemini": {"provider": "Google", "model": "Gemini 2.0 Pro Experimental"},
+}
+
+# ITERATIONS - number of iterations used in scraper
+ITERATIONS = 10
+
+# SHINGLE_SIZE - number of consecutive tokens of the normalized AST forming one shingle
+SHINGLE_SIZE = 8
+
+# NUM_PERMUTATIONS - number of hash functions of the MinHash signature (must be equal to BANDS * ROWS)
+NUM_PERMUTATIONS = 128
+
+# BANDS - number of bands of the locality-sensitive hashing
+BANDS = 16
+
+# ROWS - number of signature rows in one band (modules sharing one whole band become candidates)
+ROWS = 8
+
+# SIMILARITY_THRESHOLD - minimal estimated Jaccard similarity of two modules to be considered near-duplicates
+SIMILARITY_THRESHOLD = 0.8
+
+# SEED - seed of the MinHash hash functions
+SEED = 42
+
+# DUPLICATES_FILE - the name of the per-module text file with the cluster (stored in each iteration directory)
+DUPLICATES_FILE = "duplicates-{model}.txt"
+
+# CLUSTERS_FILE - the name of the table with the clusters of all modules (stored in results/{challenge}/)
+CLUSTERS_FILE = "duplicate_clusters.csv"
+
+# ANTIPATTERNS_FILE - the name of the per-module text file with the anti-pattern counts (stored in each iteration directory)
+ANTIPATTERNS_FILE = "antipatterns-{model}.txt"
+
+# ANTIPATTERN_COUNTS_FILE - the name of the table with the anti-pattern counts of all modules (stored in results/{challenge}/)
+ANTIPATTERN_COUNTS_FILE = "antipatterns.csv"
+
+# CORRELATIONS_FILE - the name of the table with the correlations of the counts and the measured times (stored in results/{challenge}/)
+CORRELATIONS_FILE = "antipattern_correlations.csv"
+
+# TIME_COLUMNS_PREFIX - prefix of the columns of results.csv correlated with the anti-pattern counts
+TIME_COLUMNS_PREFIX = "time_behaviour-"
@@ -0,0 +1,252 @@
+"""
+This script builds a structural near-duplicate index of the generated code.
+The syntax tree of every module is normalized (docstrings removed, identifiers and constants replaced
+by placeholders), split into shingles of consecutive tokens and summarized by a MinHash signature.
+Locality-sensitive hashing of the signatures finds the candidate pairs, the pairs with the estimated
+Jaccard similarity above the threshold are merged into clusters. Every module gets the id of its cluster,
+so the analyses of the results can count each group of near-duplicates only once.
+Running: python code/analysis/duplicates.py (from the root of the repository)
+Output: results/{challenge}/duplicate_clusters.csv, results/{challenge}/{prompt}/iteration_{i}/duplicates-{model}.txt
+"""
+
+import csv
+import hashlib
+import time
+import zlib
+from collections import defaultdict
+
+import numpy as np
+
+from config import (
+    BANDS,
+    CHALLENGES,
+    CLUSTERS_FILE,
+    DUPLICATES_FILE,
+    GENERATED_DIR,
+    ITERATIONS,
+    MODELS,
+    NUM_PERMUTATIONS,
+    PROMPTS,
+    RESULTS_DIR,
+    ROWS,
+    SEED,
+    SHINGLE_SIZE,
+    SIMILARITY_THRESHOLD,
+)
+from helpers import get_implementations, get_tokens, normalize, parse_module
+
+TOKEN_IDS = {}
+
+
+# Helper functions
+def get_token_id(token: str) -> int:
+    """
+    Returns a stable 32-bit id of the token.
+
+    Args:
+        token (str): The token of the normalized syntax tree.
+
+    Returns:
+        int: The id of the token.
+    """
+    if token not in TOKEN_IDS:
+        TOKEN_IDS[token] = zlib.crc32(token.encode("utf-8"))
+    return TOKEN_IDS[token]
+
+
+def get_shingles(tokens: list[str]) -> np.ndarray:
+    """
+    Hashes all windows of SHINGLE_SIZE consecutive tokens.
+
+    Args:
+        tokens (list[str]): The tokens of the normalized syntax tree.
+
+    Returns:
+        np.ndarray: The unique 64-bit hashes of the shingles.
+    """
+    ids = np.fromiter((get_token_id(token) for token in tokens), dtype=np.uint64, count=len(tokens))
+    if len(ids) < SHINGLE_SIZE:
+        ids = np.pad(ids, (0, SHINGLE_SIZE - len(ids)))
+
+    shingles = np.zeros(len(ids) - SHINGLE_SIZE + 1, dtype=np.uint64)
+    for offset in range(SHINGLE_SIZE):
+        shingles = shingles * np.uint64(0x100000001B3) + ids[offset : len(shingles) + offset]
+
+    return np.unique(shingles)
+
+
+def get_hash_functions() -> tuple[np.ndarray, np.ndarray]:
+    """
+    Returns the coefficients of the multiply-shift hash functions of the MinHash signature.
+
+    Returns:
+        tuple[np.ndarray, np.ndarray]: The odd multipliers and the increments (one per permutation).
+    """
+    generator = np.random.default_rng(SEED)
+    multipliers = generator.integers(0, 2**64 - 1, size=NUM_PERMUTATIONS, dtype=np.uint64, endpoint=True)
+    increments = generator.integers(0, 2**64 - 1, size=NUM_PERMUTATIONS, dtype=np.uint64, endpoint=True)
+    return multipliers | np.uint64(1), increments
+
+
+def get_signature(shingles: np.ndarray, hash_functions: tuple[np.ndarray, np.ndarray]) -> np.ndarray:
+    """
+    Computes the MinHash signature of the set of shingles.
+
+    Args:
+        shingles (np.ndarray): The hashes of the shingles.
+        hash_functions (tuple[np.ndarray, np.ndarray]): The coefficients of the hash functions.
+
+    Returns:
+        np.ndarray: The minimum of every hash function over the shingles.
+    """
+    multipliers, increments = hash_functions
+    hashes = (multipliers[:, None] * shingles[None, :] + increments[:, None]) >> np.uint64(32)
+    return hashes.min(axis=1)
+
+
+def get_candidates(signatures: np.ndarray) -> set[tuple]:
+    """
+    Finds the pairs of modules which share at least one whole band of the signature.
+
+    Args:
+        signatures (np.ndarray): The signatures of the modules (one row per module).
+
+    Returns:
+        set[tuple]: The pairs of indexes of the candidate modules.
+    """
+    candidates = set()
+    for band in range(BANDS):
+        buckets = defaultdict(list)
+        for index, signature in enumerate(signatures):
+            buckets[signature[band * ROWS : (band + 1) * ROWS].tobytes()].append(index)
+
+        for members in buckets.values():
+            for position, first in enumerate(members):
+                for second in members[position + 1 :]:
+                    candidates.add((first, second))
+
+    return candidates
+
+
+def get_clusters(count: int, pairs: list[tuple]) -> list[int]:
+    """
+    Merges the near-duplicate pairs into clusters (union-find).
+    The clusters are numbered from 1 in the order of their first module.
+
+    Args:
+        count (int): The number of modules.
+        pairs (list[tuple]): The pairs of indexes of the near-duplicate modules.
+
+    Returns:
+        list[int]: The id of the cluster of each module.
+    """
+    parents = list(range(count))
+
+    def find(index: int) -> int:
+        while parents[index] != index:
+            parents[index] = parents[parents[index]]
+            index = parents[index]
+        return index
+
+    for first, second in pairs:
+        first, second = find(first), find(second)
+        if first != second:
+            parents[max(first, second)] = min(first, second)
+
+    ids = {}
+    return [ids.setdefault(find(index), len(ids) + 1) for index in range(count)]
+
+
+def write_cell_file(prompt_type: str, iteration: int, model: str, challenge: str, record: dict) -> None:
+    """
+    Writes the cluster of one module into its iteration directory (read by the convertor).
+
+    Args:
+        prompt_type (str): The type of the prompt.
+        iteration (int): The iteration number.
+        model (str): The name of the model.
+        challenge (str): The name of the challenge.
+        record (dict): The record of the module.
+
+    Returns:
+        None
+    """
+    file_name = DUPLICATES_FILE.replace("{model}", model)
+    with open(f"{RESULTS_DIR}/{challenge}/{prompt_type}/iteration_{iteration}/{file_name}", "w") as file:
+        file.write(f"Testing module: {model}\n")
+        if record["cluster"] == "":
+            file.write("The module cannot be parsed.\n")
+            return
+
+        file.write(f"Duplicate cluster: {record['cluster']}\n")
+        file.write(f"Cluster size: {record['cluster_size']}\n")
+        file.write(f"Nearest similarity: {record['nearest_similarity']:.4f}\n")
+
+
+def main() -> None:
+    hash_functions = get_hash_functions()
+
+    for challenge in CHALLENGES:
+        implementations = get_implementations(GENERATED_DIR, challenge, PROMPTS, ITERATIONS, MODELS)
+
+        start = time.perf_counter()
+        modules, fingerprints, signatures = [], [], []
+        for implementation in implementations:
+            tree = parse_module(implementation[3])
+            if tree is None:
+                continue
+
+            tokens = get_tokens(normalize(tree))
+            modules.append(implementation)
+            fingerprints.append(hashlib.sha256("\0".join(tokens).encode("utf-8")).hexdigest()[:16])
+            signatures.append(get_signature(get_shingles(tokens), hash_functions))
+        signatures = np.array(signatures)
+        indexed = time.perf_counter()
+
+        candidates = get_candidates(signatures)
+        similarities = {pair: float(np.mean(signatures[pair[0]] == signatures[pair[1]])) for pair in candidates}
+        pairs = [pair for pair, similarity in similarities.items() if similarity >= SIMILARITY_THRESHOLD]
+        clusters = get_clusters(len(modules), pairs)
+        clustered = time.perf_counter()
+
+        nearest = defaultdict(float)
+        for (first, second), similarity in similarities.items():
+            nearest[first] = max(nearest[first], similarity)
+            nearest[second] = max(nearest[second], similarity)
+        sizes = defaultdict(int)
+        for cluster in clusters:
+            sizes[cluster] += 1
+
+        records = {}
+        for index, (prompt_type, iteration, model, _) in enumerate(modules):
+            records[(prompt_type, iteration, model)] = {
+                "cluster": clusters[index],
+                "cluster_size": sizes[clusters[index]],
+                "nearest_similarity": nearest[index],
+                "fingerprint": fingerprints[index],
+            }
+
+        with open(f"{RESULTS_DIR}/{challenge}/{CLUSTERS_FILE}", "w", encoding="utf-8", newline="") as file:
+            writer = csv.writer(file)
+            writer.writerow(["prompt_type", "iteration", "model", "cluster", "cluster_size", "nearest_similarity", "fingerprint"])
+            for prompt_type, iteration, model, _ in implementations:
+                record = records.get(
+                    (prompt_type, iteration, model),
+                    {"cluster": "", "cluster_size": "", "nearest_similarity": "", "fingerprint": ""},
+                )
+                writer.writerow([prompt_type, iteration, model, *record.values()])
+                write_cell_file(prompt_type, iteration, model, challenge, record)
+
+        duplicated = [cluster for cluster, size in sizes.items() if size > 1]
+        print(
+            f"{challenge}: {len(modules)} modules, {len(set(fingerprints))} structurally unique, "
+            f"{len(duplicated)} near-duplicate clusters covering {sum(sizes[c] for c in duplicated)} modules"
+        )
+        print(
+            f"  indexing: {indexed - start:.3f}s, LSH and clustering: {clustered - indexed:.3f}s "
+            f"({len(candidates)} candidate pairs, {len(pairs)} near-duplicate pairs)"
+        )
+
+
+if __name__ == "__main__":
+    main()
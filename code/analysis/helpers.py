@@ -0,0 +1,196 @@
+"""
+This module contains helper functions used by the static analyses of the generated code.
+"""
+
+import ast
+import builtins
+
+BUILTIN_NAMES = frozenset(dir(builtins))
+
+
+def get_implementations(
+    generated_dir: str, challenge: str, prompts: list, iterations: int, models: list
+) -> list[tuple]:
+    """
+    Returns all generated implementations of the challenge.
+
+    Args:
+        generated_dir (str): The directory with the generated code.
+        challenge (str): The name of the challenge.
+        prompts (list): The names of the prompts.
+        iterations (int): The number of iterations.
+        models (list): The names of the models.
+
+    Returns:
+        list[tuple]: A list of (prompt_type, iteration, model, path) tuples.
+    """
+    return [
+        (prompt_type, iteration, model, f"{generated_dir}/{challenge}/{prompt_type}/iteration_{iteration}/{model}.py")
+        for prompt_type in prompts
+        for iteration in range(1, iterations + 1)
+        for model in models
+    ]
+
+
+def parse_module(path: str) -> ast.Module | None:
+    """
+    Parses the generated module.
+
+    Args:
+        path (str): The path to the Python file.
+
+    Returns:
+        ast.Module | None: The syntax tree of the module or None if the module cannot be parsed.
+    """
+    try:
+        with open(path, "r", encoding="utf-8") as file:
+            return ast.parse(file.read(), filename=path)
+    except (OSError, SyntaxError, ValueError):
+        return None
+
+
+class Normalizer(ast.NodeTransformer):
+    """
+    Normalizes a syntax tree, so structurally equal modules have equal trees:
+    docstrings are removed, identifiers are renamed to placeholders in the order of their first
+    occurrence (names of builtins are kept) and constants are replaced by the name of their type.
+    """
+
+    def __init__(self):
+        self.names = {}
+
+    def rename(self, name: str | None) -> str | None:
+        if name is None or name in BUILTIN_NAMES:
+            return name
+
+        return self.names.setdefault(name, f"v{len(self.names)}")
+
+    def remove_docstring(self, node: ast.AST) -> None:
+        body = node.body
+        if body and isinstance(body[0], ast.Expr) and isinstance(body[0].value, ast.Constant):
+            if isinstance(body[0].value.value, str):
+                node.body = body[1:] or [ast.Pass()]
+
+    def visit_Module(self, node: ast.Module) -> ast.AST:
+        self.remove_docstring(node)
+        return self.generic_visit(node)
+
+    def visit_ClassDef(self, node: ast.ClassDef) -> ast.AST:
+        self.remove_docstring(node)
+        node.name = self.rename(node.name)
+        return self.generic_visit(node)
+
+    def visit_FunctionDef(self, node: ast.FunctionDef) -> ast.AST:
+        self.remove_docstring(node)
+        node.name = self.rename(node.name)
+        return self.generic_visit(node)
+
+    visit_AsyncFunctionDef = visit_FunctionDef
+
+    def visit_Name(self, node: ast.Name) -> ast.AST:
+        node.id = self.rename(node.id)
+        return node
+
+    def visit_arg(self, node: ast.arg) -> ast.AST:
+        node.arg = self.rename(node.arg)
+        return self.generic_visit(node)
+
+    def visit_Attribute(self, node: ast.Attribute) -> ast.AST:
+        node.attr = self.rename(node.attr)
+        return self.generic_visit(node)
+
+    def visit_alias(self, node: ast.alias) -> ast.AST:
+        node.asname = self.rename(node.asname)
+        return node
+
+    def visit_Constant(self, node: ast.Constant) -> ast.AST:
+        node.value = type(node.value).__name__
+        return node
+
+
+def normalize(tree: ast.Module) -> ast.Module:
+    """
+    Returns the normalized syntax tree of the module (the given tree is modified in place).
+
+    Args:
+        tree (ast.Module): The syntax tree of the module.
+
+    Returns:
+        ast.Module: The normalized syntax tree.
+    """
+    return Normalizer().visit(tree)
+
+
+def get_tokens(tree: ast.AST) -> list[str]:
+    """
+    Serializes the syntax tree into a sequence of tokens in the pre-order of the nodes.
+    Each node contributes its type and the identifiers or constants it holds.
+
+    Args:
+        tree (ast.AST): The (normalized) syntax tree.
+
+    Returns:
+        list[str]: The tokens of the tree.
+    """
+    tokens = []
+
+    def visit(node: ast.AST) -> None:
+        tokens.append(type(node).__name__)
+        for field, value in ast.iter_fields(node):
+            if isinstance(value, list):
+                for item in value:
+                    if isinstance(item, ast.AST):
+                        visit(item)
+            elif isinstance(value, ast.AST):
+                visit(value)
+            elif isinstance(value, str) and field not in ("type_comment", "kind"):
+                tokens.append(value)
+        tokens.append(")")
+
+    visit(tree)
+    return tokens
+
+
+def get_ranks(values: list[float]) -> list[float]:
+    """
+    Returns the ranks of the values (tied values get the average of their ranks).
+
+    Args:
+        values (list[float]): The values to be ranked.
+
+    Returns:
+        list[float]: The rank of each value (starting from 1).
+    """
+    order = sorted(range(len(values)), key=lambda index: values[index])
+    ranks = [0.0] * len(values)
+    start = 0
+    while start < len(order):
+        end = start
+        while end + 1 < len(order) and values[order[end + 1]] == values[order[start]]:
+            end += 1
+        for position in range(start, end + 1):
+            ranks[order[position]] = (start + end) / 2 + 1
+        start = end + 1
+    return ranks
+
+
+def get_spearman(first: list[float], second: list[float]) -> float | None:
+    """
+    Computes the Spearman rank correlation coefficient of two samples.
+
+    Args:
+        first (list[float]): The first sample.
+        second (list[float]): The second sample (of the same length).
+
+    Returns:
+        float | None: The coefficient or None if one of the samples is constant.
+    """
+    first, second = get_ranks(first), get_ranks(second)
+    mean_first, mean_second = sum(first) / len(first), sum(second) / len(second)
+    covariance = sum((x - mean_first) * (y - mean_second) for x, y in zip(first, second))
+    variance_first = sum((x - mean_first) ** 2 for x in first)
+    variance_second = sum((y - mean_second) ** 2 for y in second)
+    if not variance_first or not variance_second:
+        return None
+
+    return covariance / (variance_first * variance_second) ** 0.5
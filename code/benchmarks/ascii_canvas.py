@@ -0,0 +1,245 @@
+"""
+This script compares the NumPy Canvas of the reference implementation with the string builders of the generated
+AsciiArt implementations at large sizes. For every size the five shapes are drawn alone (draw_{shape} versus
+placing the shape on a canvas of its bounding box and converting it to text) and composed into one scene
+(drawing the shapes and overlaying their rows on a list of strings versus placing them on one canvas).
+The scene composed from the rows of the reference drawings is compared with the text of the canvas.
+The implementations are measured one after another in a separate worker process.
+Running: python code/benchmarks/ascii_canvas.py (from the root of the repository)
+Output: results/ascii_art/canvas.csv
+"""
+
+import concurrent.futures
+import csv
+import os
+import signal
+import statistics
+import time
+
+from config import (
+    CANVAS_FILE,
+    CANVAS_REPEATS,
+    CANVAS_SIZES,
+    CANVAS_TIME_LIMIT,
+    GENERATED_DIR,
+    ITERATIONS,
+    MODELS,
+    PROMPTS,
+    REFERENCE_DIR,
+    RESULTS_DIR,
+)
+from helpers import get_implementation_name, get_implementations, get_reference, init_worker, load_module, on_timeout
+
+SHAPES = ["square", "rectangle", "parallelogram", "triangle", "pyramid"]
+
+
+# Helper functions
+def get_arguments(shape: str, size: int) -> tuple:
+    """
+    Returns the arguments of draw_{shape} for the shape of the given size.
+
+    Args:
+        shape (str): The name of the shape.
+        size (int): The size (every dimension of the shape).
+
+    Returns:
+        tuple: The dimensions followed by the symbol.
+    """
+    return (size, "#") if shape in ("square", "pyramid") else (size, size, "#")
+
+
+def get_scene(size: int) -> tuple[int, int, list[tuple]]:
+    """
+    Returns the scene of the given size: overlapping shapes on a canvas of 2 * size x 2 * size cells,
+    some of them clipped by its edges.
+
+    Args:
+        size (int): The size of the scene.
+
+    Returns:
+        tuple[int, int, list[tuple]]: The width, the height and the (shape, column, row, arguments) placements.
+    """
+    half = size // 2
+    placements = [
+        ("rectangle", 0, 0, (size, half, "#")),
+        ("square", size // 4, size // 4, (half, "*")),
+        ("parallelogram", size + size // 2, size // 8, (half, size, "=")),
+        ("triangle", half, size, (size, size + half, "+")),
+        ("pyramid", -size // 4, half, (size, "^")),
+    ]
+    return 2 * size, 2 * size, placements
+
+
+def compose_rows(width: int, height: int, placements: list[tuple], drawings: list[str]) -> str:
+    """
+    Composes the drawings by overlaying their rows on a list of strings (the symbols of every row of a drawing
+    follow its leading spaces, so every row replaces one slice of a row of the scene).
+
+    Args:
+        width (int): The width of the scene.
+        height (int): The height of the scene.
+        placements (list[tuple]): The (shape, column, row, arguments) placements.
+        drawings (list[str]): The drawings of the placed shapes.
+
+    Returns:
+        str: The scene.
+    """
+    rows = [" " * width] * height
+    for (_, column, row, _), drawing in zip(placements, drawings):
+        for index, line in enumerate(drawing.rstrip("\n").split("\n")):
+            y = row + index
+            if not 0 <= y < height:
+                continue
+            symbols = line.lstrip(" ")
+            x = column + len(line) - len(symbols)
+            start, end = max(x, 0), min(x + len(symbols), width)
+            if start < end:
+                rows[y] = rows[y][:start] + symbols[start - x : end - x] + rows[y][end:]
+    return "\n".join(rows)
+
+
+def get_median_time(function, *args) -> float:
+    """
+    Calls the function CANVAS_REPEATS times.
+
+    Args:
+        function (callable): The measured function.
+        *args: The arguments of the function.
+
+    Returns:
+        float: The median time of the calls in seconds.
+    """
+    times = []
+    for _ in range(CANVAS_REPEATS):
+        start = time.perf_counter()
+        function(*args)
+        times.append(time.perf_counter() - start)
+    return statistics.median(times)
+
+
+def measure_canvas(module, size: int) -> dict:
+    """
+    Measures the canvas of the reference implementation for the shapes and the scene of the given size.
+
+    Args:
+        module: The reference module (Canvas and AsciiArt).
+        size (int): The size of the shapes.
+
+    Returns:
+        dict: The median times by the shape (and "scene").
+    """
+
+    def draw_shape(shape):
+        arguments = get_arguments(shape, size)
+        lazy = module.AsciiArt().draw_lazy(shape, *arguments)
+        return str(module.Canvas(lazy.width, lazy.height).place(shape, 0, 0, *arguments))
+
+    def draw_scene():
+        width, height, placements = get_scene(size)
+        canvas = module.Canvas(width, height)
+        for shape, column, row, arguments in placements:
+            canvas.place(shape, column, row, *arguments)
+        return str(canvas)
+
+    times = {shape: get_median_time(draw_shape, shape) for shape in SHAPES}
+    times["scene"] = get_median_time(draw_scene)
+
+    width, height, placements = get_scene(size)
+    art = module.AsciiArt()
+    drawings = [getattr(art, f"draw_{shape}")(*arguments) for shape, _, _, arguments in placements]
+    if draw_scene() != compose_rows(width, height, placements, drawings):
+        raise AssertionError(f"The canvas scene of size {size} differs from the composed drawings.")
+    return times
+
+
+def measure_strings(implementation: tuple) -> dict:
+    """
+    Measures the string drawings of the implementation (a new instance for every call, so no cache is reused).
+
+    Args:
+        implementation (tuple): The (prompt_type, iteration, model, path) tuple.
+
+    Returns:
+        dict: The median times and the errors by (case, size) and the error which stopped the measurement.
+    """
+    prompt_type, iteration, model, path = implementation
+    module_name = get_implementation_name("ascii_art", prompt_type, iteration, model).replace("/", "-")
+    result = {"times": {}, "errors": {}, "error": ""}
+
+    signal.signal(signal.SIGALRM, on_timeout)
+    signal.alarm(CANVAS_TIME_LIMIT)
+    try:
+        art_class = load_module(path, module_name).AsciiArt
+
+        def draw_scene(size):
+            width, height, placements = get_scene(size)
+            art = art_class()
+            drawings = [getattr(art, f"draw_{shape}")(*arguments) for shape, _, _, arguments in placements]
+            return compose_rows(width, height, placements, drawings)
+
+        def draw_shape(shape, size):
+            return getattr(art_class(), f"draw_{shape}")(*get_arguments(shape, size))
+
+        for size in CANVAS_SIZES:
+            for case in SHAPES + ["scene"]:
+                try:
+                    if case == "scene":
+                        result["times"][(case, size)] = get_median_time(draw_scene, size)
+                    else:
+                        result["times"][(case, size)] = get_median_time(draw_shape, case, size)
+                except TimeoutError:
+                    raise
+                except Exception as error:
+                    result["errors"][(case, size)] = f"{type(error).__name__}: {error}"[:100]
+    except Exception as error:
+        result["error"] = f"{type(error).__name__}: {error}"[:100]
+    finally:
+        signal.alarm(0)
+
+    return result
+
+
+def main() -> None:
+    implementations = get_implementations(GENERATED_DIR, "ascii_art", PROMPTS, ITERATIONS, MODELS)
+    implementations += get_reference(REFERENCE_DIR, "ascii_art")
+    reference = load_module(os.path.abspath(f"{REFERENCE_DIR}/ascii_art.py"), "ascii_art-canvas")
+    canvas = {size: measure_canvas(reference, size) for size in CANVAS_SIZES}
+
+    # one implementation at a time, so the timings are not affected by other measurements
+    with concurrent.futures.ProcessPoolExecutor(1, initializer=init_worker) as executor:
+        results = list(executor.map(measure_strings, implementations))
+
+    cases = SHAPES + ["scene"]
+    with open(f"{RESULTS_DIR}/ascii_art/{CANVAS_FILE}", "w", encoding="utf-8", newline="") as file:
+        writer = csv.writer(file)
+        writer.writerow(
+            ["prompt_type", "iteration", "model", "case", "size", "seconds", "canvas_seconds", "speedup", "error"]
+        )
+        for (prompt_type, iteration, model, _), result in zip(implementations, results):
+            for size in CANVAS_SIZES:
+                for case in cases:
+                    seconds = result["times"].get((case, size), "")
+                    canvas_seconds = canvas[size][case]
+                    writer.writerow(
+                        [prompt_type, iteration, model, case, size,
+                         round(seconds, 6) if seconds != "" else "", round(canvas_seconds, 6),
+                         round(seconds / canvas_seconds, 2) if seconds != "" else "",
+                         result["errors"].get((case, size), result["error"])]
+                    )
+
+    for size in CANVAS_SIZES:
+        for case in cases:
+            speedups = [
+                result["times"][(case, size)] / canvas[size][case]
+                for result in results
+                if (case, size) in result["times"]
+            ]
+            median = f"{statistics.median(speedups):.2f}x" if speedups else "-"
+            print(
+                f"{case} {size}: canvas {canvas[size][case] * 1000:.1f} ms, "
+                f"median speedup over {len(speedups)} string builders {median}"
+            )
+
+
+if __name__ == "__main__":
+    main()
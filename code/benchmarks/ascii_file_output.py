@@ -0,0 +1,168 @@
+"""
+This script measures the time and the peak memory of writing large drawings (OUTPUT_ROWS rows of the width
+OUTPUT_WIDTH) to a file: building the drawing by draw_{shape} of every generated AsciiArt implementation
+(and the reference implementation) and writing the string, against render_to_file of the reference
+implementation, which fills a memory mapping of the file row by row.
+Every drawing is written in a new worker process, so the peak resident memory (ru_maxrss) belongs to one drawing;
+the reported memory is the growth of the peak over the process after the import of the implementation.
+The file written by render_to_file is compared with the drawing of the reference implementation.
+Running: python code/benchmarks/ascii_file_output.py (from the root of the repository)
+Output: results/ascii_art/file_output.csv
+"""
+
+import concurrent.futures
+import csv
+import os
+import resource
+import signal
+import statistics
+import sys
+import tempfile
+import time
+
+from config import (
+    GENERATED_DIR,
+    ITERATIONS,
+    MODELS,
+    OUTPUT_FILE,
+    OUTPUT_ROWS,
+    OUTPUT_SHAPES,
+    OUTPUT_TIME_LIMIT,
+    OUTPUT_WIDTH,
+    PROMPTS,
+    REFERENCE_DIR,
+    RESULTS_DIR,
+)
+from helpers import get_implementation_name, get_implementations, get_reference, init_worker, load_module, on_timeout
+
+
+# Helper functions
+def get_peak_memory() -> int:
+    """
+    Returns the peak resident memory of the process.
+
+    Returns:
+        int: The peak resident memory in bytes.
+    """
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # ru_maxrss is in kilobytes on Linux and in bytes on macOS
+    return peak if sys.platform == "darwin" else peak * 1024
+
+
+def measure_output(implementation: tuple, mode: str, shape: str, rows: int) -> dict:
+    """
+    Writes one drawing to a file by the implementation (run in a new worker process).
+
+    Args:
+        implementation (tuple): The (prompt_type, iteration, model, path) tuple.
+        mode (str): "draw_and_write" (draw_{shape} and writing the string) or "render_to_file".
+        shape (str): The name of the shape.
+        rows (int): The number of rows.
+
+    Returns:
+        dict: The time in seconds, the growth of the peak memory in bytes, the size of the file and the error.
+    """
+    prompt_type, iteration, model, path = implementation
+    module_name = get_implementation_name("ascii_art", prompt_type, iteration, model).replace("/", "-")
+    result = {"seconds": "", "memory": "", "size": "", "error": ""}
+
+    signal.signal(signal.SIGALRM, on_timeout)
+    signal.alarm(OUTPUT_TIME_LIMIT)
+    try:
+        art = load_module(path, module_name).AsciiArt()
+        baseline = get_peak_memory()
+        start = time.perf_counter()
+        if mode == "render_to_file":
+            art.render_to_file("drawing.txt", shape, OUTPUT_WIDTH, rows, "#")
+        else:
+            drawing = getattr(art, f"draw_{shape}")(OUTPUT_WIDTH, rows, "#")
+            with open("drawing.txt", "w", encoding="utf-8") as file:
+                file.write(drawing)
+            del drawing
+        result["seconds"] = time.perf_counter() - start
+        result["memory"] = get_peak_memory() - baseline
+        result["size"] = os.path.getsize("drawing.txt")
+    except Exception as error:
+        result["error"] = f"{type(error).__name__}: {error}"[:100]
+    finally:
+        signal.alarm(0)
+        if os.path.exists("drawing.txt"):
+            os.remove("drawing.txt")
+
+    return result
+
+
+def check_reference(path: str) -> None:
+    """
+    Compares the files written by render_to_file with the drawings of the reference implementation
+    (the smallest number of rows).
+
+    Args:
+        path (str): The path of the reference implementation.
+
+    Returns:
+        None
+
+    Raises:
+        AssertionError: If a written file differs from the drawing.
+    """
+    art = load_module(path, "ascii_art-file-output").AsciiArt()
+    with tempfile.TemporaryDirectory(prefix="benchmarks_") as directory:
+        output = os.path.join(directory, "drawing.txt")
+        for shape in OUTPUT_SHAPES:
+            art.render_to_file(output, shape, OUTPUT_WIDTH, OUTPUT_ROWS[0], "#")
+            with open(output, "rb") as file:
+                if file.read() != getattr(art, f"draw_{shape}")(OUTPUT_WIDTH, OUTPUT_ROWS[0], "#").encode("utf-8"):
+                    raise AssertionError(f"The {shape} written by render_to_file differs from the drawing.")
+
+
+def main() -> None:
+    implementations = get_implementations(GENERATED_DIR, "ascii_art", PROMPTS, ITERATIONS, MODELS)
+    reference = get_reference(REFERENCE_DIR, "ascii_art")
+    check_reference(reference[0][3])
+
+    cases = [
+        (implementation, mode, shape, rows)
+        for implementation, mode in [(item, "draw_and_write") for item in implementations + reference]
+        + [(item, "render_to_file") for item in reference]
+        for shape in OUTPUT_SHAPES
+        for rows in OUTPUT_ROWS
+    ]
+    results = []
+    for case in cases:
+        # a new process for every drawing, the peak memory of the process belongs to the drawing
+        with concurrent.futures.ProcessPoolExecutor(1, initializer=init_worker) as executor:
+            try:
+                results.append(executor.submit(measure_output, *case).result())
+            except concurrent.futures.process.BrokenProcessPool:
+                results.append({"seconds": "", "memory": "", "size": "", "error": "crashed"})
+
+    with open(f"{RESULTS_DIR}/ascii_art/{OUTPUT_FILE}", "w", encoding="utf-8", newline="") as file:
+        writer = csv.writer(file)
+        writer.writerow(
+            ["prompt_type", "iteration", "model", "mode", "shape", "rows", "bytes", "seconds", "peak_memory_mb",
+             "error"]
+        )
+        for ((prompt_type, iteration, model, _), mode, shape, rows), result in zip(cases, results):
+            writer.writerow(
+                [prompt_type, iteration, model, mode, shape, rows, result["size"],
+                 round(result["seconds"], 4) if result["seconds"] != "" else "",
+                 round(result["memory"] / 2**20, 1) if result["memory"] != "" else "", result["error"]]
+            )
+
+    for mode in ["draw_and_write", "render_to_file"]:
+        for shape in OUTPUT_SHAPES:
+            for rows in OUTPUT_ROWS:
+                measured = [
+                    result
+                    for (_, case_mode, case_shape, case_rows), result in zip(cases, results)
+                    if (case_mode, case_shape, case_rows) == (mode, shape, rows) and result["seconds"] != ""
+                ]
+                if measured:
+                    seconds = statistics.median(result["seconds"] for result in measured)
+                    memory = statistics.median(result["memory"] for result in measured) / 2**20
+                    print(f"{mode} {shape} {rows} rows: median {seconds:.3f} s, {memory:.1f} MB ({len(measured)})")
+
+
+if __name__ == "__main__":
+    main()
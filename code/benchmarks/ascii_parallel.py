@@ -0,0 +1,177 @@
+"""
+This script measures writing very large drawings (PARALLEL_ROWS rows of the width PARALLEL_WIDTH) to a file:
+the reference render_parallel (bands of rows written into a memory mapping of the file by PARALLEL_WORKERS
+worker processes) against building the drawing by draw_{shape} of the generated AsciiArt implementations
+and writing the string to the file. Only the shapes whose size grows linearly with the rows are used
+(a parallelogram or a pyramid of 200,000 rows has billions of characters).
+The files written by render_parallel are compared with the drawings of the reference implementation.
+The implementations are measured one after another in a separate worker process.
+Running: python code/benchmarks/ascii_parallel.py (from the root of the repository)
+Output: results/ascii_art/parallel.csv
+"""
+
+import concurrent.futures
+import csv
+import os
+import signal
+import statistics
+import tempfile
+import time
+
+from config import (
+    GENERATED_DIR,
+    ITERATIONS,
+    MODELS,
+    PARALLEL_FILE,
+    PARALLEL_REPEATS,
+    PARALLEL_ROWS,
+    PARALLEL_SHAPES,
+    PARALLEL_TIME_LIMIT,
+    PARALLEL_WIDTH,
+    PARALLEL_WORKERS,
+    PROMPTS,
+    REFERENCE_DIR,
+    RESULTS_DIR,
+)
+from helpers import get_implementation_name, get_implementations, get_reference, init_worker, load_module, on_timeout
+
+
+# Helper functions
+def get_median_time(function, *args) -> float:
+    """
+    Calls the function PARALLEL_REPEATS times.
+
+    Args:
+        function (callable): The measured function.
+        *args: The arguments of the function.
+
+    Returns:
+        float: The median time of the calls in seconds.
+    """
+    times = []
+    for _ in range(PARALLEL_REPEATS):
+        start = time.perf_counter()
+        function(*args)
+        times.append(time.perf_counter() - start)
+    return statistics.median(times)
+
+
+def measure_parallel(module, directory: str) -> dict:
+    """
+    Measures render_parallel of the reference implementation with every number of workers.
+
+    Args:
+        module: The reference module.
+        directory (str): The directory for the written files.
+
+    Returns:
+        dict: The median times by (shape, rows, workers).
+
+    Raises:
+        AssertionError: If a written file differs from the drawing of the reference implementation.
+    """
+    art = module.AsciiArt()
+    path = os.path.join(directory, "parallel.txt")
+    times = {}
+    for shape in PARALLEL_SHAPES:
+        for rows in PARALLEL_ROWS:
+            for workers in PARALLEL_WORKERS:
+                times[(shape, rows, workers)] = get_median_time(
+                    lambda: art.render_parallel(path, shape, PARALLEL_WIDTH, rows, "#", workers=workers)
+                )
+                with open(path, "rb") as file:
+                    if file.read() != getattr(art, f"draw_{shape}")(PARALLEL_WIDTH, rows, "#").encode("utf-8"):
+                        raise AssertionError(f"The {shape} of {rows} rows written by {workers} workers differs.")
+    os.remove(path)
+    return times
+
+
+def measure_strings(implementation: tuple) -> dict:
+    """
+    Measures building the drawings by the implementation and writing them to a file
+    (a new instance for every call, so no cache is reused).
+
+    Args:
+        implementation (tuple): The (prompt_type, iteration, model, path) tuple.
+
+    Returns:
+        dict: The median times and the errors by (shape, rows) and the error which stopped the measurement.
+    """
+    prompt_type, iteration, model, path = implementation
+    module_name = get_implementation_name("ascii_art", prompt_type, iteration, model).replace("/", "-")
+    result = {"times": {}, "errors": {}, "error": ""}
+
+    def draw_and_write(shape, rows):
+        drawing = getattr(art_class(), f"draw_{shape}")(PARALLEL_WIDTH, rows, "#")
+        try:
+            with open("drawing.txt", "w", encoding="utf-8") as file:
+                file.write(drawing)
+        finally:
+            if os.path.exists("drawing.txt"):
+                os.remove("drawing.txt")
+
+    signal.signal(signal.SIGALRM, on_timeout)
+    signal.alarm(PARALLEL_TIME_LIMIT)
+    try:
+        art_class = load_module(path, module_name).AsciiArt
+        for shape in PARALLEL_SHAPES:
+            for rows in PARALLEL_ROWS:
+                try:
+                    result["times"][(shape, rows)] = get_median_time(draw_and_write, shape, rows)
+                except TimeoutError:
+                    raise
+                except Exception as error:
+                    result["errors"][(shape, rows)] = f"{type(error).__name__}: {error}"[:100]
+    except Exception as error:
+        result["error"] = f"{type(error).__name__}: {error}"[:100]
+    finally:
+        signal.alarm(0)
+
+    return result
+
+
+def main() -> None:
+    implementations = get_implementations(GENERATED_DIR, "ascii_art", PROMPTS, ITERATIONS, MODELS)
+    implementations += get_reference(REFERENCE_DIR, "ascii_art")
+    reference = load_module(os.path.abspath(f"{REFERENCE_DIR}/ascii_art.py"), "ascii_art-parallel")
+    with tempfile.TemporaryDirectory(prefix="benchmarks_") as directory:
+        parallel = measure_parallel(reference, directory)
+
+    # one implementation at a time, so the timings are not affected by other measurements
+    with concurrent.futures.ProcessPoolExecutor(1, initializer=init_worker) as executor:
+        results = list(executor.map(measure_strings, implementations))
+
+    with open(f"{RESULTS_DIR}/ascii_art/{PARALLEL_FILE}", "w", encoding="utf-8", newline="") as file:
+        writer = csv.writer(file)
+        writer.writerow(
+            ["prompt_type", "iteration", "model", "mode", "shape", "rows", "workers", "seconds", "speedup", "error"]
+        )
+        # the speedup of render_parallel over render_parallel with one worker or over draw and write
+        for (shape, rows, workers), seconds in parallel.items():
+            writer.writerow(
+                ["reference", "", "reference", "render_parallel", shape, rows, workers, round(seconds, 4),
+                 round(parallel[(shape, rows, 1)] / seconds, 2), ""]
+            )
+        for (prompt_type, iteration, model, _), result in zip(implementations, results):
+            for shape in PARALLEL_SHAPES:
+                for rows in PARALLEL_ROWS:
+                    seconds = result["times"].get((shape, rows), "")
+                    writer.writerow(
+                        [prompt_type, iteration, model, "draw_and_write", shape, rows, 1,
+                         round(seconds, 4) if seconds != "" else "",
+                         round(seconds / parallel[(shape, rows, 1)], 2) if seconds != "" else "",
+                         result["errors"].get((shape, rows), result["error"])]
+                    )
+
+    for shape in PARALLEL_SHAPES:
+        for rows in PARALLEL_ROWS:
+            scaling = ", ".join(
+                f"{workers} workers {parallel[(shape, rows, workers)]:.3f} s" for workers in PARALLEL_WORKERS
+            )
+            strings = [result["times"][(shape, rows)] for result in results if (shape, rows) in result["times"]]
+            median = f"{statistics.median(strings):.3f} s" if strings else "-"
+            print(f"{shape} {rows} rows: render_parallel {scaling}; median draw and write {median}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,172 @@
+"""
+This module contains the batch adapter of the Calculator implementations.
+calculate_many gives every Calculator class (generated or reference) the batch interface of the reference
+implementation: identical expressions are calculated once by one shared instance of the class (the state the
+instance keeps between calls, e.g. compiled tokenizers, is reused), large batches are split across a process pool
+and the errors are returned as structured results instead of being raised.
+Classes with their own calculate_many method (the reference implementation) are delegated to it.
+with_stack_fallback turns any Calculator class into a drop-in class which re-evaluates the expressions
+its recursive parser cannot handle (RecursionError on deep nesting) by the explicit-stack engine of the
+reference implementation.
+The worker processes of the pool load the class again from the file of its module (get_class_source and
+load_class), so the pool works with every start method although the generated modules are loaded under names
+which cannot be imported.
+"""
+
+import multiprocessing
+import os
+import sys
+
+from helpers import load_module
+
+# state of a worker process (set by init_batch_worker)
+CALCULATOR = None
+
+
+def get_result(calculator, expression) -> dict:
+    """
+    Calculates the value of the expression and catches any error raised by the implementation.
+
+    Args:
+        calculator: The Calculator instance.
+        expression: The arithmetic expression.
+
+    Returns:
+        dict: The value (None on error), the name of the exception and its message (None on success).
+    """
+    try:
+        return {"value": calculator.calculate(expression), "error": None, "message": None}
+    except Exception as error:
+        return {"value": None, "error": type(error).__name__, "message": str(error)[:200]}
+
+
+def with_stack_fallback(calculator_class: type, engine_class: type) -> type:
+    """
+    Creates a subclass of the Calculator class whose calculate falls back to the explicit-stack engine
+    (the reference Calculator) when the implementation raises RecursionError, other results are unchanged.
+
+    Args:
+        calculator_class (type): The Calculator class.
+        engine_class (type): The Calculator class of the reference implementation.
+
+    Returns:
+        type: The drop-in Calculator class.
+    """
+
+    class StackFallbackCalculator(calculator_class):
+        def calculate(self, expression):
+            try:
+                return super().calculate(expression)
+            except RecursionError:
+                return engine.calculate(expression)
+
+    engine = engine_class()
+    StackFallbackCalculator.__name__ = StackFallbackCalculator.__qualname__ = calculator_class.__name__
+    # the class is created at runtime, the workers build it again from the sources of both classes
+    StackFallbackCalculator.class_source = (*get_class_source(calculator_class)[:3], get_class_source(engine_class))
+    return StackFallbackCalculator
+
+
+def get_class_source(calculator_class: type) -> tuple:
+    """
+    Returns where a worker process loads the Calculator class from.
+
+    Args:
+        calculator_class (type): The Calculator class (or a class created by with_stack_fallback).
+
+    Returns:
+        tuple: The path of the module, the name of the module, the name of the class and the source
+            of the explicit-stack engine (None if the class does not fall back to it).
+    """
+    if "class_source" in vars(calculator_class):
+        return calculator_class.class_source
+    module = sys.modules[calculator_class.__module__]
+    return os.path.abspath(module.__file__), module.__name__, calculator_class.__qualname__, None
+
+
+def load_class(source: tuple) -> type:
+    """
+    Loads the Calculator class in a worker process (a forked worker reuses the module it inherited).
+
+    Args:
+        source (tuple): The source of the class in the format of get_class_source.
+
+    Returns:
+        type: The Calculator class.
+    """
+    path, module_name, class_name, engine_source = source
+    module = sys.modules.get(module_name) or load_module(path, module_name)
+    calculator_class = getattr(module, class_name)
+    if engine_source is not None:
+        return with_stack_fallback(calculator_class, load_class(engine_source))
+    return calculator_class
+
+
+def init_batch_worker(source: tuple) -> None:
+    """
+    Creates the Calculator instance shared by all chunks calculated by the worker process.
+
+    Args:
+        source (tuple): The source of the Calculator class in the format of get_class_source.
+
+    Returns:
+        None
+    """
+    global CALCULATOR
+    CALCULATOR = load_class(source)()
+
+
+def calculate_chunk(expressions: list) -> list[dict]:
+    """
+    Calculates the results of a chunk of expressions with the instance of the worker process.
+
+    Args:
+        expressions (list): The arithmetic expressions.
+
+    Returns:
+        list[dict]: The result of every expression in the format of get_result.
+    """
+    return [get_result(CALCULATOR, expression) for expression in expressions]
+
+
+def calculate_many(
+    calculator_class: type, expressions, workers: int = 1, pool_threshold: int = 10_000, chunk_size: int = 2_000
+) -> list[dict]:
+    """
+    Calculates the values of a batch of expressions, the errors do not abort the batch.
+    Identical expressions are calculated once, every position of the batch gets its own copy of the result
+    dictionary (modifying one result does not change the others). If workers > 1 and the batch
+    has at least pool_threshold distinct expressions, they are split into chunks calculated by a process pool
+    (one instance of the class per worker process).
+
+    Args:
+        calculator_class (type): The Calculator class.
+        expressions (iterable): The arithmetic expressions.
+        workers (int): The number of worker processes.
+        pool_threshold (int): The minimal number of distinct expressions calculated by the process pool.
+        chunk_size (int): The number of expressions in one task of the process pool.
+
+    Returns:
+        list[dict]: The result of every expression in the order of the batch: the value (None on error),
+            the name of the exception and its message (None on success).
+    """
+    calculator = calculator_class()
+    if hasattr(calculator, "calculate_many"):
+        return calculator.calculate_many(expressions, workers, pool_threshold, chunk_size)
+
+    expressions = list(expressions)
+    unique = list(dict.fromkeys(expression for expression in expressions if isinstance(expression, str)))
+
+    if workers > 1 and len(unique) >= pool_threshold:
+        chunks = [unique[start : start + chunk_size] for start in range(0, len(unique), chunk_size)]
+        source = get_class_source(calculator_class)
+        with multiprocessing.Pool(workers, initializer=init_batch_worker, initargs=(source,)) as pool:
+            results = [result for chunk in pool.map(calculate_chunk, chunks) for result in chunk]
+    else:
+        results = [get_result(calculator, expression) for expression in unique]
+
+    results = dict(zip(unique, results))
+    return [
+        dict(results[expression]) if isinstance(expression, str) else get_result(calculator, expression)
+        for expression in expressions
+    ]
@@ -0,0 +1,187 @@
+"""
+This script compares the calculation of a batch of expressions by calling Calculator.calculate once per
+expression with the batch interface calculate_many (see batch.py) for every generated Calculator and the
+reference implementation. The batch (with repeated and invalid expressions) is calculated per call,
+by calculate_many in one process and by calculate_many split across a process pool; the results of
+the batch modes are compared with the per-call results.
+The implementations are measured one after another in a separate worker process.
+Running: python code/benchmarks/calculator_batch.py (from the root of the repository)
+Output: results/calculator/batch.csv
+"""
+
+import concurrent.futures
+import csv
+import functools
+import os
+import random
+import signal
+import time
+
+from batch import calculate_many, get_result
+from config import (
+    BATCH_CHUNK_SIZE,
+    BATCH_EXPRESSIONS,
+    BATCH_FILE,
+    BATCH_INVALID_RATE,
+    BATCH_POOL_THRESHOLD,
+    BATCH_SEED,
+    BATCH_TIME_LIMIT,
+    BATCH_UNIQUE,
+    BATCH_WORKERS,
+    GENERATED_DIR,
+    ITERATIONS,
+    MODELS,
+    PROMPTS,
+    REFERENCE_DIR,
+    RESULTS_DIR,
+)
+from helpers import get_implementation_name, get_implementations, get_reference, init_worker, load_module, on_timeout
+
+OPERATORS = "+-*/"
+
+# characters inserted into the broken expressions
+NOISE = "+-*/().a "
+
+
+# Helper functions
+def generate_expression(rng: random.Random, depth: int) -> str:
+    """
+    Generates a random valid expression (numbers, negative numbers and expressions in parentheses).
+
+    Args:
+        rng (random.Random): The random generator.
+        depth (int): The maximum nesting of the parentheses.
+
+    Returns:
+        str: The expression.
+    """
+    parts = []
+    for index in range(rng.randint(1, 4)):
+        if index:
+            parts.append(rng.choice(OPERATORS))
+        kind = rng.random()
+        if depth > 0 and kind < 0.2:
+            parts.append(f"({generate_expression(rng, depth - 1)})")
+        elif kind < 0.3:
+            parts.append(f"-{rng.randint(0, 1000)}")
+        elif kind < 0.6:
+            parts.append(f"{rng.randint(0, 1000)}.{rng.randint(0, 99)}")
+        else:
+            parts.append(str(rng.randint(0, 1000)))
+
+    return (" " if rng.random() < 0.3 else "").join(parts)
+
+
+def generate_batch() -> list[str]:
+    """
+    Generates the batch: BATCH_UNIQUE distinct expressions (BATCH_INVALID_RATE of them broken)
+    repeated up to BATCH_EXPRESSIONS expressions in a random order.
+
+    Returns:
+        list[str]: The expressions.
+    """
+    rng = random.Random(BATCH_SEED)
+    unique = []
+    for _ in range(BATCH_UNIQUE):
+        expression = generate_expression(rng, 2)
+        if rng.random() < BATCH_INVALID_RATE:
+            position = rng.randrange(len(expression))
+            expression = expression[:position] + rng.choice(NOISE) + expression[position + 1 :]
+        unique.append(expression)
+
+    return unique + [rng.choice(unique) for _ in range(BATCH_EXPRESSIONS - BATCH_UNIQUE)]
+
+
+def measure_batch(implementation: tuple, expressions: list[str], workers: int) -> dict:
+    """
+    Calculates the batch per call, by calculate_many and by calculate_many with a process pool.
+
+    Args:
+        implementation (tuple): The (prompt_type, iteration, model, path) tuple.
+        expressions (list[str]): The batch.
+        workers (int): The number of worker processes of the parallel batch.
+
+    Returns:
+        dict: The times of the modes, the numbers of errors and mismatched results (or the error).
+    """
+    prompt_type, iteration, model, path = implementation
+    result = {"per_call": "", "batch": "", "parallel": "", "errors": "", "mismatches": "", "error": ""}
+    module_name = get_implementation_name("calculator", prompt_type, iteration, model).replace("/", "-")
+
+    signal.signal(signal.SIGALRM, on_timeout)
+    signal.alarm(BATCH_TIME_LIMIT)
+    try:
+        calculator_class = load_module(path, module_name).Calculator
+
+        start = time.perf_counter()
+        calculator = calculator_class()
+        expected = [get_result(calculator, expression) for expression in expressions]
+        result["per_call"] = time.perf_counter() - start
+
+        start = time.perf_counter()
+        batch = calculate_many(calculator_class, expressions)
+        result["batch"] = time.perf_counter() - start
+
+        start = time.perf_counter()
+        parallel = calculate_many(calculator_class, expressions, workers, BATCH_POOL_THRESHOLD, BATCH_CHUNK_SIZE)
+        result["parallel"] = time.perf_counter() - start
+
+        result["errors"] = sum(outcome["error"] is not None for outcome in expected)
+        result["mismatches"] = sum(
+            (first["value"], first["error"]) != (second["value"], second["error"])
+            or (first["value"], first["error"]) != (third["value"], third["error"])
+            for first, second, third in zip(expected, batch, parallel)
+        )
+    except Exception as error:
+        result["error"] = f"{type(error).__name__}: {error}"[:100]
+    finally:
+        signal.alarm(0)
+
+    return result
+
+
+def main() -> None:
+    implementations = get_implementations(GENERATED_DIR, "calculator", PROMPTS, ITERATIONS, MODELS)
+    implementations += get_reference(REFERENCE_DIR, "calculator")
+    expressions = generate_batch()
+    workers = BATCH_WORKERS or os.cpu_count() or 1
+
+    # one implementation at a time, the parallel batch uses all workers
+    measure = functools.partial(measure_batch, expressions=expressions, workers=workers)
+    with concurrent.futures.ProcessPoolExecutor(1, initializer=init_worker) as executor:
+        results = list(executor.map(measure, implementations))
+
+    with open(f"{RESULTS_DIR}/calculator/{BATCH_FILE}", "w", encoding="utf-8", newline="") as file:
+        writer = csv.writer(file)
+        writer.writerow(
+            ["prompt_type", "iteration", "model", "expressions", "unique_expressions", "workers", "per_call_seconds",
+             "batch_seconds", "parallel_seconds", "batch_speedup", "parallel_speedup", "errors", "mismatches", "error"]
+        )
+        for (prompt_type, iteration, model, _), result in zip(implementations, results):
+            speedups = [
+                round(result["per_call"] / result[mode], 2) if result[mode] != "" else ""
+                for mode in ["batch", "parallel"]
+            ]
+            times = [round(result[mode], 4) if result[mode] != "" else "" for mode in ["per_call", "batch", "parallel"]]
+            writer.writerow(
+                [prompt_type, iteration, model, len(expressions), len(set(expressions)), workers]
+                + times
+                + speedups
+                + [result["errors"], result["mismatches"], result["error"]]
+            )
+
+    measured = sorted(
+        ((result["batch"], get_implementation_name("calculator", prompt_type, iteration, model), result)
+        for (prompt_type, iteration, model, _), result in zip(implementations, results)
+        if result["batch"] != ""
+    ), key=lambda item: item[0])
+    print(f"{len(measured)}/{len(implementations)} implementations measured (fastest batch first)")
+    for _, name, result in measured:
+        print(
+            f"{name}: per call {result['per_call']:.3f} s, batch {result['batch']:.3f} s, "
+            f"parallel ({workers} workers) {result['parallel']:.3f} s, {result['mismatches']} mismatches"
+        )
+
+
+if __name__ == "__main__":
+    main()
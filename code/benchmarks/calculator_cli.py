@@ -0,0 +1,182 @@
+"""
+This script is the batch mode of the Calculator implementations: it reads newline-delimited expressions
+from a file (or stdin), calculates them with the selected generated or reference implementation and writes one
+line per expression (the value or "error: {exception}: {message}") in the order of the input.
+The input is processed in chunks of CLI_CHUNK_SIZE lines (identical expressions of a chunk are calculated once)
+and the output is written through a large buffer. With --workers N the chunks are calculated by a process pool,
+at most 2 * N chunks are in flight at once, so the memory stays constant for inputs of any size.
+With --stack-fallback the expressions which the implementation cannot calculate because of the recursion limit
+(deeply nested parentheses) are calculated by the explicit-stack engine of the reference implementation.
+Running: python code/benchmarks/calculator_cli.py <implementation> [input] [--output output] [--workers N]
+[--stack-fallback]
+(from the root of the repository, implementation is "reference" or e.g. "1-zero_shot/iteration_1/chatgpt")
+Output: the results of the expressions (stdout or the output file), a summary on stderr
+"""
+
+import argparse
+import collections
+import itertools
+import multiprocessing
+import os
+import sys
+import time
+
+import batch
+from config import CLI_BUFFER_SIZE, CLI_CHUNK_SIZE, GENERATED_DIR, REFERENCE_DIR
+
+
+# Helper functions
+def get_path(implementation: str) -> str:
+    """
+    Returns the path of the selected implementation.
+
+    Args:
+        implementation (str): "reference" or the {prompt_type}/iteration_{iteration}/{model} of a generated module.
+
+    Returns:
+        str: The path to the Python file.
+    """
+    if implementation == "reference":
+        return f"{REFERENCE_DIR}/calculator.py"
+    return f"{GENERATED_DIR}/calculator/{implementation}.py"
+
+
+def init_cli_worker(path: str, stack_fallback: bool) -> None:
+    """
+    Prepares a worker process (or the main process without workers): the output of the implementation
+    is discarded, so it cannot mix with the results, and the shared Calculator instance is created.
+    The class is loaded in the process from the path (the workers work with every start method).
+
+    Args:
+        path (str): The path of the implementation.
+        stack_fallback (bool): Whether the too deep expressions are calculated by the explicit-stack engine.
+
+    Returns:
+        None
+    """
+    sys.stdout = open(os.devnull, "w")
+    engine = (os.path.abspath(get_path("reference")), "calculator_cli_engine", "Calculator", None)
+    batch.init_batch_worker(
+        (os.path.abspath(path), "calculator_cli_implementation", "Calculator", engine if stack_fallback else None)
+    )
+
+
+def calculate_lines(lines: list[bytes]) -> tuple[bytes, int]:
+    """
+    Calculates a chunk of input lines with the Calculator instance of the process.
+
+    Args:
+        lines (list[bytes]): The lines of the input (with their line endings).
+
+    Returns:
+        tuple[bytes, int]: The encoded output lines of the chunk and the number of errors.
+    """
+    outputs = {}
+    errors = 0
+    for line in lines:
+        if line not in outputs:
+            result = batch.get_result(batch.CALCULATOR, line.rstrip(b"\r\n").decode("utf-8", "replace"))
+            if result["error"] is None:
+                output = f"{result['value']}\n"
+            else:
+                message = " ".join(result["message"].split())
+                output = f"error: {result['error']}: {message}\n"
+            outputs[line] = (output.encode("utf-8"), result["error"] is not None)
+
+        errors += outputs[line][1]
+
+    return b"".join(outputs[line][0] for line in lines), errors
+
+
+def get_chunks(stream) -> iter:
+    """
+    Reads the input in chunks of CLI_CHUNK_SIZE lines.
+
+    Args:
+        stream: The binary input stream.
+
+    Returns:
+        iter: The chunks (lists of lines).
+    """
+    while chunk := list(itertools.islice(stream, CLI_CHUNK_SIZE)):
+        yield chunk
+
+
+def calculate_stream(chunks: iter, output, workers: int, path: str, stack_fallback: bool) -> tuple[int, int]:
+    """
+    Calculates the chunks and writes their results in the order of the input.
+
+    Args:
+        chunks (iter): The chunks of the input lines.
+        output: The binary output stream.
+        workers (int): The number of worker processes (1 = calculated in the main process).
+        path (str): The path of the implementation.
+        stack_fallback (bool): Whether the too deep expressions are calculated by the explicit-stack engine.
+
+    Returns:
+        tuple[int, int]: The number of expressions and the number of errors.
+    """
+    expressions = errors = 0
+
+    if workers <= 1:
+        init_cli_worker(path, stack_fallback)
+        for chunk in chunks:
+            data, chunk_errors = calculate_lines(chunk)
+            output.write(data)
+            expressions += len(chunk)
+            errors += chunk_errors
+        return expressions, errors
+
+    with multiprocessing.Pool(workers, initializer=init_cli_worker, initargs=(path, stack_fallback)) as pool:
+        pending = collections.deque()
+        for chunk in itertools.chain(chunks, [None]):
+            if chunk is not None:
+                pending.append((len(chunk), pool.apply_async(calculate_lines, (chunk,))))
+            while pending and (len(pending) >= 2 * workers or chunk is None):
+                size, task = pending.popleft()
+                data, chunk_errors = task.get()
+                output.write(data)
+                expressions += size
+                errors += chunk_errors
+
+    return expressions, errors
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Calculates newline-delimited expressions with a Calculator.")
+    parser.add_argument("implementation", help='"reference" or {prompt_type}/iteration_{iteration}/{model}')
+    parser.add_argument("input", nargs="?", default="-", help="the file with the expressions (default: stdin)")
+    parser.add_argument("--output", default="-", help="the file for the results (default: stdout)")
+    parser.add_argument("--workers", type=int, default=1, help="the number of worker processes (default: 1)")
+    parser.add_argument(
+        "--stack-fallback", action="store_true", help="calculate too deep expressions by the explicit-stack engine"
+    )
+    arguments = parser.parse_args()
+
+    path = get_path(arguments.implementation)
+    if not os.path.exists(path):
+        parser.error(f"implementation not found: {path}")
+
+    source = sys.stdin.buffer if arguments.input == "-" else open(arguments.input, "rb")
+    if arguments.output == "-":
+        output = open(os.dup(sys.stdout.fileno()), "wb", buffering=CLI_BUFFER_SIZE)
+    else:
+        output = open(arguments.output, "wb", buffering=CLI_BUFFER_SIZE)
+
+    # the results are written to the duplicated descriptor, prints of the implementation are discarded
+    sys.stdout = open(os.devnull, "w")
+    start = time.perf_counter()
+    with source, output:
+        expressions, errors = calculate_stream(
+            get_chunks(source), output, arguments.workers, path, arguments.stack_fallback
+        )
+
+    print(
+        f"{expressions} expressions ({errors} errors) calculated by {arguments.implementation} "
+        f"in {time.perf_counter() - start:.2f} s",
+        file=sys.stderr,
+    )
+
+
+if __name__ == "__main__":
+    main()
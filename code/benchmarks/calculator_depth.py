@@ -0,0 +1,158 @@
+"""
+This script calculates deeply nested expressions (up to DEPTH_LEVELS, 10,000 levels by default) with every
+generated Calculator and the reference implementation (explicit stacks). Three shapes of nesting are used:
+nested parentheses around a number, left-nested sums and right-nested sums.
+Every generated implementation is measured on its own (native) and as the drop-in class with the explicit-stack
+fallback (see batch.with_stack_fallback), which recalculates the expressions the implementation fails on
+with RecursionError by the reference engine.
+Every implementation is measured in a new worker process, so an implementation which crashes the interpreter
+does not stop the benchmark.
+Running: python code/benchmarks/calculator_depth.py (from the root of the repository)
+Output: results/calculator/depth.csv
+"""
+
+import concurrent.futures
+import csv
+import os
+import signal
+import statistics
+import time
+from collections import Counter, defaultdict
+
+from batch import with_stack_fallback
+from config import (
+    DEPTH_FILE,
+    DEPTH_LEVELS,
+    DEPTH_REPEATS,
+    DEPTH_TIME_LIMIT,
+    GENERATED_DIR,
+    ITERATIONS,
+    MODELS,
+    PROMPTS,
+    REFERENCE_DIR,
+    RESULTS_DIR,
+)
+from helpers import get_implementation_name, get_implementations, get_reference, init_worker, load_module, on_timeout
+
+SHAPES = ["parentheses", "left", "right"]
+
+
+# Helper functions
+def get_expression(shape: str, depth: int) -> tuple[str, float]:
+    """
+    Builds the nested expression and its value.
+
+    Args:
+        shape (str): The shape of the nesting (parentheses, left or right).
+        depth (int): The number of the nested levels.
+
+    Returns:
+        tuple[str, float]: The expression and its value.
+    """
+    if shape == "parentheses":
+        return "(" * depth + "1" + ")" * depth, 1.0
+    if shape == "left":
+        return "(" * depth + "1" + "+1)" * depth, depth + 1.0
+    return "1+(" * depth + "1" + ")" * depth, depth + 1.0
+
+
+def measure_expression(calculator, expression: str, expected: float) -> tuple[str, float | str]:
+    """
+    Calculates the expression DEPTH_REPEATS times.
+
+    Args:
+        calculator: The Calculator instance.
+        expression (str): The expression.
+        expected (float): The value of the expression.
+
+    Returns:
+        tuple[str, float | str]: The outcome ("ok", "wrong", "timeout" or the name of the raised exception)
+            and the median time of the calculation in seconds (empty if it failed).
+    """
+    times = []
+    signal.alarm(DEPTH_TIME_LIMIT)
+    try:
+        for _ in range(DEPTH_REPEATS):
+            start = time.perf_counter()
+            value = calculator.calculate(expression)
+            times.append(time.perf_counter() - start)
+        outcome = "ok" if abs(float(value) - expected) <= 1e-9 * abs(expected) else "wrong"
+    except TimeoutError:
+        return "timeout", ""
+    except Exception as error:
+        return type(error).__name__, ""
+    finally:
+        signal.alarm(0)
+
+    return outcome, statistics.median(times)
+
+
+def measure_depth(implementation: tuple, engine_path: str) -> list[tuple]:
+    """
+    Calculates the nested expressions by the implementation (native and with the explicit-stack fallback).
+
+    Args:
+        implementation (tuple): The (prompt_type, iteration, model, path) tuple.
+        engine_path (str): The path of the reference implementation (the explicit-stack engine).
+
+    Returns:
+        list[tuple]: The (mode, shape, depth, outcome, seconds) tuples.
+    """
+    prompt_type, iteration, model, path = implementation
+    module_name = get_implementation_name("calculator", prompt_type, iteration, model).replace("/", "-")
+    signal.signal(signal.SIGALRM, on_timeout)
+
+    try:
+        calculator_class = load_module(path, module_name).Calculator
+        modes = {"native": calculator_class}
+        if prompt_type != "reference":
+            engine_class = load_module(engine_path, "calculator-depth-engine").Calculator
+            modes["stack_fallback"] = with_stack_fallback(calculator_class, engine_class)
+    except Exception as error:
+        return [("native", "", "", f"import failed ({type(error).__name__})", "")]
+
+    rows = []
+    for mode, mode_class in modes.items():
+        calculator = mode_class()
+        for shape in SHAPES:
+            for depth in DEPTH_LEVELS:
+                expression, expected = get_expression(shape, depth)
+                rows.append((mode, shape, depth, *measure_expression(calculator, expression, expected)))
+
+    return rows
+
+
+def main() -> None:
+    implementations = get_implementations(GENERATED_DIR, "calculator", PROMPTS, ITERATIONS, MODELS)
+    implementations += get_reference(REFERENCE_DIR, "calculator")
+    engine_path = os.path.abspath(f"{REFERENCE_DIR}/calculator.py")
+
+    results = []
+    for implementation in implementations:
+        # a new process for every implementation, a crash of the interpreter breaks only its pool
+        with concurrent.futures.ProcessPoolExecutor(1, initializer=init_worker) as executor:
+            try:
+                results.append(executor.submit(measure_depth, implementation, engine_path).result())
+            except concurrent.futures.process.BrokenProcessPool:
+                results.append([("native", "", "", "crashed", "")])
+
+    with open(f"{RESULTS_DIR}/calculator/{DEPTH_FILE}", "w", encoding="utf-8", newline="") as file:
+        writer = csv.writer(file)
+        writer.writerow(["prompt_type", "iteration", "model", "mode", "shape", "depth", "outcome", "seconds"])
+        for (prompt_type, iteration, model, _), rows in zip(implementations, results):
+            for mode, shape, depth, outcome, seconds in rows:
+                seconds = f"{seconds:.6f}" if seconds != "" else ""
+                writer.writerow([prompt_type, iteration, model, mode, shape, depth, outcome, seconds])
+
+    outcomes = defaultdict(Counter)
+    for rows in results:
+        for mode, shape, depth, outcome, _ in rows:
+            outcomes[(mode, shape, depth)][outcome] += 1
+    print(f"Outcomes of {len(implementations)} implementations (mode, shape, depth)")
+    for (mode, shape, depth), counter in sorted(outcomes.items(), key=lambda item: (*item[0][:2], item[0][2] or 0)):
+        summary = ", ".join(f"{outcome} {count}" for outcome, count in counter.most_common())
+        print(f"{mode} {shape} {depth}: {summary}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,199 @@
+"""
+This script compares the evaluation of formulas with named variables over 10^6 bindings (values of the
+variables) by the vectorized Formula of the reference implementation (compiled once, evaluated over NumPy arrays)
+with formatting every binding into the expression and calling Calculator.calculate once per element
+(every generated Calculator and the reference implementation).
+The per-element calculation of a formula stops after VECTORIZED_TIME_LIMIT seconds and its time is extrapolated
+to all bindings; the calculated values are compared with the vectorized ones.
+The implementations are measured one after another in a separate worker process.
+Running: python code/benchmarks/calculator_vectorized.py (from the root of the repository)
+Output: results/calculator/vectorized.csv
+"""
+
+import concurrent.futures
+import csv
+import re
+import signal
+import time
+
+import numpy as np
+
+from config import (
+    GENERATED_DIR,
+    ITERATIONS,
+    MODELS,
+    PROMPTS,
+    REFERENCE_DIR,
+    RESULTS_DIR,
+    VECTORIZED_BINDINGS,
+    VECTORIZED_FILE,
+    VECTORIZED_FORMULAS,
+    VECTORIZED_REPEATS,
+    VECTORIZED_SEED,
+    VECTORIZED_TIME_LIMIT,
+)
+from helpers import get_implementation_name, get_implementations, get_reference, init_worker, load_module, on_timeout
+
+NAME_PATTERN = re.compile(r"[A-Za-z_]\w*")
+CHECK_INTERVAL = 1_000
+
+# state of a worker process (set by init_vectorized_worker)
+COLUMNS = {}
+EXPECTED = []
+
+
+# Helper functions
+def get_template(formula: str, variables: tuple) -> str:
+    """
+    Converts the formula to a format string, the variables are replaced by their values in parentheses
+    (with three decimal places, so negative values stay valid operands).
+
+    Args:
+        formula (str): The formula with named variables.
+        variables (tuple): The names of the variables.
+
+    Returns:
+        str: The format string with positional fields in the order of the variables.
+    """
+    return NAME_PATTERN.sub(lambda match: f"({{{variables.index(match.group())}:.3f}})", formula)
+
+
+def measure_vectorized(formula, columns: dict) -> tuple[float, np.ndarray]:
+    """
+    Evaluates the compiled formula over all bindings VECTORIZED_REPEATS times.
+
+    Args:
+        formula: The Formula of the reference implementation.
+        columns (dict): The values of the variables by their names (NumPy arrays).
+
+    Returns:
+        tuple[float, np.ndarray]: The time of the fastest evaluation (in seconds) and the values.
+    """
+    bindings = {name: columns[name] for name in formula.variables}
+    best = float("inf")
+    for _ in range(VECTORIZED_REPEATS):
+        start = time.perf_counter()
+        values = formula.evaluate(**bindings)
+        best = min(best, time.perf_counter() - start)
+
+    return best, values
+
+
+def init_vectorized_worker(columns: dict, expected: list) -> None:
+    """
+    Prepares the worker process.
+
+    Args:
+        columns (dict): The values of the variables by their names (NumPy arrays).
+        expected (list): The values of every formula computed by the vectorized evaluation.
+
+    Returns:
+        None
+    """
+    global COLUMNS, EXPECTED
+    init_worker()
+    COLUMNS = columns
+    EXPECTED = expected
+
+
+def measure_per_element(implementation: tuple) -> list[dict]:
+    """
+    Calculates every formula element by element (formatting the binding into the expression and calling calculate).
+
+    Args:
+        implementation (tuple): The (prompt_type, iteration, model, path) tuple.
+
+    Returns:
+        list[dict]: The number of calculated elements, the time, the mismatches and the error of every formula.
+    """
+    prompt_type, iteration, model, path = implementation
+    module_name = get_implementation_name("calculator", prompt_type, iteration, model).replace("/", "-")
+    results = []
+
+    try:
+        calculator = load_module(path, module_name).Calculator()
+    except Exception as error:
+        message = f"{type(error).__name__}: {error}"[:100]
+        return [{"evaluated": 0, "seconds": "", "mismatches": "", "error": message} for _ in VECTORIZED_FORMULAS]
+
+    signal.signal(signal.SIGALRM, on_timeout)
+    for formula, expected in zip(VECTORIZED_FORMULAS, EXPECTED):
+        variables = tuple(dict.fromkeys(NAME_PATTERN.findall(formula)))
+        template = get_template(formula, variables)
+        rows = zip(*(COLUMNS[name].tolist() for name in variables))
+        result = {"evaluated": 0, "seconds": "", "mismatches": "", "error": ""}
+        values = []
+
+        signal.alarm(VECTORIZED_TIME_LIMIT * 2)
+        try:
+            start = time.perf_counter()
+            for row in rows:
+                values.append(calculator.calculate(template.format(*row)))
+                if len(values) % CHECK_INTERVAL == 0 and time.perf_counter() - start > VECTORIZED_TIME_LIMIT:
+                    break
+            result["seconds"] = time.perf_counter() - start
+            result["evaluated"] = len(values)
+            calculated = np.array(values, dtype=np.float64)
+            result["mismatches"] = int(np.count_nonzero(~np.isclose(calculated, expected[: len(values)], rtol=1e-9)))
+        except Exception as error:
+            result["evaluated"] = len(values)
+            result["error"] = f"{type(error).__name__}: {error}"[:100]
+        finally:
+            signal.alarm(0)
+
+        results.append(result)
+
+    return results
+
+
+def main() -> None:
+    implementations = get_implementations(GENERATED_DIR, "calculator", PROMPTS, ITERATIONS, MODELS)
+    implementations += get_reference(REFERENCE_DIR, "calculator")
+    reference = load_module(f"{REFERENCE_DIR}/calculator.py", "calculator-reference").Calculator()
+    formulas = [reference.compile(formula) for formula in VECTORIZED_FORMULAS]
+
+    rng = np.random.default_rng(VECTORIZED_SEED)
+    columns = {
+        name: rng.integers(-100_000, 100_001, VECTORIZED_BINDINGS) / 1000
+        for name in sorted({name for formula in formulas for name in formula.variables})
+    }
+    vectorized = [measure_vectorized(formula, columns) for formula in formulas]
+    expected = [values for _, values in vectorized]
+
+    # one implementation at a time, so the timings are not affected by other measurements
+    with concurrent.futures.ProcessPoolExecutor(
+        1, initializer=init_vectorized_worker, initargs=(columns, expected)
+    ) as executor:
+        results = list(executor.map(measure_per_element, implementations))
+
+    with open(f"{RESULTS_DIR}/calculator/{VECTORIZED_FILE}", "w", encoding="utf-8", newline="") as file:
+        writer = csv.writer(file)
+        writer.writerow(
+            ["prompt_type", "iteration", "model", "formula", "bindings", "evaluated", "per_element_seconds",
+             "vectorized_seconds", "speedup", "mismatches", "error"]
+        )
+        for (prompt_type, iteration, model, _), formula_results in zip(implementations, results):
+            for formula, (vectorized_seconds, _), result in zip(VECTORIZED_FORMULAS, vectorized, formula_results):
+                per_element = ""
+                if result["seconds"] != "" and result["evaluated"]:
+                    per_element = result["seconds"] * VECTORIZED_BINDINGS / result["evaluated"]
+                writer.writerow(
+                    [prompt_type, iteration, model, formula, VECTORIZED_BINDINGS, result["evaluated"],
+                     round(per_element, 3) if per_element != "" else "", round(vectorized_seconds, 5),
+                     round(per_element / vectorized_seconds, 1) if per_element != "" else "",
+                     result["mismatches"], result["error"]]
+                )
+
+    for formula, (vectorized_seconds, _) in zip(VECTORIZED_FORMULAS, vectorized):
+        print(f"{formula}: vectorized {vectorized_seconds * 1000:.1f} ms for {VECTORIZED_BINDINGS} bindings")
+    for (prompt_type, iteration, model, _), formula_results in zip(implementations, results):
+        times = [
+            f"{result['seconds'] * VECTORIZED_BINDINGS / result['evaluated']:.1f} s"
+            if result["seconds"] != "" and result["evaluated"] else "failed"
+            for result in formula_results
+        ]
+        print(f"{get_implementation_name('calculator', prompt_type, iteration, model)}: per element {', '.join(times)}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,171 @@
+# Constants for the benchmarks
+
+# RESULTS_DIR - the directory where the results are stored
+RESULTS_DIR = "results"
+
+# GENERATED_DIR - the directory with the generated code
+GENERATED_DIR = "generated/code"
+
+# PROMPTS - list of prompts used in scraper
+PROMPTS = [
+    "1-zero_shot",
+    "2-few_shot",
+    "3-chain_of_thoughts-zero_shot",
+    "4-chain_of_thoughts-few_shot",
+    "5-role-zero_shot",
+    "6-role-few_shot",
+]
+
+# MODELS - list of models used in scraper
+MODELS = ["chatgpt", "claude", "gemini"]
+
+# ITERATIONS - number of iterations used in scraper
+ITERATIONS = 10
+
+# REFERENCE_DIR - the directory with the reference implementations (benchmarked as the baseline)
+REFERENCE_DIR = "code/reference"
+
+# MEMORY_CHECKPOINTS - numbers of added tasks at which the traced memory is recorded (the growth curve)
+MEMORY_CHECKPOINTS = [1_000, 10_000, 100_000, 250_000, 500_000, 1_000_000]
+
+# MEMORY_TIME_LIMIT - maximum time (in seconds) of adding the tasks to one implementation (slower ones stop early)
+MEMORY_TIME_LIMIT = 120
+
+# MEMORY_WORKERS - number of implementations measured at once (every measurement of a million tasks may take several GB)
+MEMORY_WORKERS = 2
+
+# MEMORY_SAMPLE_TASKS - number of stored tasks (of each large collection) inspected for the breakdown of the record representation
+MEMORY_SAMPLE_TASKS = 1_000
+
+# MEMORY_FOOTPRINT_FILE - the name of the table with the bytes per task and the breakdown (stored in results/todo_list/)
+MEMORY_FOOTPRINT_FILE = "memory_footprint.csv"
+
+# MEMORY_GROWTH_FILE - the name of the table with the growth curves (stored in results/todo_list/)
+MEMORY_GROWTH_FILE = "memory_growth.csv"
+
+# BATCH_EXPRESSIONS - number of expressions in the batch of the calculator batch benchmark
+BATCH_EXPRESSIONS = 20_000
+
+# BATCH_UNIQUE - number of distinct expressions in the batch (the rest are repetitions)
+BATCH_UNIQUE = 5_000
+
+# BATCH_INVALID_RATE - share of the distinct expressions which are broken (invalid characters, missing operands, unmatched parentheses)
+BATCH_INVALID_RATE = 0.1
+
+# BATCH_SEED - seed of the expression generator
+BATCH_SEED = 42
+
+# BATCH_WORKERS - number of worker processes of the parallel batch (None = one per CPU core)
+BATCH_WORKERS = None
+
+# BATCH_POOL_THRESHOLD - minimal number of distinct expressions calculated by the process pool
+BATCH_POOL_THRESHOLD = 1_000
+
+# BATCH_CHUNK_SIZE - number of expressions in one task of the process pool
+BATCH_CHUNK_SIZE = 1_000
+
+# BATCH_TIME_LIMIT - maximum time (in seconds) of the measurement of one implementation
+BATCH_TIME_LIMIT = 120
+
+# BATCH_FILE - the name of the table with the batch benchmark (stored in results/calculator/)
+BATCH_FILE = "batch.csv"
+
+# VECTORIZED_FORMULAS - formulas with named variables evaluated by the vectorized benchmark
+VECTORIZED_FORMULAS = [
+    "x * 2 + y",
+    "(x + 2.5) * (y - 1) / (y * y + 1)",
+    "-x * (y + 3) - (x - y) / 4 + 10",
+]
+
+# VECTORIZED_BINDINGS - number of values of every variable (bindings) the formulas are evaluated for
+VECTORIZED_BINDINGS = 1_000_000
+
+# VECTORIZED_SEED - seed of the generator of the values (numbers with three decimal places from -100 to 100)
+VECTORIZED_SEED = 42
+
+# VECTORIZED_REPEATS - number of repetitions of the vectorized evaluation (the fastest one is reported)
+VECTORIZED_REPEATS = 5
+
+# VECTORIZED_TIME_LIMIT - maximum time (in seconds) of the per-element calculation of one formula by one implementation (the rest is extrapolated)
+VECTORIZED_TIME_LIMIT = 10
+
+# VECTORIZED_FILE - the name of the table with the vectorized benchmark (stored in results/calculator/)
+VECTORIZED_FILE = "vectorized.csv"
+
+# CLI_CHUNK_SIZE - number of input lines calculated as one chunk by the calculator batch mode (calculator_cli.py)
+CLI_CHUNK_SIZE = 10_000
+
+# CLI_BUFFER_SIZE - size (in bytes) of the output buffer of the calculator batch mode
+CLI_BUFFER_SIZE = 1 << 20
+
+# DEPTH_LEVELS - nesting depths of the expressions of the deep nesting benchmark
+DEPTH_LEVELS = [10, 100, 1_000, 10_000]
+
+# DEPTH_REPEATS - number of calculations of every expression (the median time is reported)
+DEPTH_REPEATS = 3
+
+# DEPTH_TIME_LIMIT - maximum time (in seconds) of the calculations of one expression by one implementation
+DEPTH_TIME_LIMIT = 60
+
+# DEPTH_FILE - the name of the table with the deep nesting benchmark (stored in results/calculator/)
+DEPTH_FILE = "depth.csv"
+
+# CANVAS_SIZES - sizes (every dimension) of the shapes of the canvas benchmark (the scene is 2 * size x 2 * size cells)
+CANVAS_SIZES = [500, 2_000, 5_000]
+
+# CANVAS_REPEATS - number of repetitions of every drawing (the median time is reported)
+CANVAS_REPEATS = 3
+
+# CANVAS_TIME_LIMIT - maximum time (in seconds) of the measurement of one implementation
+CANVAS_TIME_LIMIT = 300
+
+# CANVAS_FILE - the name of the table with the canvas benchmark (stored in results/ascii_art/)
+CANVAS_FILE = "canvas.csv"
+
+# PARALLEL_SHAPES - shapes of the band-parallel rendering benchmark (their size grows linearly with the rows)
+PARALLEL_SHAPES = ["rectangle", "triangle"]
+
+# PARALLEL_ROWS - numbers of rows of the shapes of the band-parallel rendering benchmark
+PARALLEL_ROWS = [50_000, 200_000]
+
+# PARALLEL_WIDTH - width of the shapes of the band-parallel rendering benchmark
+PARALLEL_WIDTH = 1_000
+
+# PARALLEL_WORKERS - numbers of worker processes the reference render_parallel is measured with
+PARALLEL_WORKERS = [1, 2, 4, 8]
+
+# PARALLEL_REPEATS - number of repetitions of every rendering (the median time is reported)
+PARALLEL_REPEATS = 3
+
+# PARALLEL_TIME_LIMIT - maximum time (in seconds) of the measurement of one implementation
+PARALLEL_TIME_LIMIT = 300
+
+# PARALLEL_FILE - the name of the table with the band-parallel rendering benchmark (stored in results/ascii_art/)
+PARALLEL_FILE = "parallel.csv"
+
+# OUTPUT_SHAPES - shapes of the file output benchmark
+OUTPUT_SHAPES = ["rectangle", "triangle"]
+
+# OUTPUT_ROWS - numbers of rows of the shapes of the file output benchmark (the largest rectangle has 500 MB)
+OUTPUT_ROWS = [1_000, 10_000, 50_000]
+
+# OUTPUT_WIDTH - width of the shapes of the file output benchmark
+OUTPUT_WIDTH = 10_000
+
+# OUTPUT_TIME_LIMIT - maximum time (in seconds) of writing one drawing to the file
+OUTPUT_TIME_LIMIT = 120
+
+# OUTPUT_FILE - the name of the table with the file output benchmark (stored in results/ascii_art/)
+OUTPUT_FILE = "file_output.csv"
+
+# PERSISTENCE_TASKS - numbers of tasks of the persistence benchmark (every third task is finished, every tenth removed)
+PERSISTENCE_TASKS = [100_000, 1_000_000]
+
+# PERSISTENCE_REPEATS - number of recoveries of the reference TaskManager (the median time is reported)
+PERSISTENCE_REPEATS = 3
+
+# PERSISTENCE_TIME_LIMIT - maximum time (in seconds) of reloading the export by one implementation (the rest is extrapolated)
+PERSISTENCE_TIME_LIMIT = 60
+
+# PERSISTENCE_FILE - the name of the table with the persistence benchmark (stored in results/todo_list/)
+PERSISTENCE_FILE = "persistence.csv"
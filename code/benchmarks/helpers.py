@@ -0,0 +1,111 @@
+"""
+This module contains helper functions used by the benchmarks.
+"""
+
+import importlib.util
+import os
+import sys
+import tempfile
+from types import ModuleType
+
+
+def get_implementations(
+    generated_dir: str, challenge: str, prompts: list, iterations: int, models: list
+) -> list[tuple]:
+    """
+    Returns all generated implementations of the challenge.
+
+    Args:
+        generated_dir (str): The directory with the generated code.
+        challenge (str): The name of the challenge.
+        prompts (list): The names of the prompts.
+        iterations (int): The number of iterations.
+        models (list): The names of the models.
+
+    Returns:
+        list[tuple]: A list of (prompt_type, iteration, model, path) tuples with absolute paths.
+    """
+    return [
+        (
+            prompt_type,
+            iteration,
+            model,
+            os.path.abspath(f"{generated_dir}/{challenge}/{prompt_type}/iteration_{iteration}/{model}.py"),
+        )
+        for prompt_type in prompts
+        for iteration in range(1, iterations + 1)
+        for model in models
+    ]
+
+
+def get_reference(reference_dir: str, challenge: str) -> list[tuple]:
+    """
+    Returns the reference implementation of the challenge (if there is one) in the format of get_implementations.
+
+    Args:
+        reference_dir (str): The directory with the reference implementations.
+        challenge (str): The name of the challenge.
+
+    Returns:
+        list[tuple]: A list with the ("reference", "", "reference", path) tuple or an empty list.
+    """
+    path = os.path.abspath(f"{reference_dir}/{challenge}.py")
+    return [("reference", "", "reference", path)] if os.path.exists(path) else []
+
+
+def get_implementation_name(challenge: str, prompt_type: str, iteration, model: str) -> str:
+    """
+    Returns the readable name of the implementation.
+
+    Args:
+        challenge (str): The name of the challenge.
+        prompt_type (str): The type of the prompt ("reference" for the reference implementation).
+        iteration (int | str): The iteration number.
+        model (str): The name of the model.
+
+    Returns:
+        str: The name of the implementation (e.g. todo_list/1-zero_shot/iteration_1/chatgpt or todo_list/reference).
+    """
+    if prompt_type == "reference":
+        return f"{challenge}/reference"
+    return f"{challenge}/{prompt_type}/iteration_{iteration}/{model}"
+
+
+def load_module(path: str, name: str) -> ModuleType:
+    """
+    Imports a generated module from the given path under the given name.
+
+    Args:
+        path (str): The path to the Python file.
+        name (str): The name under which the module is registered in sys.modules.
+
+    Returns:
+        ModuleType: The imported module.
+    """
+    spec = importlib.util.spec_from_file_location(name, path)
+    module = importlib.util.module_from_spec(spec)
+    sys.modules[name] = module
+    spec.loader.exec_module(module)
+    return module
+
+
+def init_worker() -> None:
+    """
+    Prepares a worker process: the output of the implementations is discarded and the working directory
+    is changed to a temporary directory, so implementations which save data to files do not write into the repository.
+
+    Returns:
+        None
+    """
+    sys.stdout = open(os.devnull, "w")
+    os.chdir(tempfile.mkdtemp(prefix="benchmarks_"))
+
+
+def on_timeout(signum, frame) -> None:
+    """
+    Handler of SIGALRM, stops the measurement of an implementation which exceeded its time limit.
+
+    Raises:
+        TimeoutError: Always.
+    """
+    raise TimeoutError("time limit exceeded")
@@ -0,0 +1,245 @@
+"""
+This script measures the memory footprint of the generated TaskManager implementations at the scale of up to
+a million tasks. The memory allocated by adding the tasks is traced by tracemalloc (bytes per task and
+the growth curve at the checkpoints) and the stored tasks are inspected to break the footprint down
+by the parts of the record representation (collections of the manager, per-task records, texts,
+datetime fields, uuid strings or objects, numbers and other objects).
+Running: python code/benchmarks/todo_memory.py (from the root of the repository)
+Output: results/todo_list/memory_footprint.csv, results/todo_list/memory_growth.csv
+"""
+
+import csv
+import datetime
+import decimal
+import enum
+import multiprocessing
+import os
+import re
+import sys
+import time
+import tracemalloc
+import uuid
+from collections.abc import Mapping
+
+from config import (
+    GENERATED_DIR,
+    ITERATIONS,
+    MEMORY_CHECKPOINTS,
+    MEMORY_FOOTPRINT_FILE,
+    MEMORY_GROWTH_FILE,
+    MEMORY_SAMPLE_TASKS,
+    MEMORY_TIME_LIMIT,
+    MEMORY_WORKERS,
+    MODELS,
+    PROMPTS,
+    REFERENCE_DIR,
+    RESULTS_DIR,
+)
+from helpers import get_implementation_name, get_implementations, get_reference, init_worker, load_module
+
+CATEGORIES = ["container", "record", "text", "datetime", "uuid", "number", "other"]
+COLLECTIONS = (dict, list, tuple, set, frozenset)
+UUID_PATTERN = re.compile(r"[0-9a-fA-F]{8}-?[0-9a-fA-F]{4}-?[0-9a-fA-F]{4}-?[0-9a-fA-F]{4}-?[0-9a-fA-F]{12}")
+CHECK_INTERVAL = 1_000
+
+
+# Helper functions
+def get_category(value, module_name: str) -> str | None:
+    """
+    Returns the part of the record representation the object belongs to.
+
+    Args:
+        value: The stored object.
+        module_name (str): The name of the generated module (its instances are records).
+
+    Returns:
+        str | None: The category of the object or None for shared singletons (None, enum members).
+    """
+    if value is None or isinstance(value, enum.Enum):
+        return None
+    if isinstance(value, str):
+        return "uuid" if UUID_PATTERN.fullmatch(value) else "text"
+    if isinstance(value, (datetime.date, datetime.time, datetime.timedelta)):
+        return "datetime"
+    if isinstance(value, uuid.UUID):
+        return "uuid"
+    if isinstance(value, (int, float, complex, decimal.Decimal)):
+        return "number"
+    if isinstance(value, (Mapping, *COLLECTIONS)) or type(value).__module__ == module_name:
+        return "record"
+    return "other"
+
+
+def add_deep_size(value, category: str | None, module_name: str, seen: set, totals: dict, weight: float) -> None:
+    """
+    Adds the size of the object and of all objects reachable from it to the totals of the categories.
+    Collections and instances of the classes of the generated module are followed, each object is counted once.
+
+    Args:
+        value: The root object.
+        category (str | None): The category of the root object (None = determined by its type).
+        module_name (str): The name of the generated module.
+        seen (set): The ids of the already counted objects.
+        totals (dict): The sizes of the categories (updated in place).
+        weight (float): The multiplier of the sizes (the inverse of the sampling rate).
+
+    Returns:
+        None
+    """
+    stack = [(value, category)]
+    while stack:
+        value, category = stack.pop()
+        category = category or get_category(value, module_name)
+        if category is None or id(value) in seen:
+            continue
+
+        seen.add(id(value))
+        totals[category] += sys.getsizeof(value) * weight
+
+        if isinstance(value, uuid.UUID):
+            totals[category] += sys.getsizeof(value.int) * weight
+        elif isinstance(value, Mapping):
+            for key, item in value.items():
+                stack.append((key, None))
+                stack.append((item, None))
+        elif isinstance(value, COLLECTIONS):
+            stack.extend((item, None) for item in value)
+        elif type(value).__module__ == module_name:
+            if hasattr(value, "__dict__"):
+                stack.append((value.__dict__, "record"))
+            for slot in getattr(type(value), "__slots__", ()):
+                if hasattr(value, slot):
+                    stack.append((getattr(value, slot), None))
+
+
+def get_breakdown(manager, tasks: int, module_name: str) -> tuple[str, dict]:
+    """
+    Breaks the memory of the stored tasks down by the parts of the record representation.
+    Large collections are sampled (MEMORY_SAMPLE_TASKS elements) and the sizes are extrapolated.
+
+    Args:
+        manager: The TaskManager instance with the tasks.
+        tasks (int): The number of added tasks.
+        module_name (str): The name of the generated module.
+
+    Returns:
+        tuple[str, dict]: The description of the representation and the bytes per task of each category.
+    """
+    totals = dict.fromkeys(CATEGORIES, 0.0)
+    seen = {id(manager)}
+    representation = ""
+
+    for value in vars(manager).values():
+        if not isinstance(value, COLLECTIONS) or isinstance(value, (str, bytes)):
+            add_deep_size(value, None, module_name, seen, totals, 1)
+            continue
+
+        seen.add(id(value))
+        totals["container"] += sys.getsizeof(value)
+        items = list(value.items()) if isinstance(value, Mapping) else list(value)
+        step = max(len(items) // MEMORY_SAMPLE_TASKS, 1)
+        weight = len(items) / len(items[::step]) if items else 1
+
+        for item in items[::step]:
+            key, element = item if isinstance(value, Mapping) else (None, item)
+            if key is not None:
+                add_deep_size(key, "container", module_name, seen, totals, weight)
+            add_deep_size(element, None, module_name, seen, totals, weight)
+
+        if not representation and len(items) == tasks and items:
+            element = items[0][1] if isinstance(value, Mapping) else items[0]
+            representation = f"{type(value).__name__} of {type(element).__name__}"
+
+    return representation, {category: size / max(tasks, 1) for category, size in totals.items()}
+
+
+def measure_footprint(implementation: tuple) -> dict:
+    """
+    Adds up to max(MEMORY_CHECKPOINTS) tasks to a new TaskManager and traces the allocated memory.
+    Adding stops after MEMORY_TIME_LIMIT seconds, the last checkpoint is the number of tasks reached.
+
+    Args:
+        implementation (tuple): The (prompt_type, iteration, model, path) tuple.
+
+    Returns:
+        dict: The growth curve, the bytes per task and the breakdown (or the error).
+    """
+    prompt_type, iteration, model, path = implementation
+    result = {"growth": [], "tasks": 0, "bytes_per_task": "", "representation": "", "breakdown": {}, "error": ""}
+    module_name = get_implementation_name("todo_list", prompt_type, iteration, model).replace("/", "-")
+
+    try:
+        module = load_module(path, module_name)
+        tracemalloc.start()
+        baseline = tracemalloc.get_traced_memory()[0]
+        manager = module.TaskManager()
+
+        added, start = 0, time.perf_counter()
+        for checkpoint in sorted(MEMORY_CHECKPOINTS):
+            while added < checkpoint:
+                manager.add(f"task_name_{added + 1}", f"task_description_{added + 1}")
+                added += 1
+                if added % CHECK_INTERVAL == 0 and time.perf_counter() - start > MEMORY_TIME_LIMIT:
+                    break
+
+            result["growth"].append((added, tracemalloc.get_traced_memory()[0] - baseline))
+            if added < checkpoint:
+                break
+
+        tracemalloc.stop()
+        result["tasks"] = added
+        result["bytes_per_task"] = result["growth"][-1][1] / added
+        result["representation"], result["breakdown"] = get_breakdown(manager, added, module_name)
+    except Exception as error:
+        tracemalloc.stop()
+        result["error"] = f"{type(error).__name__}: {error}"[:100]
+
+    return result
+
+
+def main() -> None:
+    implementations = get_implementations(GENERATED_DIR, "todo_list", PROMPTS, ITERATIONS, MODELS)
+    implementations += get_reference(REFERENCE_DIR, "todo_list")
+    workers = min(MEMORY_WORKERS, os.cpu_count() or 1)
+
+    with multiprocessing.Pool(workers, initializer=init_worker, maxtasksperchild=1) as pool:
+        results = pool.map(measure_footprint, implementations, chunksize=1)
+
+    with open(f"{RESULTS_DIR}/todo_list/{MEMORY_FOOTPRINT_FILE}", "w", encoding="utf-8", newline="") as file:
+        writer = csv.writer(file)
+        writer.writerow(
+            ["prompt_type", "iteration", "model", "tasks", "bytes_per_task", "representation"]
+            + [f"bytes_per_task-{category}" for category in CATEGORIES]
+            + ["error"]
+        )
+        for (prompt_type, iteration, model, _), result in zip(implementations, results):
+            breakdown = [round(result["breakdown"][category], 1) if result["breakdown"] else "" for category in CATEGORIES]
+            bytes_per_task = round(result["bytes_per_task"], 1) if result["bytes_per_task"] != "" else ""
+            writer.writerow(
+                [prompt_type, iteration, model, result["tasks"], bytes_per_task, result["representation"]]
+                + breakdown
+                + [result["error"]]
+            )
+
+    with open(f"{RESULTS_DIR}/todo_list/{MEMORY_GROWTH_FILE}", "w", encoding="utf-8", newline="") as file:
+        writer = csv.writer(file)
+        writer.writerow(["prompt_type", "iteration", "model", "tasks", "traced_bytes", "bytes_per_task"])
+        for (prompt_type, iteration, model, _), result in zip(implementations, results):
+            for tasks, traced in result["growth"]:
+                writer.writerow([prompt_type, iteration, model, tasks, traced, round(traced / tasks, 1)])
+
+    measured = sorted(
+        ((result["bytes_per_task"], get_implementation_name("todo_list", prompt_type, iteration, model), result)
+        for (prompt_type, iteration, model, _), result in zip(implementations, results)
+        if result["bytes_per_task"] != ""
+    ), key=lambda item: item[0])
+    print(f"{len(measured)}/{len(implementations)} implementations measured (most compact first)")
+    for bytes_per_task, name, result in measured:
+        parts = ", ".join(
+            f"{category} {size:.0f}" for category, size in result["breakdown"].items() if round(size)
+        )
+        print(f"{name}: {bytes_per_task:.0f} B/task at {result['tasks']} tasks ({result['representation']}: {parts})")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,257 @@
+"""
+This script measures the persistence of the reference TaskManager (the operation log with snapshots,
+see TaskStore in code/reference/todo_list.py) for PERSISTENCE_TASKS tasks: the time of the modifications
+with and without the persistence, the size of the stored files and the time of the recovery (compared with
+the tasks of the manager). As the baseline every generated TaskManager (and the reference implementation
+without persistence) reloads the same tasks from a JSON export (json.load, add and finish); the reloading
+stops after PERSISTENCE_TIME_LIMIT seconds and its time is extrapolated to all tasks.
+Before the measurement the reference TaskManager is checked to recover the tasks of a process which exited
+without closing it. The implementations are measured one after another in a separate worker process.
+Running: python code/benchmarks/todo_persistence.py (from the root of the repository)
+Output: results/todo_list/persistence.csv
+"""
+
+import concurrent.futures
+import csv
+import functools
+import json
+import os
+import signal
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+
+from config import (
+    GENERATED_DIR,
+    ITERATIONS,
+    MODELS,
+    PERSISTENCE_FILE,
+    PERSISTENCE_REPEATS,
+    PERSISTENCE_TASKS,
+    PERSISTENCE_TIME_LIMIT,
+    PROMPTS,
+    REFERENCE_DIR,
+    RESULTS_DIR,
+)
+from helpers import get_implementation_name, get_implementations, get_reference, init_worker, load_module, on_timeout
+
+CHECK_INTERVAL = 1_000
+EXIT_TASKS = 10
+# adds the tasks to a persistent manager of the module and exits without close (arguments: path, directory, tasks)
+EXIT_SCRIPT = """
+import importlib.util, sys
+spec = importlib.util.spec_from_file_location("todo_list", sys.argv[1])
+module = importlib.util.module_from_spec(spec)
+spec.loader.exec_module(module)
+manager = module.TaskManager(sys.argv[2])
+for number in range(1, int(sys.argv[3]) + 1):
+    manager.add(f"task_name_{number}", f"task_description_{number}")
+"""
+
+
+# Helper functions
+def fill_manager(manager, tasks: int) -> None:
+    """
+    Adds the tasks to the manager, finishes every third task and removes every tenth task.
+
+    Args:
+        manager: The TaskManager instance.
+        tasks (int): The number of added tasks.
+
+    Returns:
+        None
+    """
+    ids = [manager.add(f"task_name_{number}", f"task_description_{number}") for number in range(1, tasks + 1)]
+    for task_id in ids[::3]:
+        manager.finish(task_id)
+    for task_id in ids[::10]:
+        manager.remove(task_id)
+
+
+def check_exit_without_close(module, path: str, directory: str) -> None:
+    """
+    Adds EXIT_TASKS tasks to the reference TaskManager in a new process which exits without close
+    and recovers them.
+
+    Args:
+        module: The reference module.
+        path (str): The path of the reference implementation.
+        directory (str): The directory of the stored files.
+
+    Returns:
+        None
+
+    Raises:
+        AssertionError: If the tasks or the number of the logged operations are not recovered.
+    """
+    subprocess.run([sys.executable, "-c", EXIT_SCRIPT, path, directory, str(EXIT_TASKS)], check=True)
+    with module.TaskManager(directory) as manager:
+        recovered = len(manager.get_all())
+        if recovered != EXIT_TASKS:
+            raise AssertionError(f"{recovered} of {EXIT_TASKS} tasks recovered after an exit without close.")
+        # the replayed operations count towards the next snapshot
+        if manager._store.operations != EXIT_TASKS:
+            raise AssertionError(f"{manager._store.operations} of {EXIT_TASKS} logged operations recovered.")
+
+
+def measure_reference(module, tasks: int, directory: str) -> dict:
+    """
+    Measures the modifications with and without the persistence and the recovery of the reference TaskManager.
+
+    Args:
+        module: The reference module.
+        tasks (int): The number of added tasks.
+        directory (str): The directory of the stored files.
+
+    Returns:
+        dict: The times of the modifications and of the recovery, the size of the files, the number
+            of the stored tasks and the exported tasks.
+
+    Raises:
+        AssertionError: If the recovered tasks differ from the tasks of the manager.
+    """
+    start = time.perf_counter()
+    manager = module.TaskManager()
+    fill_manager(manager, tasks)
+    memory_seconds = time.perf_counter() - start
+
+    start = time.perf_counter()
+    persistent = module.TaskManager(directory)
+    fill_manager(persistent, tasks)
+    persistent.close()
+    persistent_seconds = time.perf_counter() - start
+    del persistent
+
+    stored_bytes = sum(os.path.getsize(os.path.join(directory, name)) for name in os.listdir(directory))
+    times = []
+    for _ in range(PERSISTENCE_REPEATS):
+        start = time.perf_counter()
+        recovered = module.TaskManager(directory)
+        times.append(time.perf_counter() - start)
+        recovered.close()
+
+    exported = manager.get_all()
+    if recovered.get_all() != exported:
+        raise AssertionError(f"The recovered tasks differ from the {tasks} tasks of the manager.")
+    return {
+        "memory_seconds": memory_seconds,
+        "persistent_seconds": persistent_seconds,
+        "stored_bytes": stored_bytes,
+        "recovery_seconds": statistics.median(times),
+        "stored_tasks": len(exported),
+        "exported": exported,
+    }
+
+
+def measure_reload(implementation: tuple, exports: dict) -> dict:
+    """
+    Reloads every export into a new TaskManager of the implementation (json.load, add and finish).
+
+    Args:
+        implementation (tuple): The (prompt_type, iteration, model, path) tuple.
+        exports (dict): The paths of the JSON exports by the number of tasks.
+
+    Returns:
+        dict: The numbers of exported and reloaded tasks, the time and the error by the number of added tasks.
+    """
+    prompt_type, iteration, model, path = implementation
+    module_name = get_implementation_name("todo_list", prompt_type, iteration, model).replace("/", "-")
+    results = {}
+
+    try:
+        module = load_module(path, module_name)
+    except Exception as error:
+        message = f"{type(error).__name__}: {error}"[:100]
+        return {tasks: {"exported": 0, "loaded": 0, "seconds": "", "error": message} for tasks in exports}
+
+    signal.signal(signal.SIGALRM, on_timeout)
+    for tasks, export in exports.items():
+        result = {"exported": 0, "loaded": 0, "seconds": "", "error": ""}
+        signal.alarm(PERSISTENCE_TIME_LIMIT * 2)
+        try:
+            start = time.perf_counter()
+            with open(export, encoding="utf-8") as file:
+                exported = json.load(file)
+            result["exported"] = len(exported)
+            manager = module.TaskManager()
+            for task in exported:
+                task_id = manager.add(task["task_name"], task["task_description"])
+                if task["is_finished"]:
+                    manager.finish(task_id)
+                result["loaded"] += 1
+                if result["loaded"] % CHECK_INTERVAL == 0 and time.perf_counter() - start > PERSISTENCE_TIME_LIMIT:
+                    break
+            result["seconds"] = time.perf_counter() - start
+        except Exception as error:
+            result["error"] = f"{type(error).__name__}: {error}"[:100]
+        finally:
+            signal.alarm(0)
+
+        results[tasks] = result
+
+    return results
+
+
+def main() -> None:
+    implementations = get_implementations(GENERATED_DIR, "todo_list", PROMPTS, ITERATIONS, MODELS)
+    implementations += get_reference(REFERENCE_DIR, "todo_list")
+    path = os.path.abspath(f"{REFERENCE_DIR}/todo_list.py")
+    reference = load_module(path, "todo_list-persistence")
+
+    with tempfile.TemporaryDirectory(prefix="benchmarks_") as directory:
+        check_exit_without_close(reference, path, os.path.join(directory, "store_exit"))
+        persistence, exports = {}, {}
+        for tasks in PERSISTENCE_TASKS:
+            persistence[tasks] = measure_reference(reference, tasks, os.path.join(directory, f"store_{tasks}"))
+            exports[tasks] = os.path.join(directory, f"export_{tasks}.json")
+            with open(exports[tasks], "w", encoding="utf-8") as file:
+                json.dump(persistence[tasks].pop("exported"), file)
+
+        # one implementation at a time, so the timings are not affected by other measurements
+        measure = functools.partial(measure_reload, exports=exports)
+        with concurrent.futures.ProcessPoolExecutor(1, initializer=init_worker) as executor:
+            results = list(executor.map(measure, implementations))
+
+    with open(f"{RESULTS_DIR}/todo_list/{PERSISTENCE_FILE}", "w", encoding="utf-8", newline="") as file:
+        writer = csv.writer(file)
+        writer.writerow(
+            ["prompt_type", "iteration", "model", "mode", "tasks", "stored_tasks", "loaded_tasks", "seconds",
+             "estimated_seconds", "speedup", "error"]
+        )
+        # the speedup of the recovery over reloading the export (estimated for all tasks)
+        for tasks, measured in persistence.items():
+            writer.writerow(
+                ["reference", "", "reference", "recover", tasks, measured["stored_tasks"], measured["stored_tasks"],
+                 round(measured["recovery_seconds"], 4), round(measured["recovery_seconds"], 4), 1.0, ""]
+            )
+        for (prompt_type, iteration, model, _), result in zip(implementations, results):
+            for tasks, reload in result.items():
+                estimated = ""
+                if reload["seconds"] != "" and reload["loaded"]:
+                    estimated = reload["seconds"] * reload["exported"] / reload["loaded"]
+                writer.writerow(
+                    [prompt_type, iteration, model, "reload_export", tasks, reload["exported"], reload["loaded"],
+                     round(reload["seconds"], 4) if reload["seconds"] != "" else "",
+                     round(estimated, 4) if estimated != "" else "",
+                     round(estimated / persistence[tasks]["recovery_seconds"], 1) if estimated != "" else "",
+                     reload["error"]]
+                )
+
+    for tasks, measured in persistence.items():
+        reloads = [
+            result[tasks]["seconds"] * result[tasks]["exported"] / result[tasks]["loaded"]
+            for result in results
+            if result[tasks]["seconds"] != "" and result[tasks]["loaded"]
+        ]
+        median = f"{statistics.median(reloads):.2f} s" if reloads else "-"
+        print(
+            f"{tasks} tasks: modifications {measured['memory_seconds']:.2f} s in memory, "
+            f"{measured['persistent_seconds']:.2f} s persisted ({measured['stored_bytes'] / 2**20:.1f} MB stored), "
+            f"recovery {measured['recovery_seconds']:.3f} s, median reload of the export {median}"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -143,6 +143,120 @@ CHALLENGES = {
                     }
                 ],
             },
+            {
+                "file": "7_performance_efficiency-CPU-{model}.txt",
+                "columns": [
+                    "performance_efficiency-CPU-calculate_add-process_time",
+                    "performance_efficiency-CPU-calculate_add-thread_time",
+                    "performance_efficiency-CPU-calculate_subtract-process_time",
+                    "performance_efficiency-CPU-calculate_subtract-thread_time",
+                    "performance_efficiency-CPU-calculate_multiply-process_time",
+                    "performance_efficiency-CPU-calculate_multiply-thread_time",
+                    "performance_efficiency-CPU-calculate_divide-process_time",
+                    "performance_efficiency-CPU-calculate_divide-thread_time",
+                    "performance_efficiency-CPU-calculate_composite-process_time",
+                    "performance_efficiency-CPU-calculate_composite-thread_time",
+                ],
+                "regex": [
+                    {
+                        "type": "float_multiple",
+                        "expected_rows": 1,
+                        "expected_columns": 4,
+                        "rule": r"CPU clock - calculate \(1974349\+7972327\): Process time = (\d+).(\d+)s, Thread time = (\d+).(\d+)s\n",
+                    },
+                    {
+                        "type": "float_multiple",
+                        "expected_rows": 1,
+                        "expected_columns": 4,
+                        "rule": r"CPU clock - calculate \(1974349\-7972327\): Process time = (\d+).(\d+)s, Thread time = (\d+).(\d+)s\n",
+                    },
+                    {
+                        "type": "float_multiple",
+                        "expected_rows": 1,
+                        "expected_columns": 4,
+                        "rule": r"CPU clock - calculate \(1974349\*7972327\): Process time = (\d+).(\d+)s, Thread time = (\d+).(\d+)s\n",
+                    },
+                    {
+                        "type": "float_multiple",
+                        "expected_rows": 1,
+                        "expected_columns": 4,
+                        "rule": r"CPU clock - calculate \(1974349\/7972327\): Process time = (\d+).(\d+)s, Thread time = (\d+).(\d+)s\n",
+                    },
+                    {
+                        "type": "float_multiple",
+                        "expected_rows": 1,
+                        "expected_columns": 4,
+                        "rule": r"CPU clock - calculate \(1974349\+7972327\-1974349\*7972327\/964\): Process time = (\d+).(\d+)s, Thread time = (\d+).(\d+)s\n",
+                    }
+                ],
+            },
+            {
+                "file": "7_performance_efficiency-CPU-{model}.txt",
+                "columns": [
+                    "performance_efficiency-CPU-calculate_add-minor_page_faults",
+                    "performance_efficiency-CPU-calculate_add-major_page_faults",
+                    "performance_efficiency-CPU-calculate_add-voluntary_context_switches",
+                    "performance_efficiency-CPU-calculate_add-involuntary_context_switches",
+                    "performance_efficiency-CPU-calculate_add-max_rss",
+                    "performance_efficiency-CPU-calculate_add-max_rss_growth",
+                    "performance_efficiency-CPU-calculate_subtract-minor_page_faults",
+                    "performance_efficiency-CPU-calculate_subtract-major_page_faults",
+                    "performance_efficiency-CPU-calculate_subtract-voluntary_context_switches",
+                    "performance_efficiency-CPU-calculate_subtract-involuntary_context_switches",
+                    "performance_efficiency-CPU-calculate_subtract-max_rss",
+                    "performance_efficiency-CPU-calculate_subtract-max_rss_growth",
+                    "performance_efficiency-CPU-calculate_multiply-minor_page_faults",
+                    "performance_efficiency-CPU-calculate_multiply-major_page_faults",
+                    "performance_efficiency-CPU-calculate_multiply-voluntary_context_switches",
+                    "performance_efficiency-CPU-calculate_multiply-involuntary_context_switches",
+                    "performance_efficiency-CPU-calculate_multiply-max_rss",
+                    "performance_efficiency-CPU-calculate_multiply-max_rss_growth",
+                    "performance_efficiency-CPU-calculate_divide-minor_page_faults",
+                    "performance_efficiency-CPU-calculate_divide-major_page_faults",
+                    "performance_efficiency-CPU-calculate_divide-voluntary_context_switches",
+                    "performance_efficiency-CPU-calculate_divide-involuntary_context_switches",
+                    "performance_efficiency-CPU-calculate_divide-max_rss",
+                    "performance_efficiency-CPU-calculate_divide-max_rss_growth",
+                    "performance_efficiency-CPU-calculate_composite-minor_page_faults",
+                    "performance_efficiency-CPU-calculate_composite-major_page_faults",
+                    "performance_efficiency-CPU-calculate_composite-voluntary_context_switches",
+                    "performance_efficiency-CPU-calculate_composite-involuntary_context_switches",
+                    "performance_efficiency-CPU-calculate_composite-max_rss",
+                    "performance_efficiency-CPU-calculate_composite-max_rss_growth",
+                ],
+                "regex": [
+                    {
+                        "type": "int_multiple",
+                        "expected_rows": 1,
+                        "expected_columns": 6,
+                        "rule": r"OS counters - calculate \(1974349\+7972327\): Minor page faults = (\d+), Major page faults = (\d+), Voluntary context switches = (\d+), Involuntary context switches = (\d+), Max RSS = (\d+) KB, Max RSS growth = (-?\d+) KB",
+                    },
+                    {
+                        "type": "int_multiple",
+                        "expected_rows": 1,
+                        "expected_columns": 6,
+                        "rule": r"OS counters - calculate \(1974349\-7972327\): Minor page faults = (\d+), Major page faults = (\d+), Voluntary context switches = (\d+), Involuntary context switches = (\d+), Max RSS = (\d+) KB, Max RSS growth = (-?\d+) KB",
+                    },
+                    {
+                        "type": "int_multiple",
+                        "expected_rows": 1,
+                        "expected_columns": 6,
+                        "rule": r"OS counters - calculate \(1974349\*7972327\): Minor page faults = (\d+), Major page faults = (\d+), Voluntary context switches = (\d+), Involuntary context switches = (\d+), Max RSS = (\d+) KB, Max RSS growth = (-?\d+) KB",
+                    },
+                    {
+                        "type": "int_multiple",
+                        "expected_rows": 1,
+                        "expected_columns": 6,
+                        "rule": r"OS counters - calculate \(1974349\/7972327\): Minor page faults = (\d+), Major page faults = (\d+), Voluntary context switches = (\d+), Involuntary context switches = (\d+), Max RSS = (\d+) KB, Max RSS growth = (-?\d+) KB",
+                    },
+                    {
+                        "type": "int_multiple",
+                        "expected_rows": 1,
+                        "expected_columns": 6,
+                        "rule": r"OS counters - calculate \(1974349\+7972327\-1974349\*7972327\/964\): Minor page faults = (\d+), Major page faults = (\d+), Voluntary context switches = (\d+), Involuntary context switches = (\d+), Max RSS = (\d+) KB, Max RSS growth = (-?\d+) KB",
+                    }
+                ],
+            },
             {
                 "file": "8_performance_efficiency-RAM-{model}.txt",
                 "columns": [
@@ -190,6 +304,83 @@ CHALLENGES = {
                 ]
                     
             },
+            {
+                "file": "10_import_time-{model}.txt",
+                "columns": [
+                    "import_time",
+                    "import_time-self",
+                    "import_time-re",
+                    "import_time-typing",
+                    "import_time-enum",
+                    "import_time-decimal",
+                    "import_time-collections",
+                    "import_time-unittest",
+                ],
+                "regex": [
+                    {
+                        "type": "int",
+                        "rule": r"Import time: (\d+) us",
+                    },
+                    {
+                        "type": "int",
+                        "rule": r"Self import time: (\d+) us",
+                    },
+                    {
+                        "type": "int",
+                        "rule": r"Import time of re: (\d+) us",
+                    },
+                    {
+                        "type": "int",
+                        "rule": r"Import time of typing: (\d+) us",
+                    },
+                    {
+                        "type": "int",
+                        "rule": r"Import time of enum: (\d+) us",
+                    },
+                    {
+                        "type": "int",
+                        "rule": r"Import time of decimal: (\d+) us",
+                    },
+                    {
+                        "type": "int",
+                        "rule": r"Import time of collections: (\d+) us",
+                    },
+                    {
+                        "type": "int",
+                        "rule": r"Import time of unittest: (\d+) us",
+                    }
+                ],
+            },
+            {
+                "file": "duplicates-{model}.txt",
+                "columns": ["duplicate_cluster", "duplicate_cluster-size", "duplicate_cluster-nearest_similarity"],
+                "regex": [
+                    {
+                        "type": "int",
+                        "rule": r"Duplicate cluster: (\d+)"
+                    },
+                    {
+                        "type": "int",
+                        "rule": r"Cluster size: (\d+)"
+                    },
+                    {
+                        "type": "float",
+                        "rule": r"Nearest similarity: (\d+)\.(\d+)"
+                    }
+                ],
+            },
+            {
+                "file": "antipatterns-{model}.txt",
+                "columns": [
+                    "antipatterns-regex_per_call_in_tokenize",
+                ],
+                "regex": [
+                    {
+                        "type": "int",
+                        "rule": r"Number of regex_per_call_in_tokenize: (\d+)"
+                    },
+                ],
+            },
         ]
     },
     "todo_list": {
@@ -321,6 +512,128 @@ CHALLENGES = {
                     }
                 ],
             },
+            {
+                "file": "7_performance_efficiency-CPU-{model}.txt",
+                "columns": [
+                    "performance_efficiency-CPU-add_task-process_time",
+                    "performance_efficiency-CPU-add_task-thread_time",
+                    "performance_efficiency-CPU-get_all_tasks-process_time",
+                    "performance_efficiency-CPU-get_all_tasks-thread_time",
+                    "performance_efficiency-CPU-search_task-by_name-process_time",
+                    "performance_efficiency-CPU-search_task-by_name-thread_time",
+                    "performance_efficiency-CPU-search_task-by_description-process_time",
+                    "performance_efficiency-CPU-search_task-by_description-thread_time",
+                    "performance_efficiency-CPU-finish_task-process_time",
+                    "performance_efficiency-CPU-finish_task-thread_time",
+                    "performance_efficiency-CPU-remove_task-process_time",
+                    "performance_efficiency-CPU-remove_task-thread_time",
+                ],
+                "regex": [
+                    {
+                        "type": "float_multiple",
+                        "expected_rows": 1,
+                        "expected_columns": 4,
+                        "rule": r"CPU clock - add: Process time = (\d+).(\d+)s, Thread time = (\d+).(\d+)s\n",
+                    },
+                    {
+                        "type": "float_multiple",
+                        "expected_rows": 1,
+                        "expected_columns": 4,
+                        "rule": r"CPU clock - get_all: Process time = (\d+).(\d+)s, Thread time = (\d+).(\d+)s\n",
+                    },
+                    {
+                        "type": "float_multiple",
+                        "expected_rows": 2,
+                        "expected_columns": 4,
+                        "rule": r"CPU clock - search: Process time = (\d+).(\d+)s, Thread time = (\d+).(\d+)s\n",
+                    },
+                    {
+                        "type": "float_multiple",
+                        "expected_rows": 1,
+                        "expected_columns": 4,
+                        "rule": r"CPU clock - finish: Process time = (\d+).(\d+)s, Thread time = (\d+).(\d+)s\n",
+                    },
+                    {
+                        "type": "float_multiple",
+                        "expected_rows": 1,
+                        "expected_columns": 4,
+                        "rule": r"CPU clock - remove: Process time = (\d+).(\d+)s, Thread time = (\d+).(\d+)s\n",
+                    }
+                ],
+            },
+            {
+                "file": "7_performance_efficiency-CPU-{model}.txt",
+                "columns": [
+                    "performance_efficiency-CPU-add_task-minor_page_faults",
+                    "performance_efficiency-CPU-add_task-major_page_faults",
+                    "performance_efficiency-CPU-add_task-voluntary_context_switches",
+                    "performance_efficiency-CPU-add_task-involuntary_context_switches",
+                    "performance_efficiency-CPU-add_task-max_rss",
+                    "performance_efficiency-CPU-add_task-max_rss_growth",
+                    "performance_efficiency-CPU-get_all_tasks-minor_page_faults",
+                    "performance_efficiency-CPU-get_all_tasks-major_page_faults",
+                    "performance_efficiency-CPU-get_all_tasks-voluntary_context_switches",
+                    "performance_efficiency-CPU-get_all_tasks-involuntary_context_switches",
+                    "performance_efficiency-CPU-get_all_tasks-max_rss",
+                    "performance_efficiency-CPU-get_all_tasks-max_rss_growth",
+                    "performance_efficiency-CPU-search_task-by_name-minor_page_faults",
+                    "performance_efficiency-CPU-search_task-by_name-major_page_faults",
+                    "performance_efficiency-CPU-search_task-by_name-voluntary_context_switches",
+                    "performance_efficiency-CPU-search_task-by_name-involuntary_context_switches",
+                    "performance_efficiency-CPU-search_task-by_name-max_rss",
+                    "performance_efficiency-CPU-search_task-by_name-max_rss_growth",
+                    "performance_efficiency-CPU-search_task-by_description-minor_page_faults",
+                    "performance_efficiency-CPU-search_task-by_description-major_page_faults",
+                    "performance_efficiency-CPU-search_task-by_description-voluntary_context_switches",
+                    "performance_efficiency-CPU-search_task-by_description-involuntary_context_switches",
+                    "performance_efficiency-CPU-search_task-by_description-max_rss",
+                    "performance_efficiency-CPU-search_task-by_description-max_rss_growth",
+                    "performance_efficiency-CPU-finish_task-minor_page_faults",
+                    "performance_efficiency-CPU-finish_task-major_page_faults",
+                    "performance_efficiency-CPU-finish_task-voluntary_context_switches",
+                    "performance_efficiency-CPU-finish_task-involuntary_context_switches",
+                    "performance_efficiency-CPU-finish_task-max_rss",
+                    "performance_efficiency-CPU-finish_task-max_rss_growth",
+                    "performance_efficiency-CPU-remove_task-minor_page_faults",
+                    "performance_efficiency-CPU-remove_task-major_page_faults",
+                    "performance_efficiency-CPU-remove_task-voluntary_context_switches",
+                    "performance_efficiency-CPU-remove_task-involuntary_context_switches",
+                    "performance_efficiency-CPU-remove_task-max_rss",
+                    "performance_efficiency-CPU-remove_task-max_rss_growth",
+                ],
+                "regex": [
+                    {
+                        "type": "int_multiple",
+                        "expected_rows": 1,
+                        "expected_columns": 6,
+                        "rule": r"OS counters - add: Minor page faults = (\d+), Major page faults = (\d+), Voluntary context switches = (\d+), Involuntary context switches = (\d+), Max RSS = (\d+) KB, Max RSS growth = (-?\d+) KB",
+                    },
+                    {
+                        "type": "int_multiple",
+                        "expected_rows": 1,
+                        "expected_columns": 6,
+                        "rule": r"OS counters - get_all: Minor page faults = (\d+), Major page faults = (\d+), Voluntary context switches = (\d+), Involuntary context switches = (\d+), Max RSS = (\d+) KB, Max RSS growth = (-?\d+) KB",
+                    },
+                    {
+                        "type": "int_multiple",
+                        "expected_rows": 2,
+                        "expected_columns": 6,
+                        "rule": r"OS counters - search: Minor page faults = (\d+), Major page faults = (\d+), Voluntary context switches = (\d+), Involuntary context switches = (\d+), Max RSS = (\d+) KB, Max RSS growth = (-?\d+) KB",
+                    },
+                    {
+                        "type": "int_multiple",
+                        "expected_rows": 1,
+                        "expected_columns": 6,
+                        "rule": r"OS counters - finish: Minor page faults = (\d+), Major page faults = (\d+), Voluntary context switches = (\d+), Involuntary context switches = (\d+), Max RSS = (\d+) KB, Max RSS growth = (-?\d+) KB",
+                    },
+                    {
+                        "type": "int_multiple",
+                        "expected_rows": 1,
+                        "expected_columns": 6,
+                        "rule": r"OS counters - remove: Minor page faults = (\d+), Major page faults = (\d+), Voluntary context switches = (\d+), Involuntary context switches = (\d+), Max RSS = (\d+) KB, Max RSS growth = (-?\d+) KB",
+                    }
+                ],
+            },
             {
                 "file": "8_performance_efficiency-RAM-{model}.txt",
                 "columns": ["performance_efficiency-RAM-add_task", "performance_efficiency-RAM-get_all_tasks", "performance_efficiency-RAM-search_task", "performance_efficiency-RAM-search_task-by_name", "performance_efficiency-RAM-search_task-by_description", "performance_efficiency-RAM-remove_task"],
@@ -364,6 +677,103 @@ CHALLENGES = {
                 ]
                     
             },
+            {
+                "file": "10_import_time-{model}.txt",
+                "columns": [
+                    "import_time",
+                    "import_time-self",
+                    "import_time-typing",
+                    "import_time-datetime",
+                    "import_time-re",
+                    "import_time-uuid",
+                    "import_time-time",
+                    "import_time-unittest",
+                ],
+                "regex": [
+                    {
+                        "type": "int",
+                        "rule": r"Import time: (\d+) us",
+                    },
+                    {
+                        "type": "int",
+                        "rule": r"Self import time: (\d+) us",
+                    },
+                    {
+                        "type": "int",
+                        "rule": r"Import time of typing: (\d+) us",
+                    },
+                    {
+                        "type": "int",
+                        "rule": r"Import time of datetime: (\d+) us",
+                    },
+                    {
+                        "type": "int",
+                        "rule": r"Import time of re: (\d+) us",
+                    },
+                    {
+                        "type": "int",
+                        "rule": r"Import time of uuid: (\d+) us",
+                    },
+                    {
+                        "type": "int",
+                        "rule": r"Import time of time: (\d+) us",
+                    },
+                    {
+                        "type": "int",
+                        "rule": r"Import time of unittest: (\d+) us",
+                    }
+                ],
+            },
+            {
+                "file": "duplicates-{model}.txt",
+                "columns": ["duplicate_cluster", "duplicate_cluster-size", "duplicate_cluster-nearest_similarity"],
+                "regex": [
+                    {
+                        "type": "int",
+                        "rule": r"Duplicate cluster: (\d+)"
+                    },
+                    {
+                        "type": "int",
+                        "rule": r"Cluster size: (\d+)"
+                    },
+                    {
+                        "type": "float",
+                        "rule": r"Nearest similarity: (\d+)\.(\d+)"
+                    }
+                ],
+            },
+            {
+                "file": "antipatterns-{model}.txt",
+                "columns": [
+                    "antipatterns-list_remove_in_loop",
+                    "antipatterns-list_membership_in_loop",
+                    "antipatterns-linear_scan_in_search",
+                    "antipatterns-case_conversion_in_search_loop",
+                    "antipatterns-linear_scan_by_id",
+                ],
+                "regex": [
+                    {
+                        "type": "int",
+                        "rule": r"Number of list_remove_in_loop: (\d+)"
+                    },
+                    {
+                        "type": "int",
+                        "rule": r"Number of list_membership_in_loop: (\d+)"
+                    },
+                    {
+                        "type": "int",
+                        "rule": r"Number of linear_scan_in_search: (\d+)"
+                    },
+                    {
+                        "type": "int",
+                        "rule": r"Number of case_conversion_in_search_loop: (\d+)"
+                    },
+                    {
+                        "type": "int",
+                        "rule": r"Number of linear_scan_by_id: (\d+)"
+                    },
+                ],
+            },
         ]
     },
     "ascii_art": {
@@ -510,6 +920,120 @@ CHALLENGES = {
                     }
                 ],
             },
+            {
+                "file": "7_performance_efficiency-CPU-{model}.txt",
+                "columns": [
+                    "performance_efficiency-CPU-draw_square-process_time",
+                    "performance_efficiency-CPU-draw_square-thread_time",
+                    "performance_efficiency-CPU-draw_rectangle-process_time",
+                    "performance_efficiency-CPU-draw_rectangle-thread_time",
+                    "performance_efficiency-CPU-draw_parallelogram-process_time",
+                    "performance_efficiency-CPU-draw_parallelogram-thread_time",
+                    "performance_efficiency-CPU-draw_triangle-process_time",
+                    "performance_efficiency-CPU-draw_triangle-thread_time",
+                    "performance_efficiency-CPU-draw_pyramid-process_time",
+                    "performance_efficiency-CPU-draw_pyramid-thread_time",
+                ],
+                "regex": [
+                    {
+                        "type": "float_multiple",
+                        "expected_rows": 1,
+                        "expected_columns": 4,
+                        "rule": r"CPU clock - draw_square: Process time = (\d+).(\d+)s, Thread time = (\d+).(\d+)s\n",
+                    },
+                    {
+                        "type": "float_multiple",
+                        "expected_rows": 1,
+                        "expected_columns": 4,
+                        "rule": r"CPU clock - draw_rectangle: Process time = (\d+).(\d+)s, Thread time = (\d+).(\d+)s\n",
+                    },
+                    {
+                        "type": "float_multiple",
+                        "expected_rows": 1,
+                        "expected_columns": 4,
+                        "rule": r"CPU clock - draw_parallelogram: Process time = (\d+).(\d+)s, Thread time = (\d+).(\d+)s\n",
+                    },
+                    {
+                        "type": "float_multiple",
+                        "expected_rows": 1,
+                        "expected_columns": 4,
+                        "rule": r"CPU clock - draw_triangle: Process time = (\d+).(\d+)s, Thread time = (\d+).(\d+)s\n",
+                    },
+                    {
+                        "type": "float_multiple",
+                        "expected_rows": 1,
+                        "expected_columns": 4,
+                        "rule": r"CPU clock - draw_pyramid: Process time = (\d+).(\d+)s, Thread time = (\d+).(\d+)s\n",
+                    }
+                ],
+            },
+            {
+                "file": "7_performance_efficiency-CPU-{model}.txt",
+                "columns": [
+                    "performance_efficiency-CPU-draw_square-minor_page_faults",
+                    "performance_efficiency-CPU-draw_square-major_page_faults",
+                    "performance_efficiency-CPU-draw_square-voluntary_context_switches",
+                    "performance_efficiency-CPU-draw_square-involuntary_context_switches",
+                    "performance_efficiency-CPU-draw_square-max_rss",
+                    "performance_efficiency-CPU-draw_square-max_rss_growth",
+                    "performance_efficiency-CPU-draw_rectangle-minor_page_faults",
+                    "performance_efficiency-CPU-draw_rectangle-major_page_faults",
+                    "performance_efficiency-CPU-draw_rectangle-voluntary_context_switches",
+                    "performance_efficiency-CPU-draw_rectangle-involuntary_context_switches",
+                    "performance_efficiency-CPU-draw_rectangle-max_rss",
+                    "performance_efficiency-CPU-draw_rectangle-max_rss_growth",
+                    "performance_efficiency-CPU-draw_parallelogram-minor_page_faults",
+                    "performance_efficiency-CPU-draw_parallelogram-major_page_faults",
+                    "performance_efficiency-CPU-draw_parallelogram-voluntary_context_switches",
+                    "performance_efficiency-CPU-draw_parallelogram-involuntary_context_switches",
+                    "performance_efficiency-CPU-draw_parallelogram-max_rss",
+                    "performance_efficiency-CPU-draw_parallelogram-max_rss_growth",
+                    "performance_efficiency-CPU-draw_triangle-minor_page_faults",
+                    "performance_efficiency-CPU-draw_triangle-major_page_faults",
+                    "performance_efficiency-CPU-draw_triangle-voluntary_context_switches",
+                    "performance_efficiency-CPU-draw_triangle-involuntary_context_switches",
+                    "performance_efficiency-CPU-draw_triangle-max_rss",
+                    "performance_efficiency-CPU-draw_triangle-max_rss_growth",
+                    "performance_efficiency-CPU-draw_pyramid-minor_page_faults",
+                    "performance_efficiency-CPU-draw_pyramid-major_page_faults",
+                    "performance_efficiency-CPU-draw_pyramid-voluntary_context_switches",
+                    "performance_efficiency-CPU-draw_pyramid-involuntary_context_switches",
+                    "performance_efficiency-CPU-draw_pyramid-max_rss",
+                    "performance_efficiency-CPU-draw_pyramid-max_rss_growth",
+                ],
+                "regex": [
+                    {
+                        "type": "int_multiple",
+                        "expected_rows": 1,
+                        "expected_columns": 6,
+                        "rule": r"OS counters - draw_square: Minor page faults = (\d+), Major page faults = (\d+), Voluntary context switches = (\d+), Involuntary context switches = (\d+), Max RSS = (\d+) KB, Max RSS growth = (-?\d+) KB",
+                    },
+                    {
+                        "type": "int_multiple",
+                        "expected_rows": 1,
+                        "expected_columns": 6,
+                        "rule": r"OS counters - draw_rectangle: Minor page faults = (\d+), Major page faults = (\d+), Voluntary context switches = (\d+), Involuntary context switches = (\d+), Max RSS = (\d+) KB, Max RSS growth = (-?\d+) KB",
+                    },
+                    {
+                        "type": "int_multiple",
+                        "expected_rows": 1,
+                        "expected_columns": 6,
+                        "rule": r"OS counters - draw_parallelogram: Minor page faults = (\d+), Major page faults = (\d+), Voluntary context switches = (\d+), Involuntary context switches = (\d+), Max RSS = (\d+) KB, Max RSS growth = (-?\d+) KB",
+                    },
+                    {
+                        "type": "int_multiple",
+                        "expected_rows": 1,
+                        "expected_columns": 6,
+                        "rule": r"OS counters - draw_triangle: Minor page faults = (\d+), Major page faults = (\d+), Voluntary context switches = (\d+), Involuntary context switches = (\d+), Max RSS = (\d+) KB, Max RSS growth = (-?\d+) KB",
+                    },
+                    {
+                        "type": "int_multiple",
+                        "expected_rows": 1,
+                        "expected_columns": 6,
+                        "rule": r"OS counters - draw_pyramid: Minor page faults = (\d+), Major page faults = (\d+), Voluntary context switches = (\d+), Involuntary context switches = (\d+), Max RSS = (\d+) KB, Max RSS growth = (-?\d+) KB",
+                    }
+                ],
+            },
             {
                 "file": "8_performance_efficiency-RAM-{model}.txt",
                 "columns": [
@@ -557,6 +1081,63 @@ CHALLENGES = {
                 ]
                     
             },
+            {
+                "file": "10_import_time-{model}.txt",
+                "columns": [
+                    "import_time",
+                    "import_time-self",
+                    "import_time-math",
+                    "import_time-typing",
+                ],
+                "regex": [
+                    {
+                        "type": "int",
+                        "rule": r"Import time: (\d+) us",
+                    },
+                    {
+                        "type": "int",
+                        "rule": r"Self import time: (\d+) us",
+                    },
+                    {
+                        "type": "int",
+                        "rule": r"Import time of math: (\d+) us",
+                    },
+                    {
+                        "type": "int",
+                        "rule": r"Import time of typing: (\d+) us",
+                    }
+                ],
+            },
+            {
+                "file": "duplicates-{model}.txt",
+                "columns": ["duplicate_cluster", "duplicate_cluster-size", "duplicate_cluster-nearest_similarity"],
+                "regex": [
+                    {
+                        "type": "int",
+                        "rule": r"Duplicate cluster: (\d+)"
+                    },
+                    {
+                        "type": "int",
+                        "rule": r"Cluster size: (\d+)"
+                    },
+                    {
+                        "type": "float",
+                        "rule": r"Nearest similarity: (\d+)\.(\d+)"
+                    }
+                ],
+            },
+            {
+                "file": "antipatterns-{model}.txt",
+                "columns": [
+                    "antipatterns-string_concatenation_in_loop",
+                ],
+                "regex": [
+                    {
+                        "type": "int",
+                        "rule": r"Number of string_concatenation_in_loop: (\d+)"
+                    },
+                ],
+            },
         ]
     },
 }
@@ -574,11 +1155,15 @@ PROMPTS = [
 # MODELS - list of models used in scraper
 MODELS = ["chatgpt", "claude", "gemini"]
 
+# BASELINE_MODELS - list of reference implementations (rows are added only for the iterations with their results)
+BASELINE_MODELS = ["reference"]
+
 # MODEL_DETAILS - dictionary with model details (added to the results csv)
 MODEL_DETAILS = {
     "chatgpt": {"provider": "OpenAI", "model": "o3-mini-high"},
     "claude": {"provider": "Anthropic", "model": "Claude 3.7 Sonnet"},
     "gemini": {"provider": "Google", "model": "Gemini 2.0 Pro Experimental"},
+    "reference": {"provider": "Baseline", "model": "Reference implementation"},
 }
 
 # ITERATIONS - number of iterations used in scraper
@@ -1,7 +1,7 @@
 import re
 from os import path
 
-from config import ITERATIONS, MODELS, MODEL_DETAILS, PROMPTS, RESULTS_DIR, CHALLENGES
+from config import BASELINE_MODELS, ITERATIONS, MODELS, MODEL_DETAILS, PROMPTS, RESULTS_DIR, CHALLENGES
 
 
 # Helper functions
@@ -124,6 +124,38 @@ def process_regex(file_path: str, rule: dict, buffer: list[str], buffer_header:
                     for _ in range(expected_floats):
                         buffer.append("")
 
+        elif regex["type"] == "int_multiple":
+            matches = get_all_search_matches(content, regex["rule"])
+            if len(matches) == regex["expected_rows"]:
+                for match in matches:
+                    if len(match) == regex["expected_columns"]:
+                        for value in match:
+                            buffer.append(int(value))
+                    else:
+                        for _ in range(regex["expected_columns"]):
+                            buffer.append("")
+            else:
+                for _ in range(regex["expected_rows"] * regex["expected_columns"]):
+                    buffer.append("")
+
+
+def has_results(challenge: str, prompt_type: str, iteration: int, model: str) -> bool:
+    """
+    Checks whether at least one result file of the model exists in the iteration directory.
+
+    Args:
+        challenge (str): The name of the challenge.
+        prompt_type (str): The type of the prompt.
+        iteration (int): The iteration number.
+        model (str): The name of the model.
+
+    Returns:
+        bool: True if the model has some results in the iteration, False otherwise.
+    """
+    return any(
+        path.exists(f"{RESULTS_DIR}/{challenge}/{prompt_type}/iteration_{iteration}/{rule['file'].replace('{model}', model)}")
+        for rule in CHALLENGES[challenge]["regex_rules"]
+    )
 
 
 def main() -> None:
@@ -134,7 +166,10 @@ def main() -> None:
 
         for prompt_type in PROMPTS:
             for iteration in range(1, ITERATIONS + 1):
-                for model in MODELS:
+                for model in MODELS + BASELINE_MODELS:
+                    if model in BASELINE_MODELS and not has_results(challenge, prompt_type, iteration, model):
+                        continue
+
                     BUFFER = [
                         challenge,
                         MODEL_DETAILS[model]["provider"],
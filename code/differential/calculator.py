@@ -0,0 +1,460 @@
+"""
+This script feeds the same randomly generated expressions to every generated Calculator and compares
+the outcomes (the returned value or the type of the raised exception).
+The implementations are clustered by their behaviour (implementations with the same outcome of every
+expression form one cluster) and for every cluster the shortest expression on which it disagrees with
+the majority of the implementations is found and shrunk.
+The expressions are split into batches, every batch is evaluated by all implementations in one worker process.
+Running: python code/differential/calculator.py (from the root of the repository)
+Output: results/calculator/differential_clusters.csv, results/calculator/differential_inputs.csv
+"""
+
+import csv
+import hashlib
+import multiprocessing
+import os
+import random
+import re
+import time
+from collections import Counter, defaultdict
+
+from config import (
+    CALCULATOR_BATCH_SIZE,
+    CALCULATOR_CLUSTERS_FILE,
+    CALCULATOR_EXPRESSIONS,
+    CALCULATOR_INPUTS_FILE,
+    CALCULATOR_INVALID_RATE,
+    CALCULATOR_MAX_DEPTH,
+    CALCULATOR_SEED,
+    CALCULATOR_SHRINK_ROUNDS,
+    CALCULATOR_TIMEOUT,
+    GENERATED_DIR,
+    ITERATIONS,
+    MODELS,
+    PROMPTS,
+    RESULTS_DIR,
+    WORKERS,
+)
+from helpers import EvaluationTimeout, call_with_timeout, get_implementations, get_outcome, init_worker, load_module
+
+
+OPERATORS = "+-*/"
+
+# characters inserted into the broken expressions
+NOISE = "+-*/().a "
+
+# state of a worker process (set by init_calculator_worker)
+IMPLEMENTATIONS = []
+CLASSES = {}
+
+
+# Expression generator
+def generate_number(rng: random.Random) -> str:
+    """
+    Generates a random non-negative number (integer or decimal).
+
+    Args:
+        rng (random.Random): The random generator.
+
+    Returns:
+        str: The number.
+    """
+    kind = rng.random()
+    if kind < 0.6:
+        return str(rng.randint(0, 10 ** rng.randint(1, 7)))
+    if kind < 0.9:
+        return f"{rng.randint(0, 1000)}.{rng.randint(0, 999)}"
+    return rng.choice(["0", "1", "0.5", "10"])
+
+
+def generate_operand(rng: random.Random, depth: int) -> str:
+    """
+    Generates a random operand: a number, a negative number or an expression in parentheses.
+
+    Args:
+        rng (random.Random): The random generator.
+        depth (int): The remaining nesting of the parentheses.
+
+    Returns:
+        str: The operand.
+    """
+    kind = rng.random()
+    if depth > 0 and kind < 0.25:
+        return f"({generate_expression(rng, depth - 1)})"
+    if kind < 0.35:
+        return f"-{generate_number(rng)}"
+    return generate_number(rng)
+
+
+def generate_expression(rng: random.Random, depth: int) -> str:
+    """
+    Generates a random valid expression.
+
+    Args:
+        rng (random.Random): The random generator.
+        depth (int): The maximum nesting of the parentheses.
+
+    Returns:
+        str: The expression.
+    """
+    parts = [generate_operand(rng, depth)]
+    for _ in range(rng.randint(0, 3)):
+        parts.append(rng.choice(OPERATORS))
+        parts.append(generate_operand(rng, depth))
+
+    return (" " if rng.random() < 0.2 else "").join(parts)
+
+
+def break_expression(rng: random.Random, expression: str) -> str:
+    """
+    Breaks the expression by deleting, duplicating or inserting one character.
+
+    Args:
+        rng (random.Random): The random generator.
+        expression (str): The valid expression.
+
+    Returns:
+        str: The (most likely) invalid expression.
+    """
+    position = rng.randrange(len(expression))
+    kind = rng.randrange(3)
+    if kind == 0:
+        return expression[:position] + expression[position + 1 :]
+    if kind == 1:
+        return expression[:position] + expression[position] + expression[position:]
+    return expression[:position] + rng.choice(NOISE) + expression[position:]
+
+
+def generate_batch(index: int) -> list[str]:
+    """
+    Generates the expressions of the batch (the same index always generates the same expressions).
+
+    Args:
+        index (int): The index of the batch.
+
+    Returns:
+        list[str]: The expressions.
+    """
+    rng = random.Random(f"{CALCULATOR_SEED}-{index}")
+    size = min(CALCULATOR_BATCH_SIZE, CALCULATOR_EXPRESSIONS - index * CALCULATOR_BATCH_SIZE)
+
+    expressions = []
+    for _ in range(size):
+        expression = generate_expression(rng, rng.randint(0, CALCULATOR_MAX_DEPTH))
+        if rng.random() < CALCULATOR_INVALID_RATE:
+            expression = break_expression(rng, expression)
+        expressions.append(expression)
+
+    return expressions
+
+
+# Worker functions
+def init_calculator_worker(implementations: list) -> None:
+    """
+    Prepares the worker process.
+
+    Args:
+        implementations (list): A list of (prompt_type, iteration, model, path) tuples.
+
+    Returns:
+        None
+    """
+    global IMPLEMENTATIONS
+    init_worker()
+    IMPLEMENTATIONS = implementations
+
+
+def get_calculator_class(index: int):
+    """
+    Returns the Calculator class of the implementation (imported once per worker).
+
+    Args:
+        index (int): The index of the implementation.
+
+    Returns:
+        type | str: The class or the description of the error if the module cannot be imported.
+    """
+    if index not in CLASSES:
+        prompt_type, iteration, model, path = IMPLEMENTATIONS[index]
+        try:
+            module = load_module(path, f"differential_{prompt_type}_{iteration}_{model}")
+            CLASSES[index] = module.Calculator
+        except BaseException as e:
+            CLASSES[index] = f"import failed ({type(e).__name__})"
+
+    return CLASSES[index]
+
+
+def evaluate(index: int, expressions: list[str]) -> list[str]:
+    """
+    Evaluates the expressions with the implementation (a new instance for every expression).
+
+    Args:
+        index (int): The index of the implementation.
+        expressions (list[str]): The expressions.
+
+    Returns:
+        list[str]: The outcome of every expression (the value, "raise {exception}" or "timeout").
+    """
+    calculator_class = get_calculator_class(index)
+    if isinstance(calculator_class, str):
+        return [calculator_class] * len(expressions)
+
+    def calculate(expression):
+        return calculator_class().calculate(expression)
+
+    outcomes = []
+    for expression in expressions:
+        try:
+            outcomes.append(get_outcome(call_with_timeout(calculate, CALCULATOR_TIMEOUT, expression)))
+        except EvaluationTimeout:
+            outcomes.append("timeout")
+        except (Exception, SystemExit) as e:
+            outcomes.append(f"raise {type(e).__name__}")
+
+    return outcomes
+
+
+def evaluate_all(expressions: list[str]) -> list[list[str]]:
+    """
+    Evaluates the expressions with all implementations.
+
+    Args:
+        expressions (list[str]): The expressions.
+
+    Returns:
+        list[list[str]]: The outcomes of every implementation.
+    """
+    return [evaluate(index, expressions) for index in range(len(IMPLEMENTATIONS))]
+
+
+def get_import_errors() -> list:
+    """
+    Returns the errors of the implementations which cannot be imported.
+
+    Returns:
+        list: The description of the error (None if the module was imported) of every implementation.
+    """
+    errors = []
+    for index in range(len(IMPLEMENTATIONS)):
+        calculator_class = get_calculator_class(index)
+        errors.append(calculator_class if isinstance(calculator_class, str) else None)
+
+    return errors
+
+
+def get_order(expression: str) -> tuple:
+    """
+    Returns the key ordering the expressions from the simplest (the shortest, then alphabetically).
+
+    Args:
+        expression (str): The expression.
+
+    Returns:
+        tuple: The sort key.
+    """
+    return len(expression), expression
+
+
+def get_majority(outcomes: list[list[str]], column: int, loaded: list[int]) -> str:
+    """
+    Returns the most common outcome of the expression (ties are broken alphabetically).
+
+    Args:
+        outcomes (list[list[str]]): The outcomes of every implementation.
+        column (int): The index of the expression.
+        loaded (list[int]): The indexes of the implementations which could be imported.
+
+    Returns:
+        str: The majority outcome.
+    """
+    counts = Counter(outcomes[index][column] for index in loaded)
+    return min(counts, key=lambda outcome: (-counts[outcome], outcome))
+
+
+def evaluate_batch(batch: int) -> dict:
+    """
+    Evaluates one batch of expressions with all implementations and summarizes the outcomes.
+
+    Args:
+        batch (int): The index of the batch.
+
+    Returns:
+        dict: The summary of the batch (the digest of the outcomes, the number of disagreements with the majority,
+              exceptions and timeouts and the shortest disagreeing expression of every implementation).
+    """
+    expressions = generate_batch(batch)
+    outcomes = evaluate_all(expressions)
+    loaded = [index for index in range(len(IMPLEMENTATIONS)) if not isinstance(CLASSES[index], str)]
+
+    summary = {
+        "batch": batch,
+        "expressions": len(expressions),
+        "disagreeing": 0,
+        "digests": [hashlib.sha256("\n".join(column).encode("utf-8")).digest() for column in outcomes],
+        "disagreements": [0] * len(IMPLEMENTATIONS),
+        "exceptions": [0] * len(IMPLEMENTATIONS),
+        "timeouts": [0] * len(IMPLEMENTATIONS),
+        "minimal": [None] * len(IMPLEMENTATIONS),
+    }
+
+    for column, expression in enumerate(expressions):
+        majority = get_majority(outcomes, column, loaded) if loaded else None
+        disagreeing = False
+        for index in loaded:
+            outcome = outcomes[index][column]
+            if outcome == "timeout":
+                summary["timeouts"][index] += 1
+            elif outcome.startswith("raise "):
+                summary["exceptions"][index] += 1
+
+            if outcome != majority:
+                disagreeing = True
+                summary["disagreements"][index] += 1
+                minimal = summary["minimal"][index]
+                if minimal is None or get_order(expression) < get_order(minimal[0]):
+                    summary["minimal"][index] = (expression, outcome, majority)
+
+        summary["disagreeing"] += disagreeing
+
+    return summary
+
+
+# Shrinking
+def get_candidates(expression: str) -> list[str]:
+    """
+    Returns the simplifications of the expression: one character removed or one number replaced by 1.
+
+    Args:
+        expression (str): The expression.
+
+    Returns:
+        list[str]: The unique simplified expressions.
+    """
+    candidates = [expression[:position] + expression[position + 1 :] for position in range(len(expression))]
+    for match in re.finditer(r"\d+(\.\d+)?", expression):
+        if match.group() != "1":
+            candidates.append(expression[: match.start()] + "1" + expression[match.end() :])
+
+    return list(dict.fromkeys(candidates))
+
+
+def shrink(pool: multiprocessing.Pool, minimal: tuple, member: int, loaded: list[int], workers: int) -> tuple:
+    """
+    Greedily shrinks the expression while the implementation still disagrees with the majority.
+    All candidates of one round are evaluated by all implementations in parallel.
+
+    Args:
+        pool (multiprocessing.Pool): The pool of the workers.
+        minimal (tuple): The disagreeing expression, its outcome and the majority outcome.
+        member (int): The index of the implementation (representative of the cluster).
+        loaded (list[int]): The indexes of the implementations which could be imported.
+        workers (int): The number of the workers.
+
+    Returns:
+        tuple: The shrunk expression, its outcome and the majority outcome.
+    """
+    for _ in range(CALCULATOR_SHRINK_ROUNDS):
+        expression = minimal[0]
+        candidates = sorted(get_candidates(expression), key=get_order)
+        if not candidates:
+            break
+
+        chunks = [candidates[start::workers] for start in range(workers)]
+        results = pool.map(evaluate_all, [chunk for chunk in chunks if chunk])
+
+        disagreeing = []
+        for chunk, outcomes in zip([chunk for chunk in chunks if chunk], results):
+            for column, candidate in enumerate(chunk):
+                majority = get_majority(outcomes, column, loaded)
+                if outcomes[member][column] != majority:
+                    disagreeing.append((candidate, outcomes[member][column], majority))
+
+        if not disagreeing:
+            break
+        minimal = min(disagreeing, key=lambda candidate: get_order(candidate[0]))
+
+    return minimal
+
+
+def main() -> None:
+    implementations = get_implementations(GENERATED_DIR, "calculator", PROMPTS, ITERATIONS, MODELS)
+    workers = WORKERS or os.cpu_count() or 1
+    batches = -(-CALCULATOR_EXPRESSIONS // CALCULATOR_BATCH_SIZE)
+
+    digests = defaultdict(dict)
+    disagreements = [0] * len(implementations)
+    exceptions = [0] * len(implementations)
+    timeouts = [0] * len(implementations)
+    minimal = [None] * len(implementations)
+    disagreeing = 0
+
+    start = time.perf_counter()
+    with multiprocessing.Pool(workers, initializer=init_calculator_worker, initargs=(implementations,)) as pool:
+        for done, summary in enumerate(pool.imap_unordered(evaluate_batch, range(batches)), start=1):
+            disagreeing += summary["disagreeing"]
+            for index in range(len(implementations)):
+                digests[index][summary["batch"]] = summary["digests"][index]
+                disagreements[index] += summary["disagreements"][index]
+                exceptions[index] += summary["exceptions"][index]
+                timeouts[index] += summary["timeouts"][index]
+                candidate = summary["minimal"][index]
+                if candidate and (minimal[index] is None or get_order(candidate[0]) < get_order(minimal[index][0])):
+                    minimal[index] = candidate
+
+            elapsed = time.perf_counter() - start
+            evaluations = done * CALCULATOR_BATCH_SIZE * len(implementations)
+            print(f"Batch {done}/{batches}: {evaluations / elapsed * 60:,.0f} evaluations per minute")
+
+        load_errors = pool.apply(get_import_errors)
+        loaded = [index for index in range(len(implementations)) if load_errors[index] is None]
+
+        clusters = defaultdict(list)
+        for index in range(len(implementations)):
+            if load_errors[index] is not None:
+                clusters[load_errors[index]].append(index)
+                continue
+            signature = hashlib.sha256(b"".join(digests[index][batch] for batch in range(batches))).hexdigest()
+            clusters[signature].append(index)
+
+        clusters = sorted(clusters.values(), key=lambda members: (-len(members), members[0]))
+        cluster_of = {index: number for number, members in enumerate(clusters, start=1) for index in members}
+
+        inputs = []
+        for number, members in enumerate(clusters, start=1):
+            representative = members[0]
+            if load_errors[representative] is not None or minimal[representative] is None:
+                inputs.append([number, len(members), 0, "", "", load_errors[representative] or "", ""])
+                continue
+
+            shrunk, outcome, majority = shrink(pool, minimal[representative], representative, loaded, workers)
+            original = minimal[representative][0]
+            inputs.append([number, len(members), disagreements[representative], shrunk, original, outcome, majority])
+            print(f"Cluster {number} ({len(members)} implementations): {shrunk!r} -> {outcome}, majority {majority}")
+
+    with open(f"{RESULTS_DIR}/calculator/{CALCULATOR_CLUSTERS_FILE}", "w", encoding="utf-8", newline="") as file:
+        writer = csv.writer(file)
+        writer.writerow(
+            ["prompt_type", "iteration", "model", "cluster", "cluster_size"]
+            + ["disagreements", "exceptions", "timeouts", "import_error"]
+        )
+        for index, (prompt_type, iteration, model, _) in enumerate(implementations):
+            cluster = cluster_of[index]
+            writer.writerow(
+                [prompt_type, iteration, model, cluster, len(clusters[cluster - 1])]
+                + [disagreements[index], exceptions[index], timeouts[index], load_errors[index] or ""]
+            )
+
+    with open(f"{RESULTS_DIR}/calculator/{CALCULATOR_INPUTS_FILE}", "w", encoding="utf-8", newline="") as file:
+        writer = csv.writer(file)
+        writer.writerow(
+            ["cluster", "cluster_size", "disagreements", "minimal_input", "original_input"]
+            + ["outcome", "majority_outcome"]
+        )
+        writer.writerows(inputs)
+
+    print(f"{CALCULATOR_EXPRESSIONS} expressions ({disagreeing} disagreeing), {len(clusters)} clusters")
+
+
+if __name__ == "__main__":
+    main()
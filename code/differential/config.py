@@ -0,0 +1,87 @@
+# Constants for the differential testing
+
+# RESULTS_DIR - the directory where the results are stored
+RESULTS_DIR = "results"
+
+# GENERATED_DIR - the directory with the generated code
+GENERATED_DIR = "generated/code"
+
+# PROMPTS - list of prompts used in scraper
+PROMPTS = [
+    "1-zero_shot",
+    "2-few_shot",
+    "3-chain_of_thoughts-zero_shot",
+    "4-chain_of_thoughts-few_shot",
+    "5-role-zero_shot",
+    "6-role-few_shot",
+]
+
+# MODELS - list of models used in scraper
+MODELS = ["chatgpt", "claude", "gemini"]
+
+# ITERATIONS - number of iterations used in scraper
+ITERATIONS = 10
+
+# WORKERS - number of worker processes (None = one per CPU core)
+WORKERS = None
+
+# CALCULATOR_EXPRESSIONS - number of generated expressions evaluated by every implementation
+CALCULATOR_EXPRESSIONS = 200_000
+
+# CALCULATOR_BATCH_SIZE - number of expressions evaluated by all implementations in one task of a worker
+CALCULATOR_BATCH_SIZE = 2_000
+
+# CALCULATOR_SEED - seed of the expression generator (the same seed generates the same expressions)
+CALCULATOR_SEED = 42
+
+# CALCULATOR_MAX_DEPTH - maximum nesting of the parentheses in the generated expressions
+CALCULATOR_MAX_DEPTH = 3
+
+# CALCULATOR_INVALID_RATE - fraction of the expressions which are broken on purpose (missing operand, unknown character, ...)
+CALCULATOR_INVALID_RATE = 0.15
+
+# CALCULATOR_TIMEOUT - maximum time (in seconds) of the evaluation of one expression
+CALCULATOR_TIMEOUT = 1
+
+# CALCULATOR_SHRINK_ROUNDS - maximum number of rounds of the shrinking of one disagreeing expression
+CALCULATOR_SHRINK_ROUNDS = 50
+
+# CALCULATOR_CLUSTERS_FILE - the name of the table with the behaviour cluster of every implementation (stored in results/calculator/)
+CALCULATOR_CLUSTERS_FILE = "differential_clusters.csv"
+
+# CALCULATOR_INPUTS_FILE - the name of the table with the minimal disagreeing input of every cluster (stored in results/calculator/)
+CALCULATOR_INPUTS_FILE = "differential_inputs.csv"
+
+# TODO_SEQUENCES - number of random operation sequences run against every implementation
+TODO_SEQUENCES = 2_000
+
+# TODO_SEQUENCE_LENGTH - number of operations in one sequence
+TODO_SEQUENCE_LENGTH = 40
+
+# TODO_BATCH_SIZE - number of sequences run in one task of a worker
+TODO_BATCH_SIZE = 100
+
+# TODO_SEED - seed of the sequence generator (the same seed generates the same sequences)
+TODO_SEED = 42
+
+# TODO_TIMEOUT - maximum time (in seconds) of one sequence
+TODO_TIMEOUT = 5
+
+# TODO_OPERATIONS - relative weights of the generated operations
+TODO_OPERATIONS = {
+    "add": 30,
+    "add_invalid": 5,
+    "remove": 10,
+    "remove_invalid": 4,
+    "finish": 12,
+    "finish_invalid": 4,
+    "search": 20,
+    "get_all": 12,
+    "clear_all": 3,
+}
+
+# TODO_WORDS - words used in the generated task names, descriptions and search terms
+TODO_WORDS = ["task", "buy", "milk", "code", "review", "call", "mom", "fix", "bug", "report"]
+
+# TODO_SEQUENCES_FILE - the name of the table with the divergences of every implementation (stored in results/todo_list/)
+TODO_SEQUENCES_FILE = "differential_sequences.csv"
@@ -0,0 +1,116 @@
+"""
+This module contains helper functions used by the differential testing.
+"""
+
+import decimal
+import importlib.util
+import numbers
+import os
+import signal
+import sys
+from types import ModuleType
+
+
+class EvaluationTimeout(BaseException):
+    """
+    Raised when the evaluation of one input takes longer than the timeout.
+    Derived from BaseException (like KeyboardInterrupt), so the "except Exception" handlers of the generated code
+    cannot swallow it or convert it to another exception.
+    """
+
+
+def get_implementations(
+    generated_dir: str, challenge: str, prompts: list, iterations: int, models: list
+) -> list[tuple]:
+    """
+    Returns all generated implementations of the challenge.
+
+    Args:
+        generated_dir (str): The directory with the generated code.
+        challenge (str): The name of the challenge.
+        prompts (list): The names of the prompts.
+        iterations (int): The number of iterations.
+        models (list): The names of the models.
+
+    Returns:
+        list[tuple]: A list of (prompt_type, iteration, model, path) tuples.
+    """
+    return [
+        (prompt_type, iteration, model, f"{generated_dir}/{challenge}/{prompt_type}/iteration_{iteration}/{model}.py")
+        for prompt_type in prompts
+        for iteration in range(1, iterations + 1)
+        for model in models
+    ]
+
+
+def load_module(path: str, name: str) -> ModuleType:
+    """
+    Imports a generated module from the given path under the given name.
+
+    Args:
+        path (str): The path to the Python file.
+        name (str): The name under which the module is registered in sys.modules.
+
+    Returns:
+        ModuleType: The imported module.
+    """
+    spec = importlib.util.spec_from_file_location(name, path)
+    module = importlib.util.module_from_spec(spec)
+    sys.modules[name] = module
+    spec.loader.exec_module(module)
+    return module
+
+
+def init_worker() -> None:
+    """
+    Prepares a worker process: the output of the implementations is discarded and the timeout
+    of one evaluation raises EvaluationTimeout.
+
+    Returns:
+        None
+    """
+    sys.stdout = open(os.devnull, "w")
+
+    def on_timeout(signum, frame):
+        raise EvaluationTimeout()
+
+    signal.signal(signal.SIGALRM, on_timeout)
+
+
+def call_with_timeout(function, timeout: float, *args):
+    """
+    Calls the function and interrupts it after the timeout (only in a worker prepared by init_worker).
+
+    Args:
+        function (callable): The function to be called.
+        timeout (float): The timeout in seconds.
+        *args: The arguments of the function.
+
+    Returns:
+        The result of the function.
+    """
+    signal.setitimer(signal.ITIMER_REAL, timeout)
+    try:
+        return function(*args)
+    finally:
+        signal.setitimer(signal.ITIMER_REAL, 0)
+
+
+def get_outcome(value) -> str:
+    """
+    Returns a comparable description of the result of an operation.
+    Numbers are compared with the precision of 9 significant digits, so 0.1+0.2 and 0.3 (or -0.0 and 0) are the same outcome.
+
+    Args:
+        value: The returned value.
+
+    Returns:
+        str: The description of the value.
+    """
+    if isinstance(value, (numbers.Real, decimal.Decimal)) and not isinstance(value, bool):
+        try:
+            return f"{float(value) + 0.0:.9g}"
+        except OverflowError:
+            return "overflow"
+
+    return f"{type(value).__name__}: {value!r}"[:100]
@@ -0,0 +1,511 @@
+"""
+This script runs the same random sequences of operations (add, remove, finish, search, get_all, clear_all)
+against every generated TaskManager and against a reference model of the specification, detects the first
+operation whose outcome differs from the model and shrinks the diverging sequences.
+Tasks are referenced by their order of addition (#1 is the first added task), so the sequences do not depend
+on the ids chosen by the implementation. Every worker task runs a batch of sequences against one implementation.
+Operations with invalid arguments (INVALID_TEXTS, INVALID_IDS) only have to be rejected: raising any exception,
+returning False or None are the same outcome, so the divergences show wrong states of the tasks and not
+the differences of the validation (the exact errors are tested by 5_functional_correctness.py).
+Running: python code/differential/todo_list.py (from the root of the repository)
+Output: results/todo_list/differential_sequences.csv
+"""
+
+import csv
+import multiprocessing
+import os
+import random
+import tempfile
+from collections import Counter
+
+from config import (
+    GENERATED_DIR,
+    ITERATIONS,
+    MODELS,
+    PROMPTS,
+    RESULTS_DIR,
+    TODO_BATCH_SIZE,
+    TODO_OPERATIONS,
+    TODO_SEED,
+    TODO_SEQUENCE_LENGTH,
+    TODO_SEQUENCES,
+    TODO_SEQUENCES_FILE,
+    TODO_TIMEOUT,
+    TODO_WORDS,
+    WORKERS,
+)
+from helpers import EvaluationTimeout, call_with_timeout, get_implementations, init_worker, load_module
+
+
+# ids which are never returned by add (the handle of a task which does not exist is resolved to MISSING_ID + handle)
+MISSING_ID = 10**9
+
+# arguments of remove and finish which are not ids of tasks
+INVALID_IDS = [None, "", -1, 1.5, "task", True]
+
+# arguments of add which are not valid names or descriptions
+INVALID_TEXTS = ["", None, 123, 1.5, True]
+
+# state of a worker process (set by init_todo_worker)
+IMPLEMENTATIONS = []
+CLASSES = {}
+
+
+class TaskModel:
+    """
+    Reference model of the TaskManager specification (the behaviour required by 5_functional_correctness.py).
+    """
+
+    def __init__(self):
+        """
+        Initializes the model with no tasks.
+        """
+        self.tasks = {}
+        self.next_id = 1
+
+    def add(self, task_name, task_description) -> int:
+        """
+        Adds a task and returns its id (ValueError for a name or description which is not a non-empty string).
+        """
+        for text in (task_name, task_description):
+            if not isinstance(text, str) or not text:
+                raise ValueError("Task name and description must be non-empty strings.")
+
+        task_id = self.next_id
+        self.next_id += 1
+        self.tasks[task_id] = {
+            "id": task_id,
+            "task_name": task_name,
+            "task_description": task_description,
+            "is_finished": False,
+        }
+        return task_id
+
+    def remove(self, task_id) -> bool:
+        """
+        Removes the task, returns False if the id is not an id of an existing task.
+        """
+        if type(task_id) is not int or task_id not in self.tasks:
+            return False
+        del self.tasks[task_id]
+        return True
+
+    def finish(self, task_id) -> bool:
+        """
+        Marks the task as finished, returns False if the id is not an id of an existing task.
+        """
+        if type(task_id) is not int or task_id not in self.tasks:
+            return False
+        self.tasks[task_id]["is_finished"] = True
+        return True
+
+    def search(self, task_term) -> list[dict]:
+        """
+        Returns the tasks whose name or description contains the term (in the order of addition).
+        """
+        return [
+            dict(task)
+            for task in self.tasks.values()
+            if task_term in task["task_name"] or task_term in task["task_description"]
+        ]
+
+    def get_all(self) -> list[dict]:
+        """
+        Returns all tasks (in the order of addition).
+        """
+        return [dict(task) for task in self.tasks.values()]
+
+    def clear_all(self) -> bool:
+        """
+        Removes all tasks.
+        """
+        self.tasks.clear()
+        return True
+
+
+# Sequence generator
+def generate_text(rng: random.Random) -> str:
+    """
+    Generates a random task name or description from TODO_WORDS.
+
+    Args:
+        rng (random.Random): The random generator.
+
+    Returns:
+        str: The text.
+    """
+    return " ".join(rng.choice(TODO_WORDS) for _ in range(rng.randint(1, 3))) + str(rng.randint(0, 20))
+
+
+def generate_sequence(number: int) -> list[tuple]:
+    """
+    Generates the operations of the sequence (the same number always generates the same sequence).
+    Arguments referencing a task are stored as ("#", handle), where handle is the order of the addition.
+
+    Args:
+        number (int): The number of the sequence.
+
+    Returns:
+        list[tuple]: A list of (method, arguments) tuples.
+    """
+    rng = random.Random(f"{TODO_SEED}-{number}")
+    kinds, weights = zip(*TODO_OPERATIONS.items())
+
+    operations = []
+    texts = list(TODO_WORDS)
+    adds = 0
+    for kind in rng.choices(kinds, weights, k=TODO_SEQUENCE_LENGTH):
+        if kind == "add":
+            task_name, task_description = generate_text(rng), generate_text(rng)
+            texts += [task_name, task_description]
+            operations.append(("add", (task_name, task_description)))
+            adds += 1
+        elif kind == "add_invalid":
+            arguments = [generate_text(rng), generate_text(rng)]
+            arguments[rng.randrange(2)] = rng.choice(INVALID_TEXTS)
+            operations.append(("add", tuple(arguments)))
+        elif kind in ("remove", "finish"):
+            operations.append((kind, (("#", rng.randint(1, adds + 1)),)))
+        elif kind in ("remove_invalid", "finish_invalid"):
+            operations.append((kind.split("_")[0], (rng.choice(INVALID_IDS),)))
+        elif kind == "search":
+            text = rng.choice(texts)
+            start = rng.randrange(len(text))
+            operations.append(("search", (text[start : rng.randint(start + 1, len(text))],)))
+        else:
+            operations.append((kind, ()))
+
+    return operations
+
+
+def is_invalid(method: str, arguments: tuple) -> bool:
+    """
+    Checks whether the operation has an invalid argument (a name or description which is not a non-empty string,
+    or an id which is not a handle of a task).
+
+    Args:
+        method (str): The name of the method.
+        arguments (tuple): The arguments of the operation (with the handles not resolved).
+
+    Returns:
+        bool: True if the implementation only has to reject the operation.
+    """
+    if method == "add":
+        return any(not isinstance(argument, str) or not argument for argument in arguments)
+    if method in ("remove", "finish"):
+        return not is_handle(arguments[0])
+    return False
+
+
+def format_sequence(operations: list[tuple]) -> str:
+    """
+    Formats the operations as a readable sequence of calls.
+
+    Args:
+        operations (list[tuple]): A list of (method, arguments) tuples.
+
+    Returns:
+        str: The calls separated by semicolons (e.g. add('buy1', 'milk2'); finish(#1)).
+    """
+    calls = []
+    for method, arguments in operations:
+        formatted = [f"#{argument[1]}" if is_handle(argument) else repr(argument) for argument in arguments]
+        calls.append(f"{method}({', '.join(formatted)})")
+    return "; ".join(calls)
+
+
+def is_handle(argument) -> bool:
+    """
+    Checks whether the argument references a task by the order of its addition.
+
+    Args:
+        argument: The argument of the operation.
+
+    Returns:
+        bool: True if the argument is a handle.
+    """
+    return isinstance(argument, tuple) and len(argument) == 2 and argument[0] == "#"
+
+
+# Running the sequences
+def get_outcome(value, handles: dict) -> str:
+    """
+    Returns a comparable description of the result of an operation.
+    Ids are replaced by the handles of the tasks, so implementations with different ids can be compared.
+
+    Args:
+        value: The returned value.
+        handles (dict): A mapping of the id to the handle of the task.
+
+    Returns:
+        str: The description of the value.
+    """
+    if isinstance(value, list) and all(isinstance(task, dict) for task in value):
+        tasks = []
+        for task in value:
+            handle = handles.get(task.get("id"), "?") if isinstance(task.get("id"), (int, str)) else "?"
+            fields = (task.get("task_name"), task.get("task_description"), task.get("is_finished"))
+            tasks.append(f"#{handle} " + " ".join(repr(field) for field in fields))
+        return "[" + ", ".join(tasks) + "]"
+
+    return f"{type(value).__name__}: {value!r}"[:100]
+
+
+def run_sequence(manager_class, operations: list[tuple]) -> list[tuple]:
+    """
+    Runs the operations against a fresh instance of the class.
+
+    Args:
+        manager_class (type): The TaskManager class (or TaskModel).
+        operations (list[tuple]): A list of (method, arguments) tuples.
+
+    Returns:
+        list[tuple]: The outcome of every operation.
+    """
+    manager = manager_class()
+    try:
+        manager.clear_all()
+    except Exception:
+        pass
+
+    ids = []
+    handles = {}
+    outcomes = []
+    for method, arguments in operations:
+        invalid = is_invalid(method, arguments)
+        arguments = [
+            (ids[argument[1] - 1] if argument[1] <= len(ids) else MISSING_ID + argument[1])
+            if is_handle(argument)
+            else argument
+            for argument in arguments
+        ]
+
+        try:
+            value = getattr(manager, method)(*arguments)
+        except (Exception, SystemExit) as e:
+            outcomes.append("rejected" if invalid else f"raise {type(e).__name__}")
+            continue
+
+        # an invalid operation which returns an id or True has changed the tasks, it diverges
+        if invalid and (value is None or value is False):
+            outcomes.append("rejected")
+            continue
+
+        if method == "add":
+            if isinstance(value, int) and not isinstance(value, bool):
+                ids.append(value)
+                handles[value] = len(ids)
+                outcomes.append("int id")
+            else:
+                outcomes.append(f"id {type(value).__name__}")
+            continue
+
+        # the specification requires only a bool from clear_all (True or False for an empty list are both correct)
+        if method == "clear_all":
+            outcomes.append(f"returns {type(value).__name__}")
+            continue
+
+        outcomes.append(get_outcome(value, handles))
+
+    return outcomes
+
+
+def find_divergence(manager_class, operations: list[tuple]):
+    """
+    Runs the operations against the implementation and the model and finds the first different outcome.
+
+    Args:
+        manager_class (type): The TaskManager class.
+        operations (list[tuple]): A list of (method, arguments) tuples.
+
+    Returns:
+        tuple | None: The index of the operation, the outcome and the expected outcome (None if there is no divergence).
+    """
+    try:
+        outcomes = call_with_timeout(run_sequence, TODO_TIMEOUT, manager_class, operations)
+    except EvaluationTimeout:
+        return len(operations) - 1, "timeout", ""
+
+    expected = run_sequence(TaskModel, operations)
+    for index, (outcome, expected_outcome) in enumerate(zip(outcomes, expected)):
+        if outcome != expected_outcome:
+            return index, outcome, expected_outcome
+
+    return None
+
+
+def shrink(manager_class, operations: list[tuple]) -> list[tuple]:
+    """
+    Shrinks the diverging sequence by removing chunks of operations (delta debugging) while it still diverges.
+
+    Args:
+        manager_class (type): The TaskManager class.
+        operations (list[tuple]): The diverging sequence.
+
+    Returns:
+        list[tuple]: The shrunk sequence.
+    """
+    divergence = find_divergence(manager_class, operations)
+    operations = operations[: divergence[0] + 1]
+
+    chunk = max(len(operations) // 2, 1)
+    while chunk >= 1:
+        start = 0
+        while start < len(operations):
+            candidate = operations[:start] + operations[start + chunk :]
+            if candidate and find_divergence(manager_class, candidate) is not None:
+                operations = candidate
+            else:
+                start += chunk
+        chunk //= 2
+
+    return operations
+
+
+def init_todo_worker(implementations: list) -> None:
+    """
+    Prepares the worker process. The working directory is changed to a temporary directory,
+    so implementations which save the tasks to a file do not write into the repository.
+
+    Args:
+        implementations (list): A list of (prompt_type, iteration, model, path) tuples with absolute paths.
+
+    Returns:
+        None
+    """
+    global IMPLEMENTATIONS
+    init_worker()
+    os.chdir(tempfile.mkdtemp(prefix="differential_todo_list_"))
+    IMPLEMENTATIONS = implementations
+
+
+def get_manager_class(index: int):
+    """
+    Returns the TaskManager class of the implementation (imported once per worker).
+
+    Args:
+        index (int): The index of the implementation.
+
+    Returns:
+        type | str: The class or the description of the error if the module cannot be imported.
+    """
+    if index not in CLASSES:
+        prompt_type, iteration, model, path = IMPLEMENTATIONS[index]
+        try:
+            module = load_module(path, f"differential_{prompt_type}_{iteration}_{model}")
+            CLASSES[index] = module.TaskManager
+        except BaseException as e:
+            CLASSES[index] = f"import failed ({type(e).__name__})"
+
+    return CLASSES[index]
+
+
+def run_batch(task: tuple) -> dict:
+    """
+    Runs a batch of sequences against one implementation.
+
+    Args:
+        task (tuple): The index of the implementation and the numbers of the sequences.
+
+    Returns:
+        dict: The number of diverging sequences and timeouts, the diverging operations and the shortest
+              shrunk diverging sequence of the batch.
+    """
+    index, numbers = task
+    summary = {"index": index, "sequences": len(numbers), "diverging": 0, "timeouts": 0, "methods": Counter()}
+
+    manager_class = get_manager_class(index)
+    if isinstance(manager_class, str):
+        summary["import_error"] = manager_class
+        return summary
+
+    shortest = None
+    for number in numbers:
+        operations = generate_sequence(number)
+        divergence = find_divergence(manager_class, operations)
+        if divergence is None:
+            continue
+
+        summary["diverging"] += 1
+        summary["timeouts"] += divergence[1] == "timeout"
+        summary["methods"][operations[divergence[0]][0]] += 1
+
+        # only sequences shorter than the current shortest one are shrunk
+        if shortest is None or divergence[0] + 1 < len(shortest):
+            shrunk = shrink(manager_class, operations) if divergence[1] != "timeout" else operations
+            if shortest is None or len(shrunk) < len(shortest):
+                shortest = shrunk
+
+    if shortest is not None:
+        divergence = find_divergence(manager_class, shortest)
+        summary["shortest"] = (shortest, *divergence) if divergence else (shortest, 0, "", "")
+
+    return summary
+
+
+def main() -> None:
+    implementations = [
+        (prompt_type, iteration, model, os.path.abspath(path))
+        for prompt_type, iteration, model, path in get_implementations(
+            GENERATED_DIR, "todo_list", PROMPTS, ITERATIONS, MODELS
+        )
+    ]
+    workers = WORKERS or os.cpu_count() or 1
+
+    tasks = [
+        (index, range(start, min(start + TODO_BATCH_SIZE, TODO_SEQUENCES)))
+        for index in range(len(implementations))
+        for start in range(0, TODO_SEQUENCES, TODO_BATCH_SIZE)
+    ]
+
+    results = {
+        index: {"diverging": 0, "timeouts": 0, "methods": Counter(), "shortest": None, "import_error": ""}
+        for index in range(len(implementations))
+    }
+
+    with multiprocessing.Pool(workers, initializer=init_todo_worker, initargs=(implementations,)) as pool:
+        for summary in pool.imap_unordered(run_batch, tasks, chunksize=max(TODO_SEQUENCES // TODO_BATCH_SIZE, 1)):
+            result = results[summary["index"]]
+            result["diverging"] += summary["diverging"]
+            result["timeouts"] += summary["timeouts"]
+            result["methods"].update(summary["methods"])
+            result["import_error"] = summary.get("import_error", "")
+
+            shortest = summary.get("shortest")
+            if shortest and (result["shortest"] is None or len(shortest[0]) < len(result["shortest"][0])):
+                result["shortest"] = shortest
+
+    methods = ["add", "remove", "finish", "search", "get_all", "clear_all"]
+    with open(f"{RESULTS_DIR}/todo_list/{TODO_SEQUENCES_FILE}", "w", encoding="utf-8", newline="") as file:
+        writer = csv.writer(file)
+        writer.writerow(
+            ["prompt_type", "iteration", "model", "sequences", "diverging_sequences", "timeouts", "import_error"]
+            + [f"diverging-{method}" for method in methods]
+            + ["minimal_sequence", "outcome", "expected_outcome"]
+        )
+
+        for index, (prompt_type, iteration, model, _) in enumerate(implementations):
+            result = results[index]
+            row = [prompt_type, iteration, model, TODO_SEQUENCES, result["diverging"], result["timeouts"]]
+            row += [result["import_error"], *(result["methods"][method] for method in methods)]
+            if result["shortest"] is not None:
+                operations, _, outcome, expected = result["shortest"]
+                row += [format_sequence(operations), outcome, expected]
+            else:
+                row += ["", "", ""]
+            writer.writerow(row)
+
+            name = f"todo_list/{prompt_type}/iteration_{iteration}/{model}"
+            if result["import_error"]:
+                print(f"{name}: {result['import_error']}")
+            elif result["shortest"] is None:
+                print(f"{name}: no divergence in {TODO_SEQUENCES} sequences")
+            else:
+                print(
+                    f"{name}: {result['diverging']}/{TODO_SEQUENCES} sequences diverge, "
+                    f"e.g. {format_sequence(result['shortest'][0])} -> {result['shortest'][2]}"
+                )
+
+
+if __name__ == "__main__":
+    main()
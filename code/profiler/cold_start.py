@@ -0,0 +1,159 @@
+"""
+This script measures the cold path of the generated modules: the import time of the module, the construction
+time of the first instance and the latency of the first (and second) call of each method.
+Every measurement runs in a fresh Python process and is repeated COLD_START_REPEATS times,
+the median of the repeats is reported.
+Running: python code/profiler/cold_start.py (from the root of the repository)
+Output: results/{challenge}/cold_start.csv
+"""
+
+import csv
+import os
+import statistics
+import subprocess
+import sys
+from collections import defaultdict
+
+from config import (
+    CHALLENGES,
+    COLD_START_FILE,
+    COLD_START_OPERATIONS,
+    COLD_START_REPEATS,
+    COLD_START_TIMEOUT,
+    GENERATED_DIR,
+    ITERATIONS,
+    MODELS,
+    PROMPTS,
+    RESULTS_DIR,
+)
+from helpers import get_module_path
+
+
+# The probe imports nothing before the measured import, so the import time of the standard library
+# modules used by the generated module (re, datetime, ...) is included in the result.
+PROBE = """
+import sys
+import time
+
+clock = time.perf_counter_ns
+sys.path.insert(0, {directory!r})
+
+start = clock()
+module = __import__({model!r})
+imported = clock()
+instance = getattr(module, {class_name!r})()
+constructed = clock()
+
+print("import_time", imported - start)
+print("construction_time", constructed - imported)
+for operation, method, args in {operations!r}:
+    for call in ("first_call", "second_call"):
+        start = clock()
+        try:
+            getattr(instance, method)(*args)
+        except Exception:
+            pass
+        print(call + "-" + operation, clock() - start)
+"""
+
+
+def run_probe(path: str, class_name: str, operations: list) -> dict:
+    """
+    Runs the probe for the given module in a fresh Python process.
+
+    Args:
+        path (str): The path to the generated module.
+        class_name (str): The name of the class to be instantiated.
+        operations (list): A list of (operation, method, arguments) tuples.
+
+    Returns:
+        dict: A mapping of the metric name to the measured time in nanoseconds (None if the process failed).
+    """
+    probe = PROBE.format(
+        directory=os.path.dirname(os.path.abspath(path)),
+        model=os.path.splitext(os.path.basename(path))[0],
+        class_name=class_name,
+        operations=operations,
+    )
+
+    try:
+        process = subprocess.run(
+            [sys.executable, "-c", probe],
+            stdin=subprocess.DEVNULL,
+            capture_output=True,
+            text=True,
+            timeout=COLD_START_TIMEOUT,
+        )
+    except subprocess.TimeoutExpired:
+        return None
+
+    if process.returncode != 0:
+        return None
+
+    metrics = {}
+    for line in process.stdout.splitlines():
+        name, _, value = line.rpartition(" ")
+        if name in ("import_time", "construction_time") or name.startswith(("first_call-", "second_call-")):
+            metrics[name] = int(value)
+
+    return metrics if "import_time" in metrics else None
+
+
+def measure_cold_start(path: str, class_name: str, operations: list) -> dict:
+    """
+    Repeats the probe and computes the median of every metric.
+
+    Args:
+        path (str): The path to the generated module.
+        class_name (str): The name of the class to be instantiated.
+        operations (list): A list of (operation, method, arguments) tuples.
+
+    Returns:
+        dict: A mapping of the metric name to the median time in seconds (empty if the module failed).
+    """
+    samples = defaultdict(list)
+    for _ in range(COLD_START_REPEATS):
+        metrics = run_probe(path, class_name, operations)
+        if metrics is None:
+            return {}
+
+        for name, value in metrics.items():
+            samples[name].append(value)
+
+    return {name: statistics.median(values) / 1e9 for name, values in samples.items()}
+
+
+def main() -> None:
+    for challenge in CHALLENGES:
+        class_name, operations = COLD_START_OPERATIONS[challenge]
+
+        columns = ["import_time", "construction_time"]
+        columns += [f"first_call-{operation}" for operation, _, _ in operations]
+        columns += [f"second_call-{operation}" for operation, _, _ in operations]
+
+        with open(f"{RESULTS_DIR}/{challenge}/{COLD_START_FILE}", "w", encoding="utf-8", newline="") as file:
+            writer = csv.writer(file)
+            writer.writerow(["prompt_type", "iteration", "model", *columns])
+
+            for prompt_type in PROMPTS:
+                for iteration in range(1, ITERATIONS + 1):
+                    for model in MODELS:
+                        path = get_module_path(GENERATED_DIR, challenge, prompt_type, iteration, model)
+                        medians = measure_cold_start(path, class_name, operations)
+                        writer.writerow([prompt_type, iteration, model, *(medians.get(column, "") for column in columns)])
+
+                        name = f"{challenge}/{prompt_type}/iteration_{iteration}/{model}"
+                        if not medians:
+                            print(f"{name}: failed with error.")
+                            continue
+
+                        first_calls = sum(medians[f"first_call-{operation}"] for operation, _, _ in operations)
+                        print(
+                            f"{name}: import {medians['import_time'] * 1000:.3f} ms, "
+                            f"construction {medians['construction_time'] * 1000:.3f} ms, "
+                            f"first calls {first_calls * 1000:.3f} ms"
+                        )
+
+
+if __name__ == "__main__":
+    main()
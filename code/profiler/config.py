@@ -0,0 +1,107 @@
+# Constants for the profiler module
+
+# RESULTS_DIR - the directory where the results are stored
+RESULTS_DIR = "results"
+
+# PROFILES_DIR - the directory (inside each iteration) with the .pstats files of 6_time_behaviour
+PROFILES_DIR = "profiles"
+
+# HOTSPOTS_FILE - the name of the merged summary table (stored in results/{challenge}/)
+HOTSPOTS_FILE = "profile_hotspots.csv"
+
+# TOP_FUNCTIONS - number of the hottest functions printed to the console
+TOP_FUNCTIONS = 15
+
+# CHALLENGES - list of challenges used in scraper
+CHALLENGES = ["calculator", "todo_list", "ascii_art"]
+
+# PROMPTS - list of prompts used in scraper
+PROMPTS = [
+    "1-zero_shot",
+    "2-few_shot",
+    "3-chain_of_thoughts-zero_shot",
+    "4-chain_of_thoughts-few_shot",
+    "5-role-zero_shot",
+    "6-role-few_shot",
+]
+
+# MODELS - list of models used in scraper
+MODELS = ["chatgpt", "claude", "gemini"]
+
+# ITERATIONS - number of iterations used in scraper
+ITERATIONS = 10
+
+# GENERATED_DIR - the directory with the generated code
+GENERATED_DIR = "generated/code"
+
+# PHASES_FILE - the name of the phase breakdown table (stored in results/calculator/)
+PHASES_FILE = "phase_breakdown.csv"
+
+# PHASE_ITERATIONS - number of iterations of each expression in the phase breakdown
+PHASE_ITERATIONS = 10_000
+
+# PHASE_TIMEOUT - maximum time (in seconds) of the phase breakdown of one implementation
+PHASE_TIMEOUT = 300
+
+# PHASE_EXPRESSIONS - expressions evaluated in the phase breakdown (same as in 6_time_behaviour)
+PHASE_EXPRESSIONS = [
+    "1974349+7972327",
+    "1974349-7972327",
+    "1974349*7972327",
+    "1974349/7972327",
+    "1974349+7972327-1974349*7972327/964",
+]
+
+# PHASES - phases of the calculation, the first phase whose keyword is contained in the name of the method wins
+# (methods without any matching keyword, including calculate itself, are counted as "other")
+PHASES = [
+    ("parse", ["current_token", "consume", "peek", "advance", "eat", "expect"]),
+    ("tokenize", ["token", "lex", "read_number", "whitespace", "current_char", "split"]),
+    ("validate", ["valid", "balanc", "check", "sanitiz", "normaliz", "clean", "preprocess", "implicit"]),
+    ("evaluate", ["eval", "apply", "perform", "comput", "execute", "operat", "division", "calculate_"]),
+    ("parse", ["pars", "postfix", "rpn", "polish", "shunting", "expr", "term", "factor", "primary", "unary", "number", "paren", "handle", "extract", "find", "add", "mul", "sub", "div", "preced"]),
+]
+
+# COLD_START_FILE - the name of the cold start table (stored in results/{challenge}/)
+COLD_START_FILE = "cold_start.csv"
+
+# COLD_START_REPEATS - number of fresh processes started for each module
+COLD_START_REPEATS = 20
+
+# COLD_START_TIMEOUT - maximum time (in seconds) of one fresh process
+COLD_START_TIMEOUT = 60
+
+# COLD_START_OPERATIONS - class and (operation, method, arguments) called in the fresh process of each challenge
+COLD_START_OPERATIONS = {
+    "calculator": (
+        "Calculator",
+        [
+            ("calculate_add", "calculate", ("1974349+7972327",)),
+            ("calculate_subtract", "calculate", ("1974349-7972327",)),
+            ("calculate_multiply", "calculate", ("1974349*7972327",)),
+            ("calculate_divide", "calculate", ("1974349/7972327",)),
+            ("calculate_composite", "calculate", ("1974349+7972327-1974349*7972327/964",)),
+        ],
+    ),
+    "todo_list": (
+        "TaskManager",
+        [
+            ("add_task", "add", ("task_name_1", "task_description_1")),
+            ("get_all_tasks", "get_all", ()),
+            ("search_task-by_name", "search", ("task_name_1",)),
+            ("search_task-by_description", "search", ("task_description_1",)),
+            ("finish_task", "finish", (1,)),
+            ("remove_task", "remove", (1,)),
+        ],
+    ),
+    "ascii_art": (
+        "AsciiArt",
+        [
+            ("draw_square", "draw_square", (100, "#")),
+            ("draw_rectangle", "draw_rectangle", (100, 50, "#")),
+            ("draw_parallelogram", "draw_parallelogram", (100, 50, "#")),
+            ("draw_triangle", "draw_triangle", (100, 50, "#")),
+            ("draw_pyramid", "draw_pyramid", (50, "#")),
+        ],
+    ),
+}
@@ -0,0 +1,42 @@
+"""
+This module contains helper functions used by the profiler.
+"""
+
+import importlib.util
+import sys
+from types import ModuleType
+
+
+def get_module_path(generated_dir: str, challenge: str, prompt_type: str, iteration: int, model: str) -> str:
+    """
+    Returns the path to the generated module.
+
+    Args:
+        generated_dir (str): The directory with the generated code.
+        challenge (str): The name of the challenge.
+        prompt_type (str): The name of the prompt.
+        iteration (int): The number of the iteration.
+        model (str): The name of the model.
+
+    Returns:
+        str: The path to the generated Python file.
+    """
+    return f"{generated_dir}/{challenge}/{prompt_type}/iteration_{iteration}/{model}.py"
+
+
+def load_module(path: str, name: str) -> ModuleType:
+    """
+    Imports a generated module from the given path under the given name.
+
+    Args:
+        path (str): The path to the Python file.
+        name (str): The name under which the module is registered in sys.modules.
+
+    Returns:
+        ModuleType: The imported module.
+    """
+    spec = importlib.util.spec_from_file_location(name, path)
+    module = importlib.util.module_from_spec(spec)
+    sys.modules[name] = module
+    spec.loader.exec_module(module)
+    return module
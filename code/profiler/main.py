@@ -0,0 +1,178 @@
+"""
+This script aggregates the cProfile dumps created by 6_time_behaviour.py (profiling mode) and ranks
+the hottest functions across all generated samples.
+Running: python code/profiler/main.py (from the root of the repository)
+Output: results/{challenge}/profile_hotspots.csv
+"""
+
+import csv
+import os
+import pstats
+from collections import defaultdict
+
+from config import (
+    CHALLENGES,
+    HOTSPOTS_FILE,
+    ITERATIONS,
+    MODELS,
+    PROFILES_DIR,
+    PROMPTS,
+    RESULTS_DIR,
+    TOP_FUNCTIONS,
+)
+
+
+# Helper functions
+def get_function_name(function: tuple, model: str) -> str:
+    """
+    Returns a name of the profiled function which is comparable across the samples.
+    Functions of the generated module are identified only by their name (e.g. _tokenize),
+    other functions are prefixed with the name of their source file.
+
+    Args:
+        function (tuple): The pstats function key (filename, line number, function name).
+        model (str): The name of the generated module (e.g. chatgpt).
+
+    Returns:
+        str: The normalized name of the function.
+    """
+    filename, _, name = function
+    if filename == "~":
+        return name
+
+    basename = os.path.basename(filename)
+    if basename == f"{model}.py":
+        return name
+
+    if basename == "__init__.py":
+        basename = f"{os.path.basename(os.path.dirname(filename))}/{basename}"
+
+    return f"{basename}:{name}"
+
+
+def parse_profile_name(file_name: str) -> tuple:
+    """
+    Parses the model and the operation from the name of the .pstats file.
+
+    Args:
+        file_name (str): The name of the file (6_time_behaviour-{model}-{operation}.pstats).
+
+    Returns:
+        tuple: The model and the operation or (None, None) if the name has a different format.
+    """
+    prefix = "6_time_behaviour-"
+    if not file_name.startswith(prefix) or not file_name.endswith(".pstats"):
+        return None, None
+
+    model, _, operation = file_name[len(prefix) : -len(".pstats")].partition("-")
+    return model, operation
+
+
+def get_profile_files(challenge: str) -> list[tuple]:
+    """
+    Returns all .pstats files of the given challenge.
+
+    Args:
+        challenge (str): The name of the challenge.
+
+    Returns:
+        list[tuple]: A list of (path, model, operation) tuples.
+    """
+    profile_files = []
+    for prompt_type in PROMPTS:
+        for iteration in range(1, ITERATIONS + 1):
+            profile_dir = f"{RESULTS_DIR}/{challenge}/{prompt_type}/iteration_{iteration}/{PROFILES_DIR}"
+            if not os.path.isdir(profile_dir):
+                continue
+
+            for file_name in sorted(os.listdir(profile_dir)):
+                model, operation = parse_profile_name(file_name)
+                if model in MODELS:
+                    profile_files.append((f"{profile_dir}/{file_name}", model, operation))
+
+    return profile_files
+
+
+def aggregate_profiles(profile_files: list[tuple]) -> list[dict]:
+    """
+    Merges the profiles into one record per function.
+
+    Args:
+        profile_files (list[tuple]): A list of (path, model, operation) tuples.
+
+    Returns:
+        list[dict]: The records of the functions sorted by the total time spent in them.
+    """
+    samples = defaultdict(int)
+    functions = defaultdict(
+        lambda: {
+            "samples": 0,
+            "calls": 0,
+            "total_time": 0.0,
+            "cumulative_time": 0.0,
+            "shares": defaultdict(float),
+        }
+    )
+
+    for path, model, _ in profile_files:
+        stats = pstats.Stats(path)
+        if stats.total_tt <= 0:
+            continue
+
+        samples[model] += 1
+        for function, (_, calls, total_time, cumulative_time, _) in stats.stats.items():
+            name = get_function_name(function, model)
+            if "_lsprof.Profiler" in name:
+                continue
+
+            record = functions[name]
+            record["samples"] += 1
+            record["calls"] += calls
+            record["total_time"] += total_time
+            record["cumulative_time"] += cumulative_time
+            record["shares"][model] += total_time / stats.total_tt
+
+    records = []
+    for name, record in functions.items():
+        records.append(
+            {
+                "function": name,
+                "samples": record["samples"],
+                "calls": record["calls"],
+                "total_time": record["total_time"],
+                "cumulative_time": record["cumulative_time"],
+                "time_share": sum(record["shares"].values()) / max(sum(samples.values()), 1),
+                **{
+                    f"time_share-{model}": record["shares"][model] / max(samples[model], 1)
+                    for model in MODELS
+                },
+            }
+        )
+
+    return sorted(records, key=lambda record: record["total_time"], reverse=True)
+
+
+def main() -> None:
+    for challenge in CHALLENGES:
+        profile_files = get_profile_files(challenge)
+        records = aggregate_profiles(profile_files)
+        if not records:
+            print(f"{challenge}: no profiles found")
+            continue
+
+        with open(f"{RESULTS_DIR}/{challenge}/{HOTSPOTS_FILE}", "w", encoding="utf-8", newline="") as file:
+            writer = csv.writer(file)
+            writer.writerow(["rank", *records[0].keys()])
+            for rank, record in enumerate(records, start=1):
+                writer.writerow([rank, *record.values()])
+
+        print(f"{challenge}: {len(profile_files)} profiles")
+        for rank, record in enumerate(records[:TOP_FUNCTIONS], start=1):
+            print(
+                f"{rank:>3}. {record['function']}: {record['total_time']:.6f}s "
+                f"({record['time_share'] * 100:.2f} % of sample time, {record['calls']} calls)"
+            )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,270 @@
+"""
+This script measures how the calculation time of the generated calculators is split between the phases
+of the calculation (tokenize, validate, parse, evaluate).
+The phases are discovered from the names of the methods and top-level functions of each module (AST),
+every discovered function is wrapped with a timer which measures its exclusive time (the time of nested
+calls of other wrapped functions is not included). Functions nested inside other functions are not wrapped.
+Running: python code/profiler/phases.py (from the root of the repository)
+Output: results/calculator/phase_breakdown.csv
+"""
+
+import ast
+import csv
+import functools
+import multiprocessing
+import queue as queue_module
+import time
+from collections import defaultdict
+
+from config import (
+    GENERATED_DIR,
+    ITERATIONS,
+    MODELS,
+    PHASE_EXPRESSIONS,
+    PHASE_ITERATIONS,
+    PHASE_TIMEOUT,
+    PHASES,
+    PHASES_FILE,
+    PROMPTS,
+    RESULTS_DIR,
+)
+from helpers import get_module_path, load_module
+
+
+PHASE_NAMES = ["tokenize", "validate", "parse", "evaluate", "other"]
+
+
+class PhaseTimer:
+    """
+    Accumulates the exclusive time of the wrapped functions per phase.
+    """
+
+    def __init__(self):
+        """
+        Initializes the timer with empty totals.
+        """
+        self.totals = defaultdict(int)
+        self.calls = defaultdict(int)
+        self._stack = []
+        self._mark = 0
+
+    def wrap(self, function, phase: str):
+        """
+        Wraps the function so that its exclusive time is added to the given phase.
+
+        Args:
+            function (callable): The function to be wrapped.
+            phase (str): The name of the phase the function belongs to.
+
+        Returns:
+            callable: The wrapped function.
+        """
+        timer = self
+        totals = self.totals
+        calls = self.calls
+        stack = self._stack
+        clock = time.perf_counter_ns
+
+        @functools.wraps(function)
+        def wrapper(*args, **kwargs):
+            now = clock()
+            if stack:
+                totals[stack[-1]] += now - timer._mark
+            stack.append(phase)
+            calls[phase] += 1
+            timer._mark = now
+            try:
+                return function(*args, **kwargs)
+            finally:
+                now = clock()
+                totals[stack.pop()] += now - timer._mark
+                timer._mark = now
+
+        return wrapper
+
+
+def get_phase(name: str) -> str:
+    """
+    Returns the phase of the calculation the function belongs to based on its name.
+
+    Args:
+        name (str): The name of the function or method.
+
+    Returns:
+        str: The name of the phase ("other" if no keyword matches).
+    """
+    name = name.lower().lstrip("_")
+    for phase, keywords in PHASES:
+        if any(keyword in name for keyword in keywords):
+            return phase
+    return "other"
+
+
+def discover_functions(path: str) -> dict:
+    """
+    Finds the top-level functions and the methods of the top-level classes in the source file.
+    Special methods, main() and unit tests are skipped.
+
+    Args:
+        path (str): The path to the Python file.
+
+    Returns:
+        dict: A mapping of the class name (None for top-level functions) to a list of function names.
+    """
+    with open(path, "r", encoding="utf-8") as f:
+        tree = ast.parse(f.read())
+
+    def is_measured(name: str) -> bool:
+        return not (name.startswith("__") or name.startswith("test") or name in ("main", "setUp", "tearDown"))
+
+    functions = defaultdict(list)
+    for node in tree.body:
+        if isinstance(node, ast.FunctionDef) and is_measured(node.name):
+            functions[None].append(node.name)
+        elif isinstance(node, ast.ClassDef) and not node.name.startswith("Test"):
+            for child in node.body:
+                if isinstance(child, ast.FunctionDef) and is_measured(child.name):
+                    functions[node.name].append(child.name)
+
+    return functions
+
+
+def instrument(module, timer: PhaseTimer, functions: dict) -> dict:
+    """
+    Replaces the discovered functions of the module with their timed versions.
+
+    Args:
+        module (module): The imported generated module.
+        timer (PhaseTimer): The timer collecting the phase times.
+        functions (dict): The functions discovered by discover_functions.
+
+    Returns:
+        dict: A mapping of the phase to a list of the wrapped function names.
+    """
+    methods = defaultdict(list)
+    for class_name, names in functions.items():
+        owner = module if class_name is None else getattr(module, class_name, None)
+        if owner is None:
+            continue
+
+        for name in names:
+            raw = vars(owner).get(name)
+            phase = get_phase(name)
+
+            if isinstance(raw, staticmethod):
+                setattr(owner, name, staticmethod(timer.wrap(raw.__func__, phase)))
+            elif isinstance(raw, classmethod):
+                setattr(owner, name, classmethod(timer.wrap(raw.__func__, phase)))
+            elif callable(raw):
+                setattr(owner, name, timer.wrap(raw, phase))
+            else:
+                continue
+
+            methods[phase].append(name if class_name is None else f"{class_name}.{name}")
+
+    return methods
+
+
+def measure_phases(path: str, queue: multiprocessing.Queue) -> None:
+    """
+    Measures the phase times of the calculator in the given file (runs in a separate process).
+
+    Args:
+        path (str): The path to the generated module.
+        queue (multiprocessing.Queue): The queue where the result is put.
+
+    Returns:
+        None
+    """
+    try:
+        module = load_module(path, "phase_breakdown_module")
+        timer = PhaseTimer()
+        methods = instrument(module, timer, discover_functions(path))
+        calculator = module.Calculator()
+
+        failed = 0
+        for expression in PHASE_EXPRESSIONS:
+            try:
+                for _ in range(PHASE_ITERATIONS):
+                    calculator.calculate(expression)
+            except Exception as _:
+                failed += 1
+
+        queue.put({"totals": dict(timer.totals), "methods": dict(methods), "failed": failed})
+    except Exception as e:
+        queue.put({"error": f"{type(e).__name__}: {e}"})
+
+
+def run_phase_breakdown(path: str) -> dict:
+    """
+    Runs measure_phases in a fresh process, so the instrumentation does not leak between the modules.
+
+    Args:
+        path (str): The path to the generated module.
+
+    Returns:
+        dict: The result of measure_phases.
+    """
+    queue = multiprocessing.Queue()
+    process = multiprocessing.Process(target=measure_phases, args=(path, queue))
+    process.start()
+    process.join(PHASE_TIMEOUT)
+
+    if process.is_alive():
+        process.terminate()
+        process.join()
+        return {"error": "timeout"}
+
+    try:
+        return queue.get(timeout=1)
+    except queue_module.Empty:
+        return {"error": f"exit code {process.exitcode}"}
+
+
+def main() -> None:
+    header = ["prompt_type", "iteration", "model", "failed_expressions", "total_time"]
+    header += [f"{phase}-fraction" for phase in PHASE_NAMES]
+    header += [f"{phase}-methods" for phase in PHASE_NAMES]
+
+    fractions = defaultdict(lambda: defaultdict(list))
+
+    with open(f"{RESULTS_DIR}/calculator/{PHASES_FILE}", "w", encoding="utf-8", newline="") as file:
+        writer = csv.writer(file)
+        writer.writerow(header)
+
+        for prompt_type in PROMPTS:
+            for iteration in range(1, ITERATIONS + 1):
+                for model in MODELS:
+                    name = f"calculator/{prompt_type}/iteration_{iteration}/{model}"
+                    result = run_phase_breakdown(get_module_path(GENERATED_DIR, "calculator", prompt_type, iteration, model))
+
+                    if "error" in result:
+                        print(f"{name}: failed with error ({result['error']})")
+                        writer.writerow([prompt_type, iteration, model] + [""] * (len(header) - 3))
+                        continue
+
+                    total = sum(result["totals"].values())
+                    row = [prompt_type, iteration, model, result["failed"], total / 1e9]
+                    for phase in PHASE_NAMES:
+                        fraction = result["totals"].get(phase, 0) / total if total else 0
+                        fractions[model][phase].append(fraction)
+                        row.append(fraction)
+                    for phase in PHASE_NAMES:
+                        row.append("; ".join(result["methods"].get(phase, [])))
+                    writer.writerow(row)
+
+                    print(
+                        f"{name}: "
+                        + ", ".join(f"{phase} {fraction * 100:.1f} %" for phase, fraction in zip(PHASE_NAMES, row[5:]))
+                    )
+
+    print("\nAverage phase fractions")
+    for model, phases in fractions.items():
+        print(
+            f"{model}: "
+            + ", ".join(f"{phase} {sum(values) / len(values) * 100:.1f} %" for phase, values in phases.items())
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,847 @@
+"""
+Reference implementation of the ascii_art challenge (performance baseline of the ascii_art benchmarks)
+Every distinct row (indentation, width, symbol) is built once and kept in a bounded LRU cache, so squares and
+rectangles consist of a single row repeated height times and the rows of triangles and pyramids are shared
+between the shapes. Whole drawings are kept in a bounded cache keyed on (shape, dimensions, symbol), limited
+by the total number of cached characters, so repeated calls return the already joined string.
+render_to writes the drawing to a text stream row by row without building the whole string.
+draw_lazy returns a Shape, which stores the rows as runs with a constant change of the indentation and the width
+(a rectangle of any size is one run) and supports str, len, iteration by line, indexing and slicing, building
+only the rows the operation needs.
+Canvas composes several shapes on one NumPy array of character codes (uint8 for Latin-1 symbols, uint32 for any):
+runs of rows of a constant width are written through one strided view of the array (rectangles as a block,
+parallelograms as rows shifted by one column), narrow runs of growing rows (triangles, pyramids) through row masks
+built in blocks and wide ones row by row (a mask costs work for every cell of the bounding box, a row only one
+slice assignment), and the text is decoded from the array in one pass. NumPy is imported when a canvas is created,
+so the import of the module (and the memory baseline of the ascii_art tests) is not affected.
+render_parallel writes very large drawings to a file: the file is created with its exact size (computed from
+the runs), the rows are split into bands (several per worker, so the bands of growing shapes are balanced
+by the pool) and every worker process encodes its bands straight into a shared memory mapping of the file.
+The pool is always started by fork (the module is usually loaded from a path under a name which spawned workers
+cannot import), where fork is not available the bands are written by the calling process.
+render_to_file writes the drawing the same way in the calling process, mapping at most RENDER_WINDOW_BYTES
+of the file at once and encoding the rows in bounded chunks, so its memory is constant for drawings of any size.
+The behaviour follows the specification of 5_functional_correctness.py (ValueError for invalid dimensions
+and symbols, rows joined by newlines without a trailing newline).
+Running: copied as reference.py next to the generated modules by automatic.sh
+"""
+
+import bisect
+import functools
+import itertools
+import mmap
+import multiprocessing
+import os
+import sys
+from collections import OrderedDict
+
+ROW_CACHE_SIZE = 4096
+SHAPE_CACHE_SIZE = 256
+SHAPE_CACHE_CHARACTERS = 16_000_000
+MASK_BLOCK_CELLS = 4_000_000
+MASK_MAX_WIDTH = 256
+RENDER_BANDS_PER_WORKER = 4
+RENDER_MIN_BAND_ROWS = 1024
+RENDER_CHUNK_CHARACTERS = 1 << 20
+RENDER_WINDOW_BYTES = 16 << 20
+# the workers inherit the module by fork, None if the platform cannot fork (the bands are not split)
+POOL_CONTEXT = multiprocessing.get_context("fork") if "fork" in multiprocessing.get_all_start_methods() else None
+
+SHAPES = {
+    "square": ("width",),
+    "rectangle": ("width", "height"),
+    "parallelogram": ("width", "height"),
+    "triangle": ("width", "height"),
+    "pyramid": ("height",),
+}
+
+
+def validate(shape: str, arguments: tuple) -> tuple:
+    """
+    Checks the arguments of a draw_{shape} call.
+
+    Args:
+        shape (str): The name of the shape.
+        arguments (tuple): The dimensions of the shape followed by the symbol.
+
+    Returns:
+        tuple: The dimensions of the shape and the symbol.
+
+    Raises:
+        ValueError: If the shape is unknown, a dimension is not a positive integer
+            or the symbol is not a single printable non-whitespace character.
+    """
+    names = SHAPES.get(shape)
+    if names is None:
+        raise ValueError(f"Unknown shape: {shape}")
+    if len(arguments) != len(names) + 1:
+        raise ValueError(f"The {shape} expects {len(names)} dimensions and a symbol.")
+
+    dimensions = arguments[:-1]
+    for index, value in enumerate(dimensions):
+        if value.__class__ is not int or value <= 0:
+            raise ValueError(f"The {names[index]} must be a positive integer.")
+
+    symbol = arguments[-1]
+    if symbol.__class__ is not str or len(symbol) != 1 or symbol.isspace() or not symbol.isprintable():
+        raise ValueError("The symbol must be a single printable non-whitespace character.")
+
+    return dimensions, symbol
+
+
+@functools.lru_cache(maxsize=ROW_CACHE_SIZE)
+def get_row(indent: int, width: int, symbol: str) -> str:
+    """
+    Builds one row of a drawing (the results are kept in a bounded LRU cache).
+
+    Args:
+        indent (int): The number of leading spaces.
+        width (int): The number of symbols.
+        symbol (str): The symbol.
+
+    Returns:
+        str: The row without the newline.
+    """
+    return " " * indent + symbol * width
+
+
+def get_runs(shape: str, dimensions: tuple) -> list[tuple]:
+    """
+    Describes the rows of a drawing as runs of rows whose indentation and width change by a constant step.
+
+    Args:
+        shape (str): The name of the shape.
+        dimensions (tuple): The validated dimensions of the shape.
+
+    Returns:
+        list[tuple]: The (count, indent, indent_step, width, width_step) runs in the order of the rows.
+    """
+    if shape == "square":
+        (width,) = dimensions
+        return [(width, 0, 0, width, 0)]
+
+    if shape == "rectangle":
+        width, height = dimensions
+        return [(height, 0, 0, width, 0)]
+
+    if shape == "parallelogram":
+        width, height = dimensions
+        return [(height, 0, 1, width, 0)]
+
+    if shape == "pyramid":
+        (height,) = dimensions
+        return [(height, height - 1, -1, 1, 2)]
+
+    # the widths of the triangle rows (ceil(row * width / height)) grow unevenly, consecutive rows are merged
+    width, height = dimensions
+    runs = []
+    for row in range(1, height + 1):
+        row_width = (row * width + height - 1) // height
+        if runs and runs[-1][0] == 1:
+            runs[-1] = (2, 0, 0, runs[-1][3], row_width - runs[-1][3])
+        elif runs and row_width == runs[-1][3] + runs[-1][0] * runs[-1][4]:
+            runs[-1] = (runs[-1][0] + 1, *runs[-1][1:])
+        else:
+            runs.append((1, 0, 0, row_width, 0))
+    return runs
+
+
+def get_width(runs: list[tuple]) -> int:
+    """
+    Returns the width of the bounding box of a drawing (the indentation and the width change linearly in a run,
+    so the widest row of a run is its first or its last row).
+
+    Args:
+        runs (list[tuple]): The runs of the rows (see get_runs).
+
+    Returns:
+        int: The length of the longest row.
+    """
+    return max(
+        max(indent + width, indent + width + (count - 1) * (indent_step + width_step))
+        for count, indent, indent_step, width, width_step in runs
+    )
+
+
+def get_rows(runs: list[tuple], symbol: str, start: int = 0) -> iter:
+    """
+    Generates the rows of a drawing from its runs.
+
+    Args:
+        runs (list[tuple]): The runs of the rows (see get_runs).
+        symbol (str): The symbol.
+        start (int): The index of the first generated row.
+
+    Returns:
+        iter: The rows of the drawing (without newlines).
+    """
+    for count, indent, indent_step, width, width_step in runs:
+        if start >= count:
+            start -= count
+            continue
+
+        if not indent_step and not width_step:
+            yield from itertools.repeat(get_row(indent, width, symbol), count - start)
+        else:
+            for row in range(start, count):
+                yield get_row(indent + row * indent_step, width + row * width_step, symbol)
+        start = 0
+
+
+def get_bands(runs: list[tuple], symbol_size: int, band_rows: int) -> list[tuple]:
+    """
+    Splits the rows of a drawing into bands of band_rows rows and computes the position of every band
+    in the UTF-8 encoded drawing.
+
+    Args:
+        runs (list[tuple]): The runs of the rows (see get_runs).
+        symbol_size (int): The number of bytes of the encoded symbol.
+        band_rows (int): The number of rows of a band (the last band may be shorter).
+
+    Returns:
+        list[tuple]: The (offset, size, runs) bands, the size includes the newline after every row
+            except the last row of the drawing.
+    """
+    bands = []
+    band, offset, size, left = [], 0, 0, band_rows
+    for count, indent, indent_step, width, width_step in runs:
+        skip = 0
+        while skip < count:
+            rows = min(count - skip, left)
+            start_indent, start_width = indent + skip * indent_step, width + skip * width_step
+            band.append((rows, start_indent, indent_step, start_width, width_step))
+            size += rows * (start_indent + start_width * symbol_size + 1)
+            size += (indent_step + width_step * symbol_size) * rows * (rows - 1) // 2
+            skip += rows
+            left -= rows
+            if not left:
+                bands.append((offset, size, band))
+                band, offset, size, left = [], offset + size, 0, band_rows
+    if band:
+        bands.append((offset, size, band))
+
+    offset, size, band = bands[-1]
+    bands[-1] = (offset, size - 1, band)
+    return bands
+
+
+def get_chunks(runs: list[tuple], symbol: str) -> iter:
+    """
+    Generates the UTF-8 encoded rows of a drawing, every row followed by a newline, in chunks of about
+    RENDER_CHUNK_CHARACTERS characters. Rows longer than a chunk are split into several chunks and the rows
+    are not kept in the row cache, so the memory does not depend on the size of the drawing.
+
+    Args:
+        runs (list[tuple]): The runs of the rows (see get_runs).
+        symbol (str): The symbol.
+
+    Returns:
+        iter: The chunks (bytes).
+    """
+    encoded = symbol.encode("utf-8")
+    lines, characters = [], 0
+    for count, indent, indent_step, width, width_step in runs:
+        if not indent_step and not width_step and indent + width < RENDER_CHUNK_CHARACTERS:
+            # a run of identical rows: whole chunks are the same block of rows
+            if lines:
+                yield b"".join(lines)
+                lines, characters = [], 0
+            line = b" " * indent + encoded * width + b"\n"
+            per_chunk = max(RENDER_CHUNK_CHARACTERS // (indent + width + 1), 1)
+            block = line * min(per_chunk, count)
+            for _ in range(count // per_chunk):
+                yield block
+            if count % per_chunk:
+                yield line * (count % per_chunk)
+            continue
+
+        for row in range(count):
+            row_indent, row_width = indent + row * indent_step, width + row * width_step
+            if row_indent + row_width < RENDER_CHUNK_CHARACTERS:
+                lines.append(b" " * row_indent + encoded * row_width + b"\n")
+                characters += row_indent + row_width + 1
+                if characters >= RENDER_CHUNK_CHARACTERS:
+                    yield b"".join(lines)
+                    lines, characters = [], 0
+                continue
+
+            if lines:
+                yield b"".join(lines)
+                lines, characters = [], 0
+            for part, repeats in ((b" ", row_indent), (encoded, row_width)):
+                for done in range(0, repeats, RENDER_CHUNK_CHARACTERS):
+                    yield part * min(RENDER_CHUNK_CHARACTERS, repeats - done)
+            yield b"\n"
+    if lines:
+        yield b"".join(lines)
+
+
+def render_band(path: str, offset: int, size: int, runs: list[tuple], symbol: str) -> int:
+    """
+    Writes one band of rows into the file through shared memory mappings of its part of the file
+    (used by render_to_file and by the worker processes of render_parallel). At most RENDER_WINDOW_BYTES
+    of the file are mapped at once, so the resident memory of the process does not grow with the band.
+
+    Args:
+        path (str): The path of the file (already of the final size).
+        offset (int): The position of the band in the file.
+        size (int): The number of bytes of the band.
+        runs (list[tuple]): The runs of the rows of the band.
+        symbol (str): The symbol.
+
+    Returns:
+        int: The number of written bytes.
+    """
+    chunks = get_chunks(runs, symbol)
+    pending = memoryview(b"")
+    position, end = offset, offset + size
+    with open(path, "r+b") as file:
+        while position < end:
+            start = position - position % mmap.ALLOCATIONGRANULARITY
+            stop = min(start + RENDER_WINDOW_BYTES, end)
+            with mmap.mmap(file.fileno(), stop - start, offset=start) as window:
+                # every row is followed by a newline, the one after the last row of the drawing is cut off
+                while position < stop:
+                    if not pending:
+                        pending = memoryview(next(chunks))
+                    length = min(len(pending), stop - position)
+                    window[position - start : position - start + length] = pending[:length]
+                    pending = pending[length:]
+                    position += length
+    return size
+
+
+class Shape:
+    """
+    A lazy drawing stored as runs of rows (see get_runs), its rows and characters are built on demand.
+    It behaves like the string returned by draw_{shape}: str() builds the whole drawing, len() is its length,
+    indexing and slicing return the same characters and iteration yields its lines (without newlines).
+    """
+
+    __slots__ = ("symbol", "height", "width", "_runs", "_rows", "_offsets", "_length")
+
+    def __init__(self, runs: list[tuple], symbol: str):
+        self.symbol = symbol
+        self._runs = runs
+        # the index of the first row and the offset of the first character of every run
+        self._rows = []
+        self._offsets = []
+        rows = offset = 0
+        for count, indent, indent_step, width, width_step in runs:
+            self._rows.append(rows)
+            self._offsets.append(offset)
+            rows += count
+            offset += count * (indent + width + 1) + (indent_step + width_step) * count * (count - 1) // 2
+        self.height = rows
+        self.width = get_width(runs)
+        self._length = offset - 1
+
+    def __len__(self) -> int:
+        return self._length
+
+    def __str__(self) -> str:
+        return "\n".join(get_rows(self._runs, self.symbol))
+
+    def __repr__(self) -> str:
+        return f"Shape(height={self.height}, length={self._length}, symbol={self.symbol!r})"
+
+    def __iter__(self) -> iter:
+        return get_rows(self._runs, self.symbol)
+
+    def __getitem__(self, key):
+        """
+        Returns the character or the slice of the drawing, only the rows of the slice are built.
+
+        Args:
+            key (int | slice): The index of the character or the slice.
+
+        Returns:
+            str: The character or the slice of the drawing.
+
+        Raises:
+            IndexError: If the index is out of range.
+            TypeError: If the key is not an integer or a slice.
+        """
+        if isinstance(key, slice):
+            start, stop, step = key.indices(self._length)
+            indices = range(start, stop, step)
+            if not indices:
+                return ""
+            if step != 1:
+                low = min(indices[0], indices[-1])
+                return self[low : max(indices[0], indices[-1]) + 1][indices[0] - low :: step]
+            return self._get_range(start, stop)
+
+        if not isinstance(key, int):
+            raise TypeError(f"Shape indices must be integers or slices, not {type(key).__name__}.")
+        index = key + self._length if key < 0 else key
+        if not 0 <= index < self._length:
+            raise IndexError("Shape index out of range.")
+        return self._get_range(index, index + 1)
+
+    def row(self, index: int) -> str:
+        """
+        Returns one row (line) of the drawing.
+
+        Args:
+            index (int): The index of the row (negative indices count from the end).
+
+        Returns:
+            str: The row without the newline.
+
+        Raises:
+            IndexError: If the index is out of range.
+        """
+        if index < 0:
+            index += self.height
+        if not 0 <= index < self.height:
+            raise IndexError("Shape row index out of range.")
+        return next(get_rows(self._runs, self.symbol, index))
+
+    def _locate(self, position: int) -> tuple[int, int]:
+        """
+        Finds the row containing the character (binary search over the runs and over the rows of the run).
+
+        Args:
+            position (int): The index of the character.
+
+        Returns:
+            tuple[int, int]: The index of the row and the index of the character in the row.
+        """
+        run = bisect.bisect_right(self._offsets, position) - 1
+        count, indent, indent_step, width, width_step = self._runs[run]
+        length, step = indent + width + 1, indent_step + width_step
+        offset = position - self._offsets[run]
+
+        # the largest row of the run whose start is not after the position
+        low, high = 0, count - 1
+        while low < high:
+            middle = (low + high + 1) // 2
+            if middle * length + step * middle * (middle - 1) // 2 <= offset:
+                low = middle
+            else:
+                high = middle - 1
+        return self._rows[run] + low, offset - (low * length + step * low * (low - 1) // 2)
+
+    def _get_range(self, start: int, stop: int) -> str:
+        """
+        Builds the characters from start to stop (0 <= start < stop <= len).
+
+        Args:
+            start (int): The index of the first character.
+            stop (int): The index after the last character.
+
+        Returns:
+            str: The characters of the drawing.
+        """
+        row, column = self._locate(start)
+        parts = []
+        size = stop - start
+        for line in get_rows(self._runs, self.symbol, row):
+            part = (line + "\n")[column : column + size]
+            parts.append(part)
+            size -= len(part)
+            if size <= 0:
+                break
+            column = 0
+        return "".join(parts)
+
+
+class Canvas:
+    """
+    A rectangular canvas of characters backed by a NumPy array, several shapes can be placed on it
+    (later shapes overwrite the earlier ones) and the whole canvas is converted to text in one pass.
+    """
+
+    def __init__(self, width: int, height: int, background: str = " ", dtype: str = "uint8"):
+        """
+        Creates an empty canvas.
+
+        Args:
+            width (int): The number of columns.
+            height (int): The number of rows.
+            background (str): The character of the empty cells.
+            dtype (str): "uint8" (symbols up to U+00FF, one byte per cell) or "uint32" (any symbol).
+
+        Raises:
+            ValueError: If a dimension is not a positive integer, the background is not a single character
+                or the dtype is not supported.
+        """
+        import numpy
+
+        for name, value in (("width", width), ("height", height)):
+            if value.__class__ is not int or value <= 0:
+                raise ValueError(f"The {name} must be a positive integer.")
+        if dtype not in ("uint8", "uint32"):
+            raise ValueError("The dtype must be uint8 or uint32.")
+
+        self.width = width
+        self.height = height
+        self._limit = 0x100 if dtype == "uint8" else 0x110000
+        self._encoding = "latin-1" if dtype == "uint8" else f"utf-32-{'le' if sys.byteorder == 'little' else 'be'}"
+        # the last column holds the newlines, so the text is the bytes of the whole array
+        self._array = numpy.empty((height, width + 1), dtype=dtype)
+        self._array[:, width] = ord("\n")
+        self._cells = self._array[:, :width]
+        self._cells.fill(self._get_code(background))
+
+    def place(self, shape: str, column: int, row: int, *arguments) -> "Canvas":
+        """
+        Draws the shape with the top left corner of its bounding box at the given cell, the parts of the shape
+        outside of the canvas are clipped. Only the symbols are drawn, the spaces of the shape are transparent.
+
+        Args:
+            shape (str): The name of the shape (square, rectangle, parallelogram, triangle or pyramid).
+            column (int): The column of the top left corner (may be negative).
+            row (int): The row of the top left corner (may be negative).
+            *arguments: The arguments of draw_{shape} (the dimensions followed by the symbol).
+
+        Returns:
+            Canvas: The canvas (for chaining).
+
+        Raises:
+            ValueError: If the shape or its arguments are invalid or the symbol does not fit the dtype.
+        """
+        dimensions, symbol = validate(shape, arguments)
+        code = self._get_code(symbol)
+
+        first = row
+        for count, indent, indent_step, width, width_step in get_runs(shape, dimensions):
+            # the rows of the run inside the canvas
+            skip = max(-first, 0)
+            rows = min(count, self.height - first) - skip
+            if rows > 0:
+                self._fill_run(
+                    first + skip, column + indent + skip * indent_step, indent_step, width + skip * width_step,
+                    width_step, rows, code,
+                )
+            first += count
+        return self
+
+    def __str__(self) -> str:
+        # the array without the last newline is decoded directly from its buffer (no intermediate bytes)
+        return str(self._array.reshape(-1)[:-1], self._encoding)
+
+    def _get_code(self, symbol: str) -> int:
+        """
+        Returns the code of the symbol stored in the array.
+
+        Args:
+            symbol (str): The symbol.
+
+        Returns:
+            int: The code point of the symbol.
+
+        Raises:
+            ValueError: If the symbol is not a single character or it does not fit the dtype.
+        """
+        if symbol.__class__ is not str or len(symbol) != 1:
+            raise ValueError("The symbol must be a single character.")
+        if ord(symbol) >= self._limit:
+            raise ValueError(f"The symbol {symbol!r} does not fit the dtype of the canvas, use uint32.")
+        return ord(symbol)
+
+    def _fill_run(
+        self, row: int, start: int, start_step: int, width: int, width_step: int, rows: int, code: int
+    ) -> None:
+        """
+        Fills the cells [start + i * start_step, start + i * start_step + width + i * width_step) of the rows
+        row + i (0 <= i < rows) with the code, the columns outside of the canvas are clipped.
+
+        Args:
+            row (int): The first row (inside the canvas).
+            start (int): The first column of the first row.
+            start_step (int): The change of the first column between the rows.
+            width (int): The width of the first row.
+            width_step (int): The change of the width between the rows.
+            rows (int): The number of the rows (all inside the canvas).
+            code (int): The code of the symbol.
+
+        Returns:
+            None
+        """
+        import numpy
+
+        last_start = start + (rows - 1) * start_step
+        last_end = last_start + width + (rows - 1) * width_step
+        inside = min(start, last_start) >= 0 and max(start + width, last_end) <= self.width
+
+        if not width_step and inside:
+            # one strided view: the rows of the view are shifted by start_step columns
+            item = self._array.itemsize
+            view = numpy.lib.stride_tricks.as_strided(
+                self._array[row:, start:],
+                shape=(rows, width),
+                strides=(self._array.strides[0] + start_step * item, item),
+                writeable=True,
+            )
+            view.fill(code)
+            return
+
+        low = max(min(start, last_start), 0)
+        high = min(max(start + width, last_end), self.width)
+        if low >= high:
+            return
+
+        if high - low > MASK_MAX_WIDTH:
+            for step in range(rows):
+                first = start + step * start_step
+                last = first + width + step * width_step
+                if max(first, 0) < min(last, self.width):
+                    self._cells[row + step, max(first, 0) : min(last, self.width)] = code
+            return
+
+        # masks of the rows of the bounding box, built in blocks of at most MASK_BLOCK_CELLS cells
+        columns = numpy.arange(low, high)
+        block = max(MASK_BLOCK_CELLS // (high - low), 1)
+        for offset in range(0, rows, block):
+            steps = numpy.arange(offset, min(offset + block, rows))[:, None]
+            starts = start + steps * start_step
+            ends = starts + width + steps * width_step
+            mask = (columns >= starts) & (columns < ends)
+            numpy.copyto(self._cells[row + offset : row + offset + len(steps), low:high], code, where=mask)
+
+
+class AsciiArt:
+    """
+    Draws ASCII art shapes (reference implementation of the challenge interface).
+    """
+
+    def __init__(self):
+        self._shapes = OrderedDict()
+        self._cached_characters = 0
+
+    def draw_square(self, width: int, symbol: str) -> str:
+        """
+        Draws a square.
+
+        Args:
+            width (int): The width and the height of the square.
+            symbol (str): The symbol filling the square.
+
+        Returns:
+            str: The drawing.
+
+        Raises:
+            ValueError: If the width is not a positive integer or the symbol is not a single character.
+        """
+        return self._draw("square", (width, symbol))
+
+    def draw_rectangle(self, width: int, height: int, symbol: str) -> str:
+        """
+        Draws a rectangle.
+
+        Args:
+            width (int): The width of the rectangle.
+            height (int): The height of the rectangle.
+            symbol (str): The symbol filling the rectangle.
+
+        Returns:
+            str: The drawing.
+
+        Raises:
+            ValueError: If a dimension is not a positive integer or the symbol is not a single character.
+        """
+        return self._draw("rectangle", (width, height, symbol))
+
+    def draw_parallelogram(self, width: int, height: int, symbol: str) -> str:
+        """
+        Draws a parallelogram (every row is shifted by one space to the right).
+
+        Args:
+            width (int): The width of the rows.
+            height (int): The number of rows.
+            symbol (str): The symbol filling the parallelogram.
+
+        Returns:
+            str: The drawing.
+
+        Raises:
+            ValueError: If a dimension is not a positive integer or the symbol is not a single character.
+        """
+        return self._draw("parallelogram", (width, height, symbol))
+
+    def draw_triangle(self, width: int, height: int, symbol: str) -> str:
+        """
+        Draws a right-angled triangle (the rows grow up to the width).
+
+        Args:
+            width (int): The width of the last row.
+            height (int): The number of rows.
+            symbol (str): The symbol filling the triangle.
+
+        Returns:
+            str: The drawing.
+
+        Raises:
+            ValueError: If a dimension is not a positive integer or the symbol is not a single character.
+        """
+        return self._draw("triangle", (width, height, symbol))
+
+    def draw_pyramid(self, height: int, symbol: str) -> str:
+        """
+        Draws a symmetric pyramid.
+
+        Args:
+            height (int): The number of rows.
+            symbol (str): The symbol filling the pyramid.
+
+        Returns:
+            str: The drawing.
+
+        Raises:
+            ValueError: If the height is not a positive integer or the symbol is not a single character.
+        """
+        return self._draw("pyramid", (height, symbol))
+
+    def draw_lazy(self, shape: str, *arguments) -> Shape:
+        """
+        Returns the drawing as a lazy Shape, which stores only the runs of its rows (constant memory
+        except for triangles, whose runs are at most the number of rows). The rows are built on demand.
+
+        Args:
+            shape (str): The name of the shape (square, rectangle, parallelogram, triangle or pyramid).
+            *arguments: The arguments of draw_{shape} (the dimensions followed by the symbol).
+
+        Returns:
+            Shape: The lazy drawing, str(shape) is equal to the result of draw_{shape}.
+
+        Raises:
+            ValueError: If the shape is unknown or the arguments are invalid.
+        """
+        dimensions, symbol = validate(shape, arguments)
+        return Shape(get_runs(shape, dimensions), symbol)
+
+    def render_to(self, stream, shape: str, *arguments) -> iter:
+        """
+        Writes the drawing to a text stream row by row, the whole drawing is never built.
+        The rows are written while the generator is iterated, it yields the number of characters
+        written so far after every row (the last value is the length of the drawing).
+
+        Args:
+            stream: The text stream (an object with a write method).
+            shape (str): The name of the shape (square, rectangle, parallelogram, triangle or pyramid).
+            *arguments: The arguments of draw_{shape} (the dimensions followed by the symbol).
+
+        Returns:
+            iter: The number of written characters after every row.
+
+        Raises:
+            ValueError: If the shape is unknown or the arguments are invalid (raised before anything is written).
+        """
+        dimensions, symbol = validate(shape, arguments)
+        return self._write_rows(stream, get_rows(get_runs(shape, dimensions), symbol))
+
+    def render_to_file(self, path: str, shape: str, *arguments) -> int:
+        """
+        Writes the drawing to a UTF-8 file (the content is equal to the result of draw_{shape}).
+        The file is created with its exact size and filled row by row through a memory mapping,
+        the memory used does not depend on the size of the drawing.
+
+        Args:
+            path (str): The path of the file (overwritten if it exists).
+            shape (str): The name of the shape (square, rectangle, parallelogram, triangle or pyramid).
+            *arguments: The arguments of draw_{shape} (the dimensions followed by the symbol).
+
+        Returns:
+            int: The size of the file in bytes.
+
+        Raises:
+            ValueError: If the shape is unknown or the arguments are invalid (raised before the file is created).
+        """
+        dimensions, symbol = validate(shape, arguments)
+        runs = get_runs(shape, dimensions)
+        ((_, size, _),) = get_bands(runs, len(symbol.encode("utf-8")), sum(run[0] for run in runs))
+
+        with open(path, "wb") as file:
+            file.truncate(size)
+        return render_band(path, 0, size, runs, symbol)
+
+    def render_parallel(self, path: str, shape: str, *arguments, workers: int | None = None) -> int:
+        """
+        Writes the drawing to a UTF-8 file (the content is equal to the result of draw_{shape}).
+        The file is created with its exact size and the bands of rows are written into it by a pool
+        of worker processes, so the drawing is never built as one string.
+
+        Args:
+            path (str): The path of the file (overwritten if it exists).
+            shape (str): The name of the shape (square, rectangle, parallelogram, triangle or pyramid).
+            *arguments: The arguments of draw_{shape} (the dimensions followed by the symbol).
+            workers (int | None): The number of worker processes started by fork (None = one per CPU core,
+                1 or a platform without fork = the bands are written by the calling process).
+
+        Returns:
+            int: The size of the file in bytes.
+
+        Raises:
+            ValueError: If the shape is unknown or the arguments are invalid (raised before the file is created).
+        """
+        dimensions, symbol = validate(shape, arguments)
+        runs = get_runs(shape, dimensions)
+        workers = workers or os.cpu_count() or 1
+        height = sum(run[0] for run in runs)
+        band_rows = max(-(-height // (workers * RENDER_BANDS_PER_WORKER)), RENDER_MIN_BAND_ROWS)
+        bands = get_bands(runs, len(symbol.encode("utf-8")), band_rows)
+        size = bands[-1][0] + bands[-1][1]
+
+        with open(path, "wb") as file:
+            file.truncate(size)
+
+        tasks = [(path, offset, band_size, band_runs, symbol) for offset, band_size, band_runs in bands]
+        if workers == 1 or len(tasks) == 1 or POOL_CONTEXT is None:
+            for task in tasks:
+                render_band(*task)
+        else:
+            # one band per task, the workers take the next band when they finish one
+            with POOL_CONTEXT.Pool(min(workers, len(tasks))) as pool:
+                pool.starmap(render_band, tasks, chunksize=1)
+        return size
+
+    def _draw(self, shape: str, arguments: tuple) -> str:
+        """
+        Returns the drawing from the shape cache or builds it and caches it.
+        Drawings larger than SHAPE_CACHE_CHARACTERS are not cached, the least recently used drawings
+        are evicted when the cache exceeds SHAPE_CACHE_SIZE drawings or SHAPE_CACHE_CHARACTERS characters.
+
+        Args:
+            shape (str): The name of the shape.
+            arguments (tuple): The dimensions of the shape followed by the symbol.
+
+        Returns:
+            str: The drawing.
+        """
+        dimensions, symbol = validate(shape, arguments)
+        key = (shape, dimensions, symbol)
+        drawing = self._shapes.get(key)
+        if drawing is not None:
+            self._shapes.move_to_end(key)
+            return drawing
+
+        drawing = "\n".join(get_rows(get_runs(shape, dimensions), symbol))
+        if len(drawing) <= SHAPE_CACHE_CHARACTERS:
+            self._shapes[key] = drawing
+            self._cached_characters += len(drawing)
+            while len(self._shapes) > SHAPE_CACHE_SIZE or self._cached_characters > SHAPE_CACHE_CHARACTERS:
+                self._cached_characters -= len(self._shapes.popitem(last=False)[1])
+        return drawing
+
+    @staticmethod
+    def _write_rows(stream, rows: iter) -> iter:
+        """
+        Writes the rows separated by newlines to the stream.
+
+        Args:
+            stream: The text stream.
+            rows (iter): The rows of the drawing.
+
+        Returns:
+            iter: The number of written characters after every row.
+        """
+        written = 0
+        for index, row in enumerate(rows):
+            if index:
+                stream.write("\n")
+                written += 1
+            stream.write(row)
+            written += len(row)
+            yield written
@@ -0,0 +1,379 @@
+"""
+Reference implementation of the calculator challenge (performance baseline of the calculator benchmarks)
+Expressions are compiled once into a compact postfix program (numbers and operator functions) by the
+shunting-yard algorithm and the programs are kept in a bounded LRU cache, so repeated calls of calculate
+with the same expression only evaluate the program. Both the compilation and the evaluation use explicit
+stacks, so deeply nested parentheses do not hit the recursion limit of Python.
+calculate_many evaluates a batch of expressions: identical expressions are evaluated once, large batches
+can be split across a process pool and the errors are returned as structured results instead of being raised.
+The pool is always started by fork (the module is usually loaded from a path under a name which spawned workers
+cannot import), where fork is not available the batch is evaluated in the calling process.
+compile parses an expression with named variables once into a Formula, which evaluates it over NumPy arrays
+of the values of the variables (vectorized, temporary arrays are reused in place). NumPy is imported on the
+first evaluation, so the import of the module (and the memory baseline of the calculator tests) is not affected.
+The behaviour follows the specification of 5_functional_correctness.py (ValueError for invalid expressions,
+ZeroDivisionError for division by zero, unary plus and minus).
+Running: copied as reference.py next to the generated modules by automatic.sh
+"""
+
+import functools
+import multiprocessing
+import operator
+import re
+
+CACHE_SIZE = 1024
+POOL_THRESHOLD = 10_000
+CHUNK_SIZE = 2_000
+# the workers inherit the module by fork, None if the platform cannot fork (the batch is not split)
+POOL_CONTEXT = multiprocessing.get_context("fork") if "fork" in multiprocessing.get_all_start_methods() else None
+
+TOKEN_PATTERN = re.compile(r"\s*(?:(\d+(?:\.\d*)?|\.\d+)|([-+*/()])|([A-Za-z_]\w*)|(\S))")
+
+BINARY_OPERATORS = {
+    "+": (1, operator.add),
+    "-": (1, operator.sub),
+    "*": (2, operator.mul),
+    "/": (2, operator.truediv),
+}
+NEGATE = operator.neg
+
+# NumPy functions of the operators (evaluation of the formulas)
+UFUNCS = {
+    operator.add: "add",
+    operator.sub: "subtract",
+    operator.mul: "multiply",
+    operator.truediv: "true_divide",
+}
+
+
+def tokenize(expression: str, names: bool = False) -> list[tuple]:
+    """
+    Splits the expression into numbers, operators, parentheses and (if allowed) names of variables.
+
+    Args:
+        expression (str): The arithmetic expression.
+        names (bool): Whether names of variables are allowed.
+
+    Returns:
+        list[tuple]: A list of (kind, value) tuples, kind is "number", "symbol" or "name".
+
+    Raises:
+        ValueError: If the expression contains an invalid character.
+    """
+    tokens = []
+    position = 0
+    expression = expression.rstrip()
+    while position < len(expression):
+        match = TOKEN_PATTERN.match(expression, position)
+        number, symbol, name, invalid = match.groups()
+        if number is not None:
+            tokens.append(("number", float(number)))
+        elif symbol is not None:
+            tokens.append(("symbol", symbol))
+        elif name is not None and names:
+            tokens.append(("name", name))
+        else:
+            invalid = invalid or name
+            raise ValueError(f"Invalid character '{invalid[0]}' at position {match.end() - len(invalid)}.")
+        position = match.end()
+    return tokens
+
+
+def get_function(entry) -> object:
+    """
+    Returns the function of an entry of the operator stack.
+
+    Args:
+        entry: NEGATE or a (precedence, function) tuple of a binary operator.
+
+    Returns:
+        object: The function stored in the program.
+    """
+    return entry if entry is NEGATE else entry[1]
+
+
+@functools.lru_cache(maxsize=CACHE_SIZE)
+def compile_expression(expression: str, names: bool = False) -> tuple:
+    """
+    Compiles the expression into a postfix program (shunting-yard algorithm with unary operators).
+    The results are kept in a bounded LRU cache (invalid expressions are not cached).
+
+    Args:
+        expression (str): The arithmetic expression.
+        names (bool): Whether names of variables are allowed.
+
+    Returns:
+        tuple: The program, numbers (float), names of variables (str) and operator functions in the postfix order.
+
+    Raises:
+        ValueError: If the expression is empty or not well-formed.
+    """
+    program = []
+    operators = []
+    expect_operand = True
+
+    for kind, value in tokenize(expression, names):
+        if expect_operand:
+            if kind != "symbol":
+                program.append(value)
+                expect_operand = False
+            elif value == "(":
+                operators.append(value)
+            elif value == "-":
+                operators.append(NEGATE)
+            elif value != "+":
+                raise ValueError(f"Unexpected '{value}', an operand was expected.")
+            continue
+
+        if kind != "symbol" or value == "(":
+            raise ValueError(f"Unexpected '{value}', an operator was expected.")
+
+        if value == ")":
+            while operators and operators[-1] != "(":
+                program.append(get_function(operators.pop()))
+            if not operators:
+                raise ValueError("Unmatched closing parenthesis.")
+            operators.pop()
+            continue
+
+        precedence, function = BINARY_OPERATORS[value]
+        while operators and operators[-1] != "(":
+            top = operators[-1]
+            if top is not NEGATE and top[0] < precedence:
+                break
+            program.append(get_function(operators.pop()))
+        operators.append((precedence, function))
+        expect_operand = True
+
+    if expect_operand:
+        raise ValueError("Incomplete expression, an operand was expected.")
+
+    while operators:
+        top = operators.pop()
+        if top == "(":
+            raise ValueError("Unmatched opening parenthesis.")
+        program.append(get_function(top))
+
+    return tuple(program)
+
+
+def evaluate(program: tuple) -> float:
+    """
+    Evaluates the postfix program with an explicit stack.
+
+    Args:
+        program (tuple): The program created by compile_expression.
+
+    Returns:
+        float: The value of the expression.
+
+    Raises:
+        ZeroDivisionError: If the expression divides by zero.
+    """
+    stack = []
+    push = stack.append
+    pop = stack.pop
+    for item in program:
+        if item.__class__ is float:
+            push(item)
+        elif item is NEGATE:
+            stack[-1] = -stack[-1]
+        else:
+            right = pop()
+            stack[-1] = item(stack[-1], right)
+    return stack[0]
+
+
+def get_result(expression: str) -> dict:
+    """
+    Calculates the value of the expression and catches the errors of invalid expressions.
+
+    Args:
+        expression (str): The arithmetic expression.
+
+    Returns:
+        dict: The value (None on error), the name of the exception and its message (None on success).
+    """
+    try:
+        return {"value": evaluate(compile_expression(expression)), "error": None, "message": None}
+    except (ValueError, ZeroDivisionError) as error:
+        return {"value": None, "error": type(error).__name__, "message": str(error)}
+
+
+def calculate_chunk(expressions: list[str]) -> list[dict]:
+    """
+    Calculates the results of a chunk of expressions (the task of a worker process of calculate_many).
+
+    Args:
+        expressions (list[str]): The arithmetic expressions.
+
+    Returns:
+        list[dict]: The result of every expression in the format of get_result.
+    """
+    return [get_result(expression) for expression in expressions]
+
+
+class Formula:
+    """
+    An expression with named variables compiled once and evaluated over NumPy arrays of their values.
+    """
+
+    __slots__ = ("expression", "variables", "_program")
+
+    def __init__(self, expression: str):
+        """
+        Compiles the expression.
+
+        Args:
+            expression (str): The arithmetic expression with names of variables.
+
+        Raises:
+            ValueError: If the expression is not a well-formed arithmetic expression.
+        """
+        if not isinstance(expression, str):
+            raise ValueError("The expression must be a string.")
+
+        self.expression = expression
+        self._program = compile_expression(expression, True)
+        self.variables = tuple(dict.fromkeys(item for item in self._program if item.__class__ is str))
+
+    def evaluate(self, **bindings):
+        """
+        Evaluates the formula over the values of the variables (broadcast by the NumPy rules).
+        The program is evaluated with an explicit stack of arrays, the operators are applied to whole arrays
+        and the results of the operators are overwritten in place by the following operators.
+
+        Args:
+            **bindings: The values of the variables (numbers or array-likes of numbers) by their names.
+
+        Returns:
+            numpy.ndarray: The values of the formula (a 0-d array if all values are numbers).
+
+        Raises:
+            ValueError: If a variable is missing or unknown or its values are not numbers.
+            ZeroDivisionError: If the formula divides by zero for any of the values.
+        """
+        import numpy
+
+        if set(bindings) != set(self.variables):
+            missing = ", ".join(sorted(set(self.variables) - set(bindings))) or "-"
+            unknown = ", ".join(sorted(set(bindings) - set(self.variables))) or "-"
+            raise ValueError(f"Missing variables: {missing}, unknown variables: {unknown}.")
+
+        arrays = {}
+        for name, values in bindings.items():
+            try:
+                arrays[name] = numpy.asarray(values, dtype=numpy.float64)
+            except (TypeError, ValueError):
+                raise ValueError(f"The values of the variable '{name}' must be numbers.") from None
+
+        # owned[i] = the array on the stack is a temporary result which can be overwritten
+        stack = []
+        owned = []
+        for item in self._program:
+            if item.__class__ is float:
+                stack.append(item)
+                owned.append(False)
+            elif item.__class__ is str:
+                stack.append(arrays[item])
+                owned.append(False)
+            elif item is NEGATE:
+                if owned[-1]:
+                    numpy.negative(stack[-1], out=stack[-1])
+                else:
+                    stack[-1] = numpy.negative(stack[-1])
+                    owned[-1] = isinstance(stack[-1], numpy.ndarray)
+            else:
+                right = stack.pop()
+                right_owned = owned.pop()
+                left = stack[-1]
+                if item is operator.truediv and not numpy.all(right):
+                    raise ZeroDivisionError("float division by zero")
+
+                ufunc = getattr(numpy, UFUNCS[item])
+                shape = numpy.broadcast_shapes(numpy.shape(left), numpy.shape(right))
+                if owned[-1] and left.shape == shape:
+                    ufunc(left, right, out=left)
+                elif right_owned and right.shape == shape:
+                    stack[-1] = ufunc(left, right, out=right)
+                    owned[-1] = True
+                else:
+                    stack[-1] = ufunc(left, right)
+                    owned[-1] = isinstance(stack[-1], numpy.ndarray)
+
+        return stack[0] if owned[0] else numpy.array(stack[0], dtype=numpy.float64)
+
+
+class Calculator:
+    """
+    Evaluates arithmetic expressions with +, -, *, / and parentheses (reference implementation).
+    """
+
+    def calculate(self, expression: str) -> float:
+        """
+        Calculates the value of the expression.
+
+        Args:
+            expression (str): The arithmetic expression.
+
+        Returns:
+            float: The value of the expression.
+
+        Raises:
+            ValueError: If the expression is not a well-formed arithmetic expression.
+            ZeroDivisionError: If the expression divides by zero.
+        """
+        if not isinstance(expression, str):
+            raise ValueError("The expression must be a string.")
+
+        return evaluate(compile_expression(expression))
+
+    def compile(self, expression: str) -> Formula:
+        """
+        Compiles an expression with named variables (letters, digits and underscores, not starting with a digit)
+        for the vectorized evaluation over NumPy arrays, see Formula.evaluate.
+
+        Args:
+            expression (str): The arithmetic expression with names of variables.
+
+        Returns:
+            Formula: The compiled formula.
+
+        Raises:
+            ValueError: If the expression is not a well-formed arithmetic expression.
+        """
+        return Formula(expression)
+
+    def calculate_many(
+        self, expressions, workers: int = 1, pool_threshold: int = POOL_THRESHOLD, chunk_size: int = CHUNK_SIZE
+    ) -> list[dict]:
+        """
+        Calculates the values of a batch of expressions, the errors do not abort the batch.
+        Identical expressions are calculated once, every position of the batch gets its own copy of the result
+        dictionary (modifying one result does not change the others). If workers > 1 and the batch
+        has at least pool_threshold distinct expressions, they are split into chunks calculated by a process pool
+        (started by fork, without fork the chunks are calculated by the calling process).
+
+        Args:
+            expressions (iterable): The arithmetic expressions.
+            workers (int): The number of worker processes.
+            pool_threshold (int): The minimal number of distinct expressions calculated by the process pool.
+            chunk_size (int): The number of expressions in one task of the process pool.
+
+        Returns:
+            list[dict]: The result of every expression in the order of the batch: the value (None on error),
+                the name of the exception and its message (None on success).
+        """
+        expressions = list(expressions)
+        unique = list(dict.fromkeys(expression for expression in expressions if isinstance(expression, str)))
+
+        if workers > 1 and len(unique) >= pool_threshold and POOL_CONTEXT is not None:
+            chunks = [unique[start : start + chunk_size] for start in range(0, len(unique), chunk_size)]
+            with POOL_CONTEXT.Pool(workers) as pool:
+                results = [result for chunk in pool.map(calculate_chunk, chunks) for result in chunk]
+        else:
+            results = calculate_chunk(unique)
+
+        results = dict(zip(unique, results))
+        invalid = {"value": None, "error": "ValueError", "message": "The expression must be a string."}
+        return [dict(results[expression] if isinstance(expression, str) else invalid) for expression in expressions]
@@ -0,0 +1,664 @@
+"""
+Reference implementation of the todo_list challenge (performance baseline of the todo_list benchmarks)
+Tasks are stored in __slots__ records in a dictionary keyed by their ids, so add, remove and finish are O(1).
+Substring search uses an incremental trigram inverted index over the names and descriptions: the candidates
+are read from the shortest posting list of the trigrams of the term and verified, so selective terms are
+found without scanning all tasks. Removed tasks are deleted from the posting lists lazily.
+get_all builds new dictionaries of the tasks on every call (a caller modifying the returned tasks does not change
+the stored ones), no second copy of the tasks is kept.
+TaskManager(directory) persists the tasks in the directory (TaskStore): every modification is written
+to a binary operation log when it is made (records with checksums, fsync after every LOG_SYNC_OPERATIONS
+operations, on sync and on close; the log is closed also when the manager is garbage collected or the interpreter
+exits) and after SNAPSHOT_OPERATIONS operations the tasks are written to a compact columnar snapshot
+(ids, states and the texts joined into one UTF-8 block per column) and a new log is started. The recovery reads
+the snapshot, replays only the log written after it and builds the search index on the first search.
+The behaviour follows the specification of 5_functional_correctness.py (case-sensitive search,
+results in the order of addition).
+Running: copied as reference.py next to the generated modules by automatic.sh
+"""
+
+import array
+import gc
+import itertools
+import os
+import struct
+import weakref
+import zlib
+
+GRAM_SIZE = 3
+LOG_SYNC_OPERATIONS = 1_000
+SNAPSHOT_OPERATIONS = 100_000
+SNAPSHOT_FILE = "snapshot.bin"
+LOG_FILE = "log.{generation}.bin"
+SNAPSHOT_MAGIC = b"TASKSNP1"
+
+# snapshot: magic, generation, next id, number of tasks; every text column: mode, size of the UTF-8 block
+SNAPSHOT_HEADER = struct.Struct("<8sqqq")
+COLUMN_HEADER = struct.Struct("<Bq")
+# log record: operation, task id, size of the name, size of the description (followed by the texts and a CRC-32)
+RECORD_HEADER = struct.Struct("<BqII")
+CHECKSUM = struct.Struct("<I")
+
+ADD, REMOVE, FINISH, CLEAR = 1, 2, 3, 4
+# a text column is stored joined by NUL characters, or with the lengths of the texts if a text contains NUL
+JOINED, LENGTHS = 0, 1
+
+
+class Task:
+    """
+    One stored task.
+    """
+
+    __slots__ = ("id", "task_name", "task_description", "is_finished")
+
+    def __init__(self, task_id: int, task_name: str, task_description: str, is_finished: bool = False):
+        self.id = task_id
+        self.task_name = task_name
+        self.task_description = task_description
+        self.is_finished = is_finished
+
+    def matches(self, task_term: str) -> bool:
+        """
+        Checks whether the name or the description of the task contains the term.
+
+        Args:
+            task_term (str): The searched term.
+
+        Returns:
+            bool: True if the task contains the term, False otherwise.
+        """
+        return task_term in self.task_name or task_term in self.task_description
+
+    def to_dict(self) -> dict:
+        """
+        Returns the task in the format of the TaskManager interface.
+
+        Returns:
+            dict: The id, name, description and state of the task.
+        """
+        return {
+            "id": self.id,
+            "task_name": self.task_name,
+            "task_description": self.task_description,
+            "is_finished": self.is_finished,
+        }
+
+
+def get_grams(text: str) -> set[str]:
+    """
+    Returns the indexed grams of the text (all trigrams, or the whole text if it is shorter).
+
+    Args:
+        text (str): The name or the description of a task.
+
+    Returns:
+        set[str]: The grams of the text.
+    """
+    if len(text) < GRAM_SIZE:
+        return {text}
+
+    return {text[index : index + GRAM_SIZE] for index in range(len(text) - GRAM_SIZE + 1)}
+
+
+def encode_texts(texts: list[str]) -> bytes:
+    """
+    Encodes a text column of the snapshot.
+
+    Args:
+        texts (list[str]): The texts (names or descriptions) in the order of the tasks.
+
+    Returns:
+        bytes: The column header, the lengths of the texts (only if a text contains NUL) and the UTF-8 block.
+    """
+    joined = "\0".join(texts)
+    block = joined.encode("utf-8", "surrogatepass")
+    if joined.count("\0") == max(len(texts) - 1, 0):
+        return COLUMN_HEADER.pack(JOINED, len(block)) + block
+    lengths = array.array("q", map(len, texts)).tobytes()
+    return COLUMN_HEADER.pack(LENGTHS, len(block)) + lengths + block
+
+
+def decode_texts(data: bytes, offset: int, count: int) -> tuple[list[str], int]:
+    """
+    Decodes a text column of the snapshot.
+
+    Args:
+        data (bytes): The snapshot.
+        offset (int): The position of the column.
+        count (int): The number of tasks.
+
+    Returns:
+        tuple[list[str], int]: The texts and the position after the column.
+    """
+    mode, size = COLUMN_HEADER.unpack_from(data, offset)
+    offset += COLUMN_HEADER.size
+    lengths = None
+    if mode == LENGTHS:
+        lengths = array.array("q", data[offset : offset + 8 * count])
+        offset += 8 * count
+
+    text = data[offset : offset + size].decode("utf-8", "surrogatepass")
+    offset += size
+    if not count:
+        return [], offset
+    if lengths is None:
+        return text.split("\0"), offset
+
+    # the texts are separated by NUL characters in the block, the lengths skip the NUL characters inside texts
+    starts = itertools.accumulate((length + 1 for length in lengths), initial=0)
+    return [text[start : start + length] for start, length in zip(starts, lengths)], offset
+
+
+def close_log(file) -> None:
+    """
+    Syncs the log to the disk and closes it (the finalizer of TaskStore, it must not refer to the store).
+
+    Args:
+        file: The unbuffered log file.
+
+    Returns:
+        None
+    """
+    if not file.closed:
+        os.fsync(file.fileno())
+        file.close()
+
+
+class TaskStore:
+    """
+    Persists the tasks of a TaskManager in a directory: the snapshot of the tasks and the append-only log
+    of the operations after the snapshot (see the module docstring).
+    """
+
+    def __init__(self, directory: str):
+        self.directory = directory
+        self.generation = 0
+        self.operations = 0
+        self._file = None
+        self._closer = None
+        self._pending = 0
+        os.makedirs(directory, exist_ok=True)
+
+    def recover(self) -> tuple[dict, int]:
+        """
+        Loads the snapshot and replays the log written after it. An incomplete or damaged record at the end
+        of the log (an interrupted write) is cut off, the log continues after the last complete record.
+
+        Returns:
+            tuple[dict, int]: The tasks by their ids (in the order of addition) and the next id.
+
+        Raises:
+            ValueError: If the snapshot is damaged.
+        """
+        enabled = gc.isenabled()
+        # the recovery creates millions of objects and no cycles, the collections would only slow it down
+        gc.disable()
+        try:
+            tasks, next_id = self._read_snapshot()
+            path = self._get_log_path(self.generation)
+            valid, next_id, replayed = 0, next_id, 0
+            if os.path.exists(path):
+                valid, next_id, replayed = self._replay_log(path, tasks, next_id)
+        finally:
+            if enabled:
+                gc.enable()
+
+        # the replayed operations count towards the next snapshot, so the log does not grow past SNAPSHOT_OPERATIONS
+        self.operations = replayed
+        self._open_log(path)
+        self._file.truncate(valid)
+        for name in os.listdir(self.directory):
+            # older logs and an unfinished snapshot are left by an interrupted snapshot
+            if (name.startswith("log.") and name != os.path.basename(path)) or name == f"{SNAPSHOT_FILE}.tmp":
+                os.remove(os.path.join(self.directory, name))
+        return tasks, next_id
+
+    def append(self, operation: int, task_id: int, task_name: str = "", task_description: str = "") -> None:
+        """
+        Writes the operation to the log (it survives an exit of the process), the log is synced to the disk
+        after every LOG_SYNC_OPERATIONS operations.
+
+        Args:
+            operation (int): ADD, REMOVE, FINISH or CLEAR.
+            task_id (int): The id of the task (0 for CLEAR).
+            task_name (str): The name of the added task.
+            task_description (str): The description of the added task.
+
+        Returns:
+            None
+
+        Raises:
+            ValueError: If the store is closed.
+        """
+        if self._file is None or self._file.closed:
+            raise ValueError("The task store is closed.")
+
+        name = task_name.encode("utf-8", "surrogatepass")
+        description = task_description.encode("utf-8", "surrogatepass")
+        record = RECORD_HEADER.pack(operation, task_id, len(name), len(description)) + name + description
+        self._file.write(record + CHECKSUM.pack(zlib.crc32(record)))
+        self._pending += 1
+        self.operations += 1
+        if self._pending >= LOG_SYNC_OPERATIONS:
+            self.sync()
+
+    def sync(self) -> None:
+        """
+        Syncs the operations written since the last sync to the disk.
+
+        Returns:
+            None
+        """
+        if self._pending:
+            os.fsync(self._file.fileno())
+            self._pending = 0
+
+    def write_snapshot(self, tasks: dict, next_id: int) -> None:
+        """
+        Writes the snapshot of the tasks and starts a new log. The snapshot replaces the previous one
+        atomically, so an interruption leaves either the old snapshot with its log or the new snapshot.
+
+        Args:
+            tasks (dict): The tasks by their ids.
+            next_id (int): The next id.
+
+        Returns:
+            None
+        """
+        self.sync()
+        generation = self.generation + 1
+        records = tasks.values()
+        data = bytearray(SNAPSHOT_HEADER.pack(SNAPSHOT_MAGIC, generation, next_id, len(tasks)))
+        data += array.array("q", tasks.keys()).tobytes()
+        data += bytes(task.is_finished for task in records)
+        data += encode_texts([task.task_name for task in records])
+        data += encode_texts([task.task_description for task in records])
+        data += CHECKSUM.pack(zlib.crc32(data))
+
+        path = os.path.join(self.directory, SNAPSHOT_FILE)
+        with open(f"{path}.tmp", "wb") as file:
+            file.write(data)
+            file.flush()
+            os.fsync(file.fileno())
+        os.replace(f"{path}.tmp", path)
+        self._sync_directory()
+
+        self._closer()
+        self._open_log(self._get_log_path(generation))
+        os.remove(self._get_log_path(self.generation))
+        self.generation = generation
+        self.operations = 0
+
+    def close(self) -> None:
+        """
+        Syncs the log and closes it.
+
+        Returns:
+            None
+        """
+        if self._closer is not None:
+            self._closer()
+            self._pending = 0
+
+    def _open_log(self, path: str) -> None:
+        """
+        Opens the log for appending. The log is unbuffered, every record is passed to the operating system
+        when it is written, and it is synced and closed also when the store is garbage collected
+        or the interpreter exits without close.
+
+        Args:
+            path (str): The path of the log.
+
+        Returns:
+            None
+        """
+        self._file = open(path, "ab", buffering=0)
+        self._closer = weakref.finalize(self, close_log, self._file)
+
+    def _get_log_path(self, generation: int) -> str:
+        """
+        Returns the path of the log of the generation (the log written after the snapshot of the generation).
+
+        Args:
+            generation (int): The generation of the snapshot.
+
+        Returns:
+            str: The path of the log.
+        """
+        return os.path.join(self.directory, LOG_FILE.format(generation=generation))
+
+    def _sync_directory(self) -> None:
+        """
+        Syncs the directory, so the renamed snapshot survives a crash (not supported on Windows).
+
+        Returns:
+            None
+        """
+        if os.name == "posix":
+            descriptor = os.open(self.directory, os.O_RDONLY)
+            try:
+                os.fsync(descriptor)
+            finally:
+                os.close(descriptor)
+
+    def _read_snapshot(self) -> tuple[dict, int]:
+        """
+        Reads the snapshot (if there is one) and sets the generation of the store.
+
+        Returns:
+            tuple[dict, int]: The tasks by their ids and the next id.
+
+        Raises:
+            ValueError: If the snapshot is damaged.
+        """
+        path = os.path.join(self.directory, SNAPSHOT_FILE)
+        if not os.path.exists(path):
+            return {}, 1
+
+        with open(path, "rb") as file:
+            data = file.read()
+        if len(data) < SNAPSHOT_HEADER.size + CHECKSUM.size or not data.startswith(SNAPSHOT_MAGIC):
+            raise ValueError(f"The snapshot {path} is damaged.")
+        if zlib.crc32(memoryview(data)[: -CHECKSUM.size]) != CHECKSUM.unpack_from(data, len(data) - CHECKSUM.size)[0]:
+            raise ValueError(f"The snapshot {path} is damaged.")
+
+        _, self.generation, next_id, count = SNAPSHOT_HEADER.unpack_from(data)
+        offset = SNAPSHOT_HEADER.size
+        ids = array.array("q", data[offset : offset + 8 * count]).tolist()
+        offset += 8 * count
+        finished = data[offset : offset + count]
+        offset += count
+        names, offset = decode_texts(data, offset, count)
+        descriptions, offset = decode_texts(data, offset, count)
+
+        return dict(zip(ids, map(Task, ids, names, descriptions, map(bool, finished)))), next_id
+
+    @staticmethod
+    def _replay_log(path: str, tasks: dict, next_id: int) -> tuple[int, int, int]:
+        """
+        Applies the operations of the log to the tasks.
+
+        Args:
+            path (str): The path of the log.
+            tasks (dict): The tasks by their ids (updated in place).
+            next_id (int): The next id of the snapshot.
+
+        Returns:
+            tuple[int, int, int]: The size of the complete records of the log, the next id
+                and the number of the replayed records.
+        """
+        with open(path, "rb") as file:
+            data = file.read()
+
+        view = memoryview(data)
+        offset = 0
+        replayed = 0
+        header, checksum = RECORD_HEADER.size, CHECKSUM.size
+        while offset + header <= len(data):
+            operation, task_id, name_size, description_size = RECORD_HEADER.unpack_from(data, offset)
+            end = offset + header + name_size + description_size
+            if end + checksum > len(data) or zlib.crc32(view[offset:end]) != CHECKSUM.unpack_from(data, end)[0]:
+                break
+
+            if operation == ADD:
+                name_end = offset + header + name_size
+                tasks[task_id] = Task(
+                    task_id,
+                    data[offset + header : name_end].decode("utf-8", "surrogatepass"),
+                    data[name_end:end].decode("utf-8", "surrogatepass"),
+                )
+                next_id = max(next_id, task_id + 1)
+            elif operation == REMOVE:
+                tasks.pop(task_id, None)
+            elif operation == FINISH:
+                task = tasks.get(task_id)
+                if task is not None:
+                    task.is_finished = True
+            elif operation == CLEAR:
+                tasks.clear()
+            offset = end + checksum
+            replayed += 1
+
+        return offset, next_id, replayed
+
+
+class TaskManager:
+    """
+    Manages the tasks (reference implementation of the challenge interface).
+    """
+
+    def __init__(self, directory: str | None = None):
+        """
+        Creates the manager, with a directory the tasks are persisted and recovered from it.
+
+        Args:
+            directory (str | None): The directory of the snapshot and the log (None = tasks only in memory).
+
+        Raises:
+            ValueError: If the snapshot in the directory is damaged.
+        """
+        self._tasks = {}
+        self._index = {}
+        self._next_id = 1
+        self._stale = 0
+        self._store = None
+        if directory is not None:
+            self._store = TaskStore(directory)
+            self._tasks, self._next_id = self._store.recover()
+            if self._tasks:
+                # the index is built by the first search, the recovery only loads the tasks
+                self._index = None
+
+    def add(self, task_name: str, task_description: str) -> int:
+        """
+        Adds a new task.
+
+        Args:
+            task_name (str): The name of the task.
+            task_description (str): The description of the task.
+
+        Returns:
+            int: The id of the new task.
+
+        Raises:
+            ValueError: If the name or the description is not a non-empty string.
+        """
+        if not isinstance(task_name, str) or not task_name:
+            raise ValueError("Task name must be a non-empty string.")
+        if not isinstance(task_description, str) or not task_description:
+            raise ValueError("Task description must be a non-empty string.")
+
+        task_id = self._next_id
+        self._next_id += 1
+        task = Task(task_id, task_name, task_description)
+        self._tasks[task_id] = task
+        if self._index is not None:
+            self._index_task(task)
+        if self._store is not None:
+            self._persist(ADD, task_id, task_name, task_description)
+        return task_id
+
+    def remove(self, task_id: int) -> bool:
+        """
+        Removes the task (its entries in the index are removed lazily).
+
+        Args:
+            task_id (int): The id of the task.
+
+        Returns:
+            bool: True if the task was removed, False if there is no task with the id.
+        """
+        if type(task_id) is not int or self._tasks.pop(task_id, None) is None:
+            return False
+
+        self._stale += 1
+        if self._index is not None and self._stale > len(self._tasks):
+            self._rebuild_index()
+        if self._store is not None:
+            self._persist(REMOVE, task_id)
+        return True
+
+    def search(self, task_term: str) -> list[dict]:
+        """
+        Returns the tasks whose name or description contains the term.
+
+        Args:
+            task_term (str): The searched term.
+
+        Returns:
+            list[dict]: The matching tasks in the order of addition.
+        """
+        if not isinstance(task_term, str):
+            return []
+        if not task_term:
+            return self.get_all()
+        if self._index is None:
+            self._rebuild_index()
+
+        if len(task_term) >= GRAM_SIZE:
+            postings = []
+            for gram in get_grams(task_term):
+                posting = self._index.get(gram)
+                if posting is None:
+                    return []
+                postings.append(posting)
+            candidates = min(postings, key=len)
+        else:
+            candidates = sorted(
+                {task_id for gram, posting in self._index.items() if task_term in gram for task_id in posting}
+            )
+
+        tasks = self._tasks
+        results = []
+        for task_id in candidates:
+            task = tasks.get(task_id)
+            if task is not None and task.matches(task_term):
+                results.append(task.to_dict())
+        return results
+
+    def finish(self, task_id: int) -> bool:
+        """
+        Marks the task as finished.
+
+        Args:
+            task_id (int): The id of the task.
+
+        Returns:
+            bool: True if the task is finished, False if there is no task with the id.
+        """
+        task = self._tasks.get(task_id) if type(task_id) is int else None
+        if task is None:
+            return False
+
+        task.is_finished = True
+        if self._store is not None:
+            self._persist(FINISH, task_id)
+        return True
+
+    def get_all(self) -> list[dict]:
+        """
+        Returns all tasks (new dictionaries on every call).
+
+        Returns:
+            list[dict]: The tasks in the order of addition.
+        """
+        return [task.to_dict() for task in self._tasks.values()]
+
+    def clear_all(self) -> bool:
+        """
+        Removes all tasks.
+
+        Returns:
+            bool: Always True.
+        """
+        self._tasks.clear()
+        self._index = {}
+        self._stale = 0
+        if self._store is not None:
+            self._persist(CLEAR, 0)
+        return True
+
+    def sync(self) -> None:
+        """
+        Syncs the operations written since the last sync to the disk (no-op without a directory).
+
+        Returns:
+            None
+        """
+        if self._store is not None:
+            self._store.sync()
+
+    def save_snapshot(self) -> None:
+        """
+        Writes the snapshot of all tasks and starts a new log (no-op without a directory).
+
+        Returns:
+            None
+        """
+        if self._store is not None:
+            self._store.write_snapshot(self._tasks, self._next_id)
+
+    def close(self) -> None:
+        """
+        Syncs the log and closes it, the tasks stay in memory and the further modifications are not persisted.
+
+        Returns:
+            None
+        """
+        if self._store is not None:
+            self._store.close()
+            self._store = None
+
+    def __enter__(self) -> "TaskManager":
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        self.close()
+
+    def _persist(self, operation: int, task_id: int, task_name: str = "", task_description: str = "") -> None:
+        """
+        Appends the operation to the log and writes a snapshot after SNAPSHOT_OPERATIONS logged operations.
+
+        Args:
+            operation (int): ADD, REMOVE, FINISH or CLEAR.
+            task_id (int): The id of the task (0 for CLEAR).
+            task_name (str): The name of the added task.
+            task_description (str): The description of the added task.
+
+        Returns:
+            None
+        """
+        self._store.append(operation, task_id, task_name, task_description)
+        if self._store.operations >= SNAPSHOT_OPERATIONS:
+            self.save_snapshot()
+
+    def _index_task(self, task: Task) -> None:
+        """
+        Appends the id of the task to the posting lists of its grams.
+        The ids grow, so the posting lists stay sorted in the order of addition.
+
+        Args:
+            task (Task): The added task.
+
+        Returns:
+            None
+        """
+        index = self._index
+        for gram in get_grams(task.task_name) | get_grams(task.task_description):
+            posting = index.get(gram)
+            if posting is None:
+                index[gram] = [task.id]
+            else:
+                posting.append(task.id)
+
+    def _rebuild_index(self) -> None:
+        """
+        Rebuilds the index without the removed tasks (amortized over the removals).
+
+        Returns:
+            None
+        """
+        self._index = {}
+        self._stale = 0
+        for task in self._tasks.values():
+            self._index_task(task)
@@ -1,314 +0,0 @@
-"""
-Test for correct implementation of the functions (internal)
-Running: pytest 3_functional_correctness.py
-Output: pytest report
-"""
-
-import pytest
-
-from gemini import AsciiArt
-
-
-@pytest.fixture
-def art():
-    return AsciiArt()
-
-
-# ---------------------------------------------------------------------
-def test_square(art):
-    assert art.draw_square(5, "*") in {
-        "*****\n*****\n*****\n*****\n*****",
-        "*****\n*****\n*****\n*****\n*****\n",
-    }
-    assert art.draw_square(3, "X") in {"XXX\nXXX\nXXX", "XXX\nXXX\nXXX\n"}
-    assert art.draw_square(1, "O") in {"O", "O\n"}
-
-
-def test_square_large(art):
-    assert art.draw_square(100, "*") in {
-        "****************************************************************************************************\n****************************************************************************************************\n****************************************************************************************************\n****************************************************************************************************\n****************************************************************************************************\n****************************************************************************************************\n****************************************************************************************************\n****************************************************************************************************\n****************************************************************************************************\n****************************************************************************************************\n****************************************************************************************************\n****************************************************************************************************\n****************************************************************************************************\n****************************************************************************************************\n****************************************************************************************************\n****************************************************************************************************\n****************************************************************************************************\n****************************************************************************************************\n****************************************************************************************************\n****************************************************************************************************\n****************************************************************************************************\n****************************************************************************************************\n****************************************************************************************************\n****************************************************************************************************\n****************************************************************************************************\n****************************************************************************************************\n****************************************************************************************************\n****************************************************************************************************\n****************************************************************************************************\n****************************************************************************************************\n****************************************************************************************************\n****************************************************************************************************\n****************************************************************************************************\n****************************************************************************************************\n****************************************************************************************************\n****************************************************************************************************\n****************************************************************************************************\n****************************************************************************************************\n****************************************************************************************************\n****************************************************************************************************\n****************************************************************************************************\n****************************************************************************************************\n****************************************************************************************************\n****************************************************************************************************\n****************************************************************************************************\n****************************************************************************************************\n****************************************************************************************************\n****************************************************************************************************\n****************************************************************************************************\n****************************************************************************************************\n****************************************************************************************************\n****************************************************************************************************\n****************************************************************************************************\n****************************************************************************************************\n****************************************************************************************************\n****************************************************************************************************\n****************************************************************************************************\n****************************************************************************************************\n****************************************************************************************************\n****************************************************************************************************\n****************************************************************************************************\n****************************************************************************************************\n****************************************************************************************************\n****************************************************************************************************\n****************************************************************************************************\n****************************************************************************************************\n****************************************************************************************************\n****************************************************************************************************\n****************************************************************************************************\n****************************************************************************************************\n****************************************************************************************************\n****************************************************************************************************\n****************************************************************************************************\n****************************************************************************************************\n****************************************************************************************************\n****************************************************************************************************\n****************************************************************************************************\n****************************************************************************************************\n****************************************************************************************************\n****************************************************************************************************\n****************************************************************************************************\n****************************************************************************************************\n****************************************************************************************************\n****************************************************************************************************\n****************************************************************************************************\n****************************************************************************************************\n****************************************************************************************************\n****************************************************************************************************\n****************************************************************************************************\n****************************************************************************************************\n****************************************************************************************************\n****************************************************************************************************\n****************************************************************************************************\n****************************************************************************************************\n****************************************************************************************************\n****************************************************************************************************\n****************************************************************************************************\n****************************************************************************************************\n****************************************************************************************************\n****************************************************************************************************",
-        "****************************************************************************************************\n****************************************************************************************************\n****************************************************************************************************\n****************************************************************************************************\n****************************************************************************************************\n****************************************************************************************************\n****************************************************************************************************\n****************************************************************************************************\n****************************************************************************************************\n****************************************************************************************************\n****************************************************************************************************\n****************************************************************************************************\n****************************************************************************************************\n****************************************************************************************************\n****************************************************************************************************\n****************************************************************************************************\n****************************************************************************************************\n****************************************************************************************************\n****************************************************************************************************\n****************************************************************************************************\n****************************************************************************************************\n****************************************************************************************************\n****************************************************************************************************\n****************************************************************************************************\n****************************************************************************************************\n****************************************************************************************************\n****************************************************************************************************\n****************************************************************************************************\n****************************************************************************************************\n****************************************************************************************************\n****************************************************************************************************\n****************************************************************************************************\n****************************************************************************************************\n****************************************************************************************************\n****************************************************************************************************\n****************************************************************************************************\n****************************************************************************************************\n****************************************************************************************************\n****************************************************************************************************\n****************************************************************************************************\n****************************************************************************************************\n****************************************************************************************************\n****************************************************************************************************\n****************************************************************************************************\n****************************************************************************************************\n****************************************************************************************************\n****************************************************************************************************\n****************************************************************************************************\n****************************************************************************************************\n****************************************************************************************************\n****************************************************************************************************\n****************************************************************************************************\n****************************************************************************************************\n****************************************************************************************************\n****************************************************************************************************\n****************************************************************************************************\n****************************************************************************************************\n****************************************************************************************************\n****************************************************************************************************\n****************************************************************************************************\n****************************************************************************************************\n****************************************************************************************************\n****************************************************************************************************\n****************************************************************************************************\n****************************************************************************************************\n****************************************************************************************************\n****************************************************************************************************\n****************************************************************************************************\n****************************************************************************************************\n****************************************************************************************************\n****************************************************************************************************\n****************************************************************************************************\n****************************************************************************************************\n****************************************************************************************************\n****************************************************************************************************\n****************************************************************************************************\n****************************************************************************************************\n****************************************************************************************************\n****************************************************************************************************\n****************************************************************************************************\n****************************************************************************************************\n****************************************************************************************************\n****************************************************************************************************\n****************************************************************************************************\n****************************************************************************************************\n****************************************************************************************************\n****************************************************************************************************\n****************************************************************************************************\n****************************************************************************************************\n****************************************************************************************************\n****************************************************************************************************\n****************************************************************************************************\n****************************************************************************************************\n****************************************************************************************************\n****************************************************************************************************\n****************************************************************************************************\n****************************************************************************************************\n****************************************************************************************************\n****************************************************************************************************\n****************************************************************************************************\n",
-    }
-
-
-def test_square_empty(art):
-    with pytest.raises(ValueError):
-        art.draw_square(5, "")
-    with pytest.raises(ValueError):
-        art.draw_square(5, " ")
-
-
-def test_square_wrong_input(art):
-    with pytest.raises(ValueError):
-        art.draw_square(-1, "*")
-    with pytest.raises(ValueError):
-        art.draw_square(0, "*")
-    with pytest.raises(ValueError):
-        art.draw_square(1.5, "*")
-    with pytest.raises(ValueError):
-        art.draw_square("abc", "*")
-
-
-def test_square_multichar_input(art):
-    with pytest.raises(ValueError):
-        art.draw_square(5, "abc")
-
-
-def test_square_char_contained(art):
-    printable_char = "a"
-    result = art.draw_square(5, printable_char)
-    assert printable_char in result
-
-
-def test_square_char_only_defined(art):
-    printable_char = "a"
-    result = art.draw_square(5, printable_char)
-    assert all(c in "a\n" for c in result)
-
-
-# ---------------------------------------------------------------------
-
-
-def test_rectangle(art):
-    assert art.draw_rectangle(5, 3, "*") in {
-        "*****\n*****\n*****",
-        "*****\n*****\n*****\n",
-    }
-    assert art.draw_rectangle(3, 2, "X") in {"XXX\nXXX", "XXX\nXXX\n"}
-    assert art.draw_rectangle(1, 1, "O") in {"O", "O\n"}
-
-
-def test_rectangle_large(art):
-    assert art.draw_rectangle(100, 50, "*") in {
-        "****************************************************************************************************\n****************************************************************************************************\n****************************************************************************************************\n****************************************************************************************************\n****************************************************************************************************\n****************************************************************************************************\n****************************************************************************************************\n****************************************************************************************************\n****************************************************************************************************\n****************************************************************************************************\n****************************************************************************************************\n****************************************************************************************************\n****************************************************************************************************\n****************************************************************************************************\n****************************************************************************************************\n****************************************************************************************************\n****************************************************************************************************\n****************************************************************************************************\n****************************************************************************************************\n****************************************************************************************************\n****************************************************************************************************\n****************************************************************************************************\n****************************************************************************************************\n****************************************************************************************************\n****************************************************************************************************\n****************************************************************************************************\n****************************************************************************************************\n****************************************************************************************************\n****************************************************************************************************\n****************************************************************************************************\n****************************************************************************************************\n****************************************************************************************************\n****************************************************************************************************\n****************************************************************************************************\n****************************************************************************************************\n****************************************************************************************************\n****************************************************************************************************\n****************************************************************************************************\n****************************************************************************************************\n****************************************************************************************************\n****************************************************************************************************\n****************************************************************************************************\n****************************************************************************************************\n****************************************************************************************************\n****************************************************************************************************\n****************************************************************************************************\n****************************************************************************************************\n****************************************************************************************************\n****************************************************************************************************\n****************************************************************************************************",
-        "****************************************************************************************************\n****************************************************************************************************\n****************************************************************************************************\n****************************************************************************************************\n****************************************************************************************************\n****************************************************************************************************\n****************************************************************************************************\n****************************************************************************************************\n****************************************************************************************************\n****************************************************************************************************\n****************************************************************************************************\n****************************************************************************************************\n****************************************************************************************************\n****************************************************************************************************\n****************************************************************************************************\n****************************************************************************************************\n****************************************************************************************************\n****************************************************************************************************\n****************************************************************************************************\n****************************************************************************************************\n****************************************************************************************************\n****************************************************************************************************\n****************************************************************************************************\n****************************************************************************************************\n****************************************************************************************************\n****************************************************************************************************\n****************************************************************************************************\n****************************************************************************************************\n****************************************************************************************************\n****************************************************************************************************\n****************************************************************************************************\n****************************************************************************************************\n****************************************************************************************************\n****************************************************************************************************\n****************************************************************************************************\n****************************************************************************************************\n****************************************************************************************************\n****************************************************************************************************\n****************************************************************************************************\n****************************************************************************************************\n****************************************************************************************************\n****************************************************************************************************\n****************************************************************************************************\n****************************************************************************************************\n****************************************************************************************************\n****************************************************************************************************\n****************************************************************************************************\n****************************************************************************************************\n****************************************************************************************************\n****************************************************************************************************\n",
-    }
-    assert art.draw_rectangle(150, 10, "*") in {
-        "******************************************************************************************************************************************************\n******************************************************************************************************************************************************\n******************************************************************************************************************************************************\n******************************************************************************************************************************************************\n******************************************************************************************************************************************************\n******************************************************************************************************************************************************\n******************************************************************************************************************************************************\n******************************************************************************************************************************************************\n******************************************************************************************************************************************************\n******************************************************************************************************************************************************",
-        "******************************************************************************************************************************************************\n******************************************************************************************************************************************************\n******************************************************************************************************************************************************\n******************************************************************************************************************************************************\n******************************************************************************************************************************************************\n******************************************************************************************************************************************************\n******************************************************************************************************************************************************\n******************************************************************************************************************************************************\n******************************************************************************************************************************************************\n******************************************************************************************************************************************************\n",
-    }
-
-
-def test_rectangle_empty(art):
-    with pytest.raises(ValueError):
-        art.draw_rectangle(5, 3, "")
-    with pytest.raises(ValueError):
-        art.draw_rectangle(5, 3, " ")
-
-
-def test_rectangle_wrong_input(art):
-    with pytest.raises(ValueError):
-        art.draw_rectangle(-1, 3, "*")
-    with pytest.raises(ValueError):
-        art.draw_rectangle(3, -1, "*")
-    with pytest.raises(ValueError):
-        art.draw_rectangle(0, 0, "*")
-    with pytest.raises(ValueError):
-        art.draw_rectangle(1.5, 3, "*")
-    with pytest.raises(ValueError):
-        art.draw_rectangle(3, 1.5, "*")
-    with pytest.raises(ValueError):
-        art.draw_rectangle("abc", 3, "*")
-    with pytest.raises(ValueError):
-        art.draw_rectangle(3, "abc", "*")
-
-
-def test_rectangle_multichar_input(art):
-    with pytest.raises(ValueError):
-        art.draw_rectangle(5, 10, "abc")
-
-
-def test_rectangle_char_contained(art):
-    printable_char = "a"
-    result = art.draw_rectangle(5, 10, printable_char)
-    assert printable_char in result
-
-
-def test_rectangle_char_only_defined(art):
-    printable_char = "a"
-    result = art.draw_rectangle(5, 10, printable_char)
-    assert all(c in " a\n" for c in result)
-
-
-# ---------------------------------------------------------------------
-
-
-def test_parallelogram(art):
-    assert art.draw_parallelogram(10, 5, "*") in {
-        "**********\n **********\n  **********\n   **********\n    **********\n",
-        "**********\n **********\n  **********\n   **********\n    **********",
-    }
-    assert art.draw_parallelogram(11, 6, "X") in {
-        "***********\n ***********\n  ***********\n   ***********\n    ***********\n     ***********\n",
-        "***********\n ***********\n  ***********\n   ***********\n    ***********\n     ***********",
-    }
-
-
-def test_parallelogram_large(art):
-    assert art.draw_parallelogram(50, 35, "*") in {
-        "**************************************************\n **************************************************\n  **************************************************\n   **************************************************\n    **************************************************\n     **************************************************\n      **************************************************\n       **************************************************\n        **************************************************\n         **************************************************\n          **************************************************\n           **************************************************\n            **************************************************\n             **************************************************\n              **************************************************\n               **************************************************\n                **************************************************\n                 **************************************************\n                  **************************************************\n                   **************************************************\n                    **************************************************\n                     **************************************************\n                      **************************************************\n                       **************************************************\n                        **************************************************\n                         **************************************************\n                          **************************************************\n                           **************************************************\n                            **************************************************\n                             **************************************************\n                              **************************************************\n                               **************************************************\n                                **************************************************\n                                 **************************************************\n                                  **************************************************\n",
-        "**************************************************\n **************************************************\n  **************************************************\n   **************************************************\n    **************************************************\n     **************************************************\n      **************************************************\n       **************************************************\n        **************************************************\n         **************************************************\n          **************************************************\n           **************************************************\n            **************************************************\n             **************************************************\n              **************************************************\n               **************************************************\n                **************************************************\n                 **************************************************\n                  **************************************************\n                   **************************************************\n                    **************************************************\n                     **************************************************\n                      **************************************************\n                       **************************************************\n                        **************************************************\n                         **************************************************\n                          **************************************************\n                           **************************************************\n                            **************************************************\n                             **************************************************\n                              **************************************************\n                               **************************************************\n                                **************************************************\n                                 **************************************************\n                                  **************************************************",
-    }
-    assert art.draw_parallelogram(75, 35, "#") in {
-        "###########################################################################\n ###########################################################################\n  ###########################################################################\n   ###########################################################################\n    ###########################################################################\n     ###########################################################################\n      ###########################################################################\n       ###########################################################################\n        ###########################################################################\n         ###########################################################################\n          ###########################################################################\n           ###########################################################################\n            ###########################################################################\n             ###########################################################################\n              ###########################################################################\n               ###########################################################################\n                ###########################################################################\n                 ###########################################################################\n                  ###########################################################################\n                   ###########################################################################\n                    ###########################################################################\n                     ###########################################################################\n                      ###########################################################################\n                       ###########################################################################\n                        ###########################################################################\n                         ###########################################################################\n                          ###########################################################################\n                           ###########################################################################\n                            ###########################################################################\n                             ###########################################################################\n                              ###########################################################################\n                               ###########################################################################\n                                ###########################################################################\n                                 ###########################################################################\n                                  ###########################################################################\n",
-        "###########################################################################\n ###########################################################################\n  ###########################################################################\n   ###########################################################################\n    ###########################################################################\n     ###########################################################################\n      ###########################################################################\n       ###########################################################################\n        ###########################################################################\n         ###########################################################################\n          ###########################################################################\n           ###########################################################################\n            ###########################################################################\n             ###########################################################################\n              ###########################################################################\n               ###########################################################################\n                ###########################################################################\n                 ###########################################################################\n                  ###########################################################################\n                   ###########################################################################\n                    ###########################################################################\n                     ###########################################################################\n                      ###########################################################################\n                       ###########################################################################\n                        ###########################################################################\n                         ###########################################################################\n                          ###########################################################################\n                           ###########################################################################\n                            ###########################################################################\n                             ###########################################################################\n                              ###########################################################################\n                               ###########################################################################\n                                ###########################################################################\n                                 ###########################################################################\n                                  ###########################################################################",
-    }
-
-
-def test_parallelogram_empty(art):
-    with pytest.raises(ValueError):
-        art.draw_parallelogram(10, 8, "")
-    with pytest.raises(ValueError):
-        art.draw_parallelogram(10, 90, " ")
-    with pytest.raises(ValueError):
-        art.draw_parallelogram(10, 90, "\t")
-
-
-def test_parallelogram_wrong_input(art):
-    with pytest.raises(ValueError):
-        art.test_parallelogram(-1, 9, "*")
-    with pytest.raises(ValueError):
-        art.test_parallelogram(0, 9, "*")
-    with pytest.raises(ValueError):
-        art.test_parallelogram(1.5, 9, "*")
-    with pytest.raises(ValueError):
-        art.test_parallelogram("abc", 9, "*")
-
-
-def test_parallelogram_multichar_input(art):
-    with pytest.raises(ValueError):
-        art.test_parallelogram(5, 9, "abc")
-
-
-def test_parallelogram_char_contained(art):
-    printable_char = "a"
-    result = art.test_parallelogram(5, 8, printable_char)
-    assert printable_char in result
-
-
-def test_parallelogram_char_only_defined(art):
-    printable_char = "a"
-    result = art.test_parallelogram(5, 7, printable_char)
-    assert all(c in " a\n" for c in result)
-
-
-# ---------------------------------------------------------------------
-
-
-def test_triangle(art):
-    assert art.draw_triangle(9, 3, "*") in {
-        "***\n******\n*********",
-        "***\n******\n*********\n",
-    }
-    assert art.draw_triangle(5, 3, "*") in {"*\n***\n******", "*\n***\n******\n"}
-    assert art.draw_triangle(3, 2, "X") in {"X\nXXX", "X\nXXX\n"}
-    assert art.draw_triangle(1, 1, "O") in {"O", "O\n"}
-
-
-def test_triangle_large(art):
-    assert art.draw_triangle(150, 3, "*") in {
-        "**************************************************\n****************************************************************************************************\n******************************************************************************************************************************************************",
-        "**************************************************\n****************************************************************************************************\n******************************************************************************************************************************************************\n",
-    }
-    assert art.draw_triangle(3, 150, "*") in {
-        "*\n*\n*\n*\n*\n*\n*\n*\n*\n*\n*\n*\n*\n*\n*\n*\n*\n*\n*\n*\n*\n*\n*\n*\n*\n*\n*\n*\n*\n*\n*\n*\n*\n*\n*\n*\n*\n*\n*\n*\n*\n*\n*\n*\n*\n*\n*\n*\n*\n*\n**\n**\n**\n**\n**\n**\n**\n**\n**\n**\n**\n**\n**\n**\n**\n**\n**\n**\n**\n**\n**\n**\n**\n**\n**\n**\n**\n**\n**\n**\n**\n**\n**\n**\n**\n**\n**\n**\n**\n**\n**\n**\n**\n**\n**\n**\n**\n**\n**\n**\n***\n***\n***\n***\n***\n***\n***\n***\n***\n***\n***\n***\n***\n***\n***\n***\n***\n***\n***\n***\n***\n***\n***\n***\n***\n***\n***\n***\n***\n***\n***\n***\n***\n***\n***\n***\n***\n***\n***\n***\n***\n***\n***\n***\n***\n***\n***\n***\n***\n***",
-        "*\n*\n*\n*\n*\n*\n*\n*\n*\n*\n*\n*\n*\n*\n*\n*\n*\n*\n*\n*\n*\n*\n*\n*\n*\n*\n*\n*\n*\n*\n*\n*\n*\n*\n*\n*\n*\n*\n*\n*\n*\n*\n*\n*\n*\n*\n*\n*\n*\n*\n**\n**\n**\n**\n**\n**\n**\n**\n**\n**\n**\n**\n**\n**\n**\n**\n**\n**\n**\n**\n**\n**\n**\n**\n**\n**\n**\n**\n**\n**\n**\n**\n**\n**\n**\n**\n**\n**\n**\n**\n**\n**\n**\n**\n**\n**\n**\n**\n**\n**\n***\n***\n***\n***\n***\n***\n***\n***\n***\n***\n***\n***\n***\n***\n***\n***\n***\n***\n***\n***\n***\n***\n***\n***\n***\n***\n***\n***\n***\n***\n***\n***\n***\n***\n***\n***\n***\n***\n***\n***\n***\n***\n***\n***\n***\n***\n***\n***\n***\n***\n",
-    }
-
-
-def test_triangle_empty(art):
-    with pytest.raises(ValueError):
-        art.draw_triangle(10, 3, "")
-    with pytest.raises(ValueError):
-        art.draw_triangle(10, 3, " ")
-
-
-def test_triangle_wrong_input(art):
-    with pytest.raises(ValueError):
-        art.draw_triangle(-1, 3, "*")
-    with pytest.raises(ValueError):
-        art.draw_triangle(0, 0, "*")
-    with pytest.raises(ValueError):
-        art.draw_triangle(1.5, 3, "*")
-    with pytest.raises(ValueError):
-        art.draw_triangle(3, 1.5, "*")
-    with pytest.raises(ValueError):
-        art.draw_triangle("abc", 3, "*")
-
-
-def test_triangle_multichar_input(art):
-    with pytest.raises(ValueError):
-        art.draw_triangle(5, 5, "abc")
-
-
-def test_triangle_char_contained(art):
-    printable_char = "a"
-    result = art.draw_triangle(5, 5, printable_char)
-    assert printable_char in result
-
-
-def test_triangle_char_only_defined(art):
-    printable_char = "a"
-    result = art.draw_triangle(5, 5, printable_char)
-    assert all(c in " a\n" for c in result)
-
-
-# ---------------------------------------------------------------------
-
-
-def test_pyramid(art):
-    assert art.draw_pyramid(5, "*") in {
-        "    *\n   ***\n  *****\n *******\n*********",
-        "    *\n   ***\n  *****\n *******\n*********\n",
-    }
-    assert art.draw_pyramid(4, "X") in {
-        "   X\n  XXX\n XXXXX\nXXXXXXX",
-        "   X\n  XXX\n XXXXX\nXXXXXXX\n",
-    }
-    assert art.draw_pyramid(3, "O") in {"  O\n OOO\nOOOOO", "  O\n OOO\nOOOOO\n"}
-    assert art.draw_pyramid(2, "O") in {" O\nOOO", " O\nOOO\n"}
-
-
-def test_pyramid_large(art):
-    assert art.draw_pyramid(100, "*") in {
-        "                                                                                                   *\n                                                                                                  ***\n                                                                                                 *****\n                                                                                                *******\n                                                                                               *********\n                                                                                              ***********\n                                                                                             *************\n                                                                                            ***************\n                                                                                           *****************\n                                                                                          *******************\n                                                                                         *********************\n                                                                                        ***********************\n                                                                                       *************************\n                                                                                      ***************************\n                                                                                     *****************************\n                                                                                    *******************************\n                                                                                   *********************************\n                                                                                  ***********************************\n                                                                                 *************************************\n                                                                                ***************************************\n                                                                               *****************************************\n                                                                              *******************************************\n                                                                             *********************************************\n                                                                            ***********************************************\n                                                                           *************************************************\n                                                                          ***************************************************\n                                                                         *****************************************************\n                                                                        *******************************************************\n                                                                       *********************************************************\n                                                                      ***********************************************************\n                                                                     *************************************************************\n                                                                    ***************************************************************\n                                                                   *****************************************************************\n                                                                  *******************************************************************\n                                                                 *********************************************************************\n                                                                ***********************************************************************\n                                                               *************************************************************************\n                                                              ***************************************************************************\n                                                             *****************************************************************************\n                                                            *******************************************************************************\n                                                           *********************************************************************************\n                                                          ***********************************************************************************\n                                                         *************************************************************************************\n                                                        ***************************************************************************************\n                                                       *****************************************************************************************\n                                                      *******************************************************************************************\n                                                     *********************************************************************************************\n                                                    ***********************************************************************************************\n                                                   *************************************************************************************************\n                                                  ***************************************************************************************************\n                                                 *****************************************************************************************************\n                                                *******************************************************************************************************\n                                               *********************************************************************************************************\n                                              ***********************************************************************************************************\n                                             *************************************************************************************************************\n                                            ***************************************************************************************************************\n                                           *****************************************************************************************************************\n                                          *******************************************************************************************************************\n                                         *********************************************************************************************************************\n                                        ***********************************************************************************************************************\n                                       *************************************************************************************************************************\n                                      ***************************************************************************************************************************\n                                     *****************************************************************************************************************************\n                                    *******************************************************************************************************************************\n                                   *********************************************************************************************************************************\n                                  ***********************************************************************************************************************************\n                                 *************************************************************************************************************************************\n                                ***************************************************************************************************************************************\n                               *****************************************************************************************************************************************\n                              *******************************************************************************************************************************************\n                             *********************************************************************************************************************************************\n                            ***********************************************************************************************************************************************\n                           *************************************************************************************************************************************************\n                          ***************************************************************************************************************************************************\n                         *****************************************************************************************************************************************************\n                        *******************************************************************************************************************************************************\n                       *********************************************************************************************************************************************************\n                      ***********************************************************************************************************************************************************\n                     *************************************************************************************************************************************************************\n                    ***************************************************************************************************************************************************************\n                   *****************************************************************************************************************************************************************\n                  *******************************************************************************************************************************************************************\n                 *********************************************************************************************************************************************************************\n                ***********************************************************************************************************************************************************************\n               *************************************************************************************************************************************************************************\n              ***************************************************************************************************************************************************************************\n             *****************************************************************************************************************************************************************************\n            *******************************************************************************************************************************************************************************\n           *********************************************************************************************************************************************************************************\n          ***********************************************************************************************************************************************************************************\n         *************************************************************************************************************************************************************************************\n        ***************************************************************************************************************************************************************************************\n       *****************************************************************************************************************************************************************************************\n      *******************************************************************************************************************************************************************************************\n     *********************************************************************************************************************************************************************************************\n    ***********************************************************************************************************************************************************************************************\n   *************************************************************************************************************************************************************************************************\n  ***************************************************************************************************************************************************************************************************\n *****************************************************************************************************************************************************************************************************\n*******************************************************************************************************************************************************************************************************",
-        "                                                                                                   *\n                                                                                                  ***\n                                                                                                 *****\n                                                                                                *******\n                                                                                               *********\n                                                                                              ***********\n                                                                                             *************\n                                                                                            ***************\n                                                                                           *****************\n                                                                                          *******************\n                                                                                         *********************\n                                                                                        ***********************\n                                                                                       *************************\n                                                                                      ***************************\n                                                                                     *****************************\n                                                                                    *******************************\n                                                                                   *********************************\n                                                                                  ***********************************\n                                                                                 *************************************\n                                                                                ***************************************\n                                                                               *****************************************\n                                                                              *******************************************\n                                                                             *********************************************\n                                                                            ***********************************************\n                                                                           *************************************************\n                                                                          ***************************************************\n                                                                         *****************************************************\n                                                                        *******************************************************\n                                                                       *********************************************************\n                                                                      ***********************************************************\n                                                                     *************************************************************\n                                                                    ***************************************************************\n                                                                   *****************************************************************\n                                                                  *******************************************************************\n                                                                 *********************************************************************\n                                                                ***********************************************************************\n                                                               *************************************************************************\n                                                              ***************************************************************************\n                                                             *****************************************************************************\n                                                            *******************************************************************************\n                                                           *********************************************************************************\n                                                          ***********************************************************************************\n                                                         *************************************************************************************\n                                                        ***************************************************************************************\n                                                       *****************************************************************************************\n                                                      *******************************************************************************************\n                                                     *********************************************************************************************\n                                                    ***********************************************************************************************\n                                                   *************************************************************************************************\n                                                  ***************************************************************************************************\n                                                 *****************************************************************************************************\n                                                *******************************************************************************************************\n                                               *********************************************************************************************************\n                                              ***********************************************************************************************************\n                                             *************************************************************************************************************\n                                            ***************************************************************************************************************\n                                           *****************************************************************************************************************\n                                          *******************************************************************************************************************\n                                         *********************************************************************************************************************\n                                        ***********************************************************************************************************************\n                                       *************************************************************************************************************************\n                                      ***************************************************************************************************************************\n                                     *****************************************************************************************************************************\n                                    *******************************************************************************************************************************\n                                   *********************************************************************************************************************************\n                                  ***********************************************************************************************************************************\n                                 *************************************************************************************************************************************\n                                ***************************************************************************************************************************************\n                               *****************************************************************************************************************************************\n                              *******************************************************************************************************************************************\n                             *********************************************************************************************************************************************\n                            ***********************************************************************************************************************************************\n                           *************************************************************************************************************************************************\n                          ***************************************************************************************************************************************************\n                         *****************************************************************************************************************************************************\n                        *******************************************************************************************************************************************************\n                       *********************************************************************************************************************************************************\n                      ***********************************************************************************************************************************************************\n                     *************************************************************************************************************************************************************\n                    ***************************************************************************************************************************************************************\n                   *****************************************************************************************************************************************************************\n                  *******************************************************************************************************************************************************************\n                 *********************************************************************************************************************************************************************\n                ***********************************************************************************************************************************************************************\n               *************************************************************************************************************************************************************************\n              ***************************************************************************************************************************************************************************\n             *****************************************************************************************************************************************************************************\n            *******************************************************************************************************************************************************************************\n           *********************************************************************************************************************************************************************************\n          ***********************************************************************************************************************************************************************************\n         *************************************************************************************************************************************************************************************\n        ***************************************************************************************************************************************************************************************\n       *****************************************************************************************************************************************************************************************\n      *******************************************************************************************************************************************************************************************\n     *********************************************************************************************************************************************************************************************\n    ***********************************************************************************************************************************************************************************************\n   *************************************************************************************************************************************************************************************************\n  ***************************************************************************************************************************************************************************************************\n *****************************************************************************************************************************************************************************************************\n*******************************************************************************************************************************************************************************************************\n",
-    }
-
-
-def test_pyramid_empty(art):
-    with pytest.raises(ValueError):
-        art.draw_pyramid(5, "")
-    with pytest.raises(ValueError):
-        art.draw_pyramid(5, " ")
-
-
-def test_pyramid_wrong_input(art):
-    with pytest.raises(ValueError):
-        art.draw_pyramid(-1, "*")
-    with pytest.raises(ValueError):
-        art.draw_pyramid(0, "*")
-    with pytest.raises(ValueError):
-        art.draw_pyramid(1.5, "*")
-    with pytest.raises(ValueError):
-        art.draw_pyramid("abc", "*")
-
-
-def test_pyramid_multichar_input(art):
-    with pytest.raises(ValueError):
-        art.draw_pyramid(5, "abc")
-
-
-def test_pyramid_char_contained(art):
-    printable_char = "a"
-    result = art.draw_pyramid(5, printable_char)
-    assert printable_char in result
-
-
-def test_pyramid_char_only_defined(art):
-    printable_char = "a"
-    result = art.draw_pyramid(5, printable_char)
-    assert all(c in " a\n" for c in result)
-
-
-# ---------------------------------------------------------------------
@@ -1,8 +1,12 @@
 """
 Test of average operation execution time
 Output: average run time of the individual shape rendering operations
+Running: python 6_time_behaviour.py <module> [profile_dir]
+(with profile_dir, a cProfile dump is saved for every operation)
 """
 
+import cProfile
+import os
 import time
 import sys
 
@@ -12,7 +16,26 @@ from claude import AsciiArt as ClaudeAsciiArt
 from gemini import AsciiArt as GeminiAsciiArt
 
 
-def time_operation(instance, method, iterations, *args) -> None:
+def get_profile_file(profile_dir, module, operation) -> str:
+    """
+    Returns the path of the cProfile dump for the given module and operation.
+
+    Args:
+        profile_dir (str): The directory where the profiles are stored (None disables profiling).
+        module (str): The name of the tested module.
+        operation (str): The name of the profiled operation.
+
+    Returns:
+        str: The path to the .pstats file or None if profiling is disabled.
+    """
+    if not profile_dir:
+        return None
+
+    os.makedirs(profile_dir, exist_ok=True)
+    return os.path.join(profile_dir, f"6_time_behaviour-{module}-{operation}.pstats")
+
+
+def time_operation(instance, method, iterations, *args, profile_file=None) -> None:
     """
     Times the execution of a specified method on a given instance over a number of iterations.
 
@@ -21,16 +44,26 @@ def time_operation(instance, method, iterations, *args) -> None:
         method (str): The name of the method to be timed.
         iterations (int): The number of times the method will be called.
         *args: Additional arguments to be passed to the method.
+        profile_file (str): The path where the cProfile dump is saved (None disables profiling).
 
     Returns:
         None
     """
     try:
+        profiler = cProfile.Profile() if profile_file else None
+
         start_time = time.time()
+        if profiler:
+            profiler.enable()
         for _ in range(iterations):
             getattr(instance, method)(*args)
+        if profiler:
+            profiler.disable()
         end_time = time.time()
 
+        if profiler:
+            profiler.dump_stats(profile_file)
+
         print(
             f"Average time for {method}: {((end_time - start_time) / iterations):.20f} seconds"
         )
@@ -38,13 +71,14 @@ def time_operation(instance, method, iterations, *args) -> None:
         print(f"Method {method} failed with error.")
 
 
-def test_operations(instance, iterations):
+def test_operations(instance, iterations, profile_dir=None):
     """
     Tests various drawing operations on the given instance for a specified number of iterations.
 
     Args:
         instance (object): The instance on which the drawing operations will be performed.
         iterations (int): The number of times each drawing operation will be executed.
+        profile_dir (str): The directory for the cProfile dumps (None disables profiling).
 
     Returns:
         None
@@ -55,11 +89,23 @@ def test_operations(instance, iterations):
 
     print(f"Testing {iterations} iterations of each operation\n")
 
-    time_operation(instance, "draw_square", iterations, width, symbol)
-    time_operation(instance, "draw_rectangle", iterations, width, height, symbol)
-    time_operation(instance, "draw_parallelogram", iterations, width, height, symbol)
-    time_operation(instance, "draw_triangle", iterations, width, height, symbol)
-    time_operation(instance, "draw_pyramid", iterations, height, symbol)
+    module = instance.__class__.__module__
+    operations = [
+        ("draw_square", width, symbol),
+        ("draw_rectangle", width, height, symbol),
+        ("draw_parallelogram", width, height, symbol),
+        ("draw_triangle", width, height, symbol),
+        ("draw_pyramid", height, symbol),
+    ]
+
+    for method, *args in operations:
+        time_operation(
+            instance,
+            method,
+            iterations,
+            *args,
+            profile_file=get_profile_file(profile_dir, module, method),
+        )
 
 
 if __name__ == "__main__":
@@ -68,12 +114,18 @@ if __name__ == "__main__":
         "claude": ClaudeAsciiArt,
         "gemini": GeminiAsciiArt,
     }
+    # the reference implementation is copied next to the generated modules only if it exists (see automatic.sh)
+    if sys.argv[1] == "reference":
+        from reference import AsciiArt as ReferenceAsciiArt
+
+        modules["reference"] = ReferenceAsciiArt
 
     if sys.argv[1] not in modules:
         raise ValueError(f"Invalid module name: {sys.argv[1]}")
 
     print(f"Testing module: {modules[sys.argv[1]].__module__}")
     try:
-        test_operations(modules[sys.argv[1]](), 100_000)
+        profile_dir = sys.argv[2] if len(sys.argv) > 2 else None
+        test_operations(modules[sys.argv[1]](), 100_000, profile_dir)
     except Exception as _:
         print(f"Module {modules[sys.argv[1]].__module__} failed with error.")
@@ -138,6 +138,11 @@ if __name__ == "__main__":
         "claude": ClaudeAsciiArt,
         "gemini": GeminiAsciiArt,
     }
+    # the reference implementation is copied next to the generated modules only if it exists (see automatic.sh)
+    if sys.argv[1] == "reference":
+        from reference import AsciiArt as ReferenceAsciiArt
+
+        modules["reference"] = ReferenceAsciiArt
 
     if sys.argv[1] not in modules:
         raise ValueError(f"Invalid module name: {sys.argv[1]}")
@@ -0,0 +1,105 @@
+"""
+Reference renderer (oracle) for the ascii_art functional correctness tests
+The expected drawings of large shapes are generated on demand row by row and compared with the result
+of the tested module via SHA-256 digests, so the expected strings do not have to be stored in the test file.
+"""
+
+import functools
+import hashlib
+
+import pytest
+
+
+# Helper functions
+def get_rows(shape: str, *args) -> iter:
+    """
+    Generates the rows of the expected drawing (without newlines).
+
+    Args:
+        shape (str): The name of the shape (square, rectangle, parallelogram, triangle or pyramid).
+        *args: The dimensions of the shape followed by the symbol (the same as the arguments of draw_{shape}).
+
+    Returns:
+        iter: The rows of the drawing.
+    """
+    *dimensions, symbol = args
+
+    if shape == "square":
+        (size,) = dimensions
+        for _ in range(size):
+            yield symbol * size
+
+    elif shape == "rectangle":
+        width, height = dimensions
+        for _ in range(height):
+            yield symbol * width
+
+    elif shape == "parallelogram":
+        width, height = dimensions
+        for row in range(height):
+            yield " " * row + symbol * width
+
+    elif shape == "triangle":
+        width, height = dimensions
+        for row in range(1, height + 1):
+            yield symbol * -(-row * width // height)
+
+    elif shape == "pyramid":
+        (height,) = dimensions
+        for row in range(height):
+            yield " " * (height - row - 1) + symbol * (2 * row + 1)
+
+    else:
+        raise ValueError(f"Unknown shape: {shape}")
+
+
+@functools.lru_cache(maxsize=128)
+def get_expected_digests(shape: str, *args) -> frozenset:
+    """
+    Computes the digests of the expected drawing with and without the trailing newline.
+    The drawing is hashed row by row, so it is never stored as a whole.
+
+    Args:
+        shape (str): The name of the shape.
+        *args: The dimensions of the shape followed by the symbol.
+
+    Returns:
+        frozenset: The hexadecimal digests of both accepted variants of the drawing.
+    """
+    digest = hashlib.sha256()
+    for index, row in enumerate(get_rows(shape, *args)):
+        if index:
+            digest.update(b"\n")
+        digest.update(row.encode("utf-8"))
+
+    with_newline = digest.copy()
+    with_newline.update(b"\n")
+    return frozenset((digest.hexdigest(), with_newline.hexdigest()))
+
+
+class AsciiArtOracle:
+    """
+    Compares the drawings of the tested module with the drawings of the reference renderer.
+    """
+
+    def matches(self, result, shape: str, *args) -> bool:
+        """
+        Checks whether the result is the expected drawing (the trailing newline is optional).
+
+        Args:
+            result (str): The drawing returned by the tested module.
+            shape (str): The name of the shape.
+            *args: The dimensions of the shape followed by the symbol.
+
+        Returns:
+            bool: True if the result is the expected drawing, False otherwise.
+        """
+        if not isinstance(result, str):
+            return False
+
+        return hashlib.sha256(result.encode("utf-8")).hexdigest() in get_expected_digests(shape, *args)
+
+
+@pytest.fixture(scope="session")
+def oracle():
+    return AsciiArtOracle()
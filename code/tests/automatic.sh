@@ -5,17 +5,19 @@
 TESTS_FOLDER="code/tests"                                                                                                                                       # Default folder with tests
 GENERATED_FOLDER="generated/code"                                                                                                                               # Default folder with generated python files
 RESULTS_FOLDER="results"                                                                                                                                        # Results folder
+REFERENCE_FOLDER="code/reference"                                                                                                                               # Folder with the reference implementations (baselines of the performance tests)
 
 # CONFIG TESTS
-TESTS=("1_code_compilability" "4_functional_completeness" "6_time_behaviour" "7_performance_efficiency-CPU" "8_performance_efficiency-RAM" "9_analysibility") # List of tests to run
-PYTESTS=("5_functional_correctness-chatgpt" "5_functional_correctness-claude" "5_functional_correctness-gemini")                                                # List of pytest tests to run
-ALLTESTS=("${TESTS[@]}" "${PYTESTS[@]}")                                                                                                                        # List of all tests to run
+TESTS=("1_code_compilability" "4_functional_completeness" "6_time_behaviour" "7_performance_efficiency-CPU" "8_performance_efficiency-RAM" "9_analysibility" "10_import_time") # List of tests to run
+BASELINE_TESTS=("6_time_behaviour" "7_performance_efficiency-CPU" "8_performance_efficiency-RAM")                                                               # List of tests run also for the reference implementation
 
 # CONFIG
 MODELS=("chatgpt" "claude" "gemini")                                                                                                                            # List of models to test
 CHALLENGES=("todo_list")                                                                                                                                        # List of projects to test
 PROMPTS=("1-zero_shot" "2-few_shot" "3-chain_of_thoughts-zero_shot" "4-chain_of_thoughts-few_shot" "5-role-zero_shot" "6-role-few_shot")                        # List of prompts to test
 ITERATIONS=10                                                                                                                                                   # Number of iterations of each prompt
+PROFILE=false                                                                                                                                                   # Save cProfile dumps of 6_time_behaviour (aggregated by code/profiler/main.py)
+WORKERS="auto"                                                                                                                                                  # Number of pytest worker processes for the functional correctness tests ("auto" = one per CPU core)
 
 
 # MAIN LOGIC
@@ -28,11 +30,17 @@ do
             echo "$challenge - $prompt - iteration [$i]"
 
             # Copy test files to the generated folder
-            for test in "${ALLTESTS[@]}"
+            for test in "${TESTS[@]}"
             do
                 cp "$TESTS_FOLDER/$challenge/$test.py" "$GENERATED_FOLDER/$challenge/$prompt/iteration_$i/$test.py"
             done
 
+            # Copy the reference implementation (baseline of the performance tests)
+            if [ -f "$REFERENCE_FOLDER/$challenge.py" ]
+            then
+                cp "$REFERENCE_FOLDER/$challenge.py" "$GENERATED_FOLDER/$challenge/$prompt/iteration_$i/reference.py"
+            fi
+
             # Create necessary directories
             mkdir -p "$RESULTS_FOLDER/$challenge/$prompt/iteration_$i"
 
@@ -45,19 +53,51 @@ do
                 done
             done
 
-            # Pytest tests
-            for pytest in "${PYTESTS[@]}"
-            do
-                module_name=$(basename $pytest .py | cut -d'-' -f2)
-                echo "Testing module: $module_name" > "$RESULTS_FOLDER/$challenge/$prompt/iteration_$i/5_functional_correctness-$module_name.txt"
-                python3 -m pytest "$GENERATED_FOLDER/$challenge/$prompt/iteration_$i/$pytest.py" >> "$RESULTS_FOLDER/$challenge/$prompt/iteration_$i/5_functional_correctness-$module_name.txt"
-            done
+            # Run the performance tests of the reference implementation
+            if [ -f "$GENERATED_FOLDER/$challenge/$prompt/iteration_$i/reference.py" ]
+            then
+                for test in "${BASELINE_TESTS[@]}"
+                do
+                    python3 "$GENERATED_FOLDER/$challenge/$prompt/iteration_$i/$test.py" "reference" > "$RESULTS_FOLDER/$challenge/$prompt/iteration_$i/$test-reference.txt"
+                done
+            fi
+
+            # Profiling run of the time behaviour test
+            if [ "$PROFILE" = true ]
+            then
+                for model in "${MODELS[@]}"
+                do
+                    python3 "$GENERATED_FOLDER/$challenge/$prompt/iteration_$i/6_time_behaviour.py" "$model" "$RESULTS_FOLDER/$challenge/$prompt/iteration_$i/profiles" > /dev/null
+                done
+            fi
 
             # Remove test files from the generated folder
-            for test in "${ALLTESTS[@]}"
+            for test in "${TESTS[@]}"
             do
                 rm "$GENERATED_FOLDER/$challenge/$prompt/iteration_$i/$test.py"
             done
+            rm -f "$GENERATED_FOLDER/$challenge/$prompt/iteration_$i/reference.py"
         done
     done
-done
\ No newline at end of file
+done
+
+# Pytest tests (one session for all the tested modules, see code/tests/conftest.py)
+echo "Functional correctness tests"
+PYTEST_ARGS=("--workers=$WORKERS")
+for challenge in "${CHALLENGES[@]}"
+do
+    PYTEST_ARGS+=("$TESTS_FOLDER/$challenge/5_functional_correctness.py")
+done
+for prompt in "${PROMPTS[@]}"
+do
+    PYTEST_ARGS+=("--prompt=$prompt")
+done
+for i in $(seq 1 $ITERATIONS)
+do
+    PYTEST_ARGS+=("--iteration=$i")
+done
+for model in "${MODELS[@]}"
+do
+    PYTEST_ARGS+=("--model=$model")
+done
+python3 -m pytest "${PYTEST_ARGS[@]}" --generated-dir="$GENERATED_FOLDER" --results-dir="$RESULTS_FOLDER" > /dev/null
\ No newline at end of file
@@ -5,28 +5,36 @@
 TESTS_FOLDER="code/tests"                                                                                                                                       # Default folder with tests
 GENERATED_FOLDER="generated/code"                                                                                                                               # Default folder with generated python files
 RESULTS_FOLDER="results"                                                                                                                                        # Results folder
+REFERENCE_FOLDER="code/reference"                                                                                                                               # Folder with the reference implementations (baselines of the performance tests)
 
 # CONFIG TESTS
-TESTS=("1_code_compilability" "2_code_length" "3_modularity" "4_functional_completeness" "6_time_behaviour" "7_performance_efficiency-CPU" "8_performance_efficiency-RAM" "9_analysibility") # List of tests to run
-PYTESTS=("5_functional_correctness-chatgpt" "5_functional_correctness-claude" "5_functional_correctness-gemini")                                                # List of pytest tests to run
-ALLTESTS=("${TESTS[@]}" "${PYTESTS[@]}")                                                                                                                        # List of all tests to run
+TESTS=("1_code_compilability" "2_code_length" "3_modularity" "4_functional_completeness" "6_time_behaviour" "7_performance_efficiency-CPU" "8_performance_efficiency-RAM" "9_analysibility" "10_import_time") # List of tests to run
+BASELINE_TESTS=("6_time_behaviour" "7_performance_efficiency-CPU" "8_performance_efficiency-RAM")                                                               # List of tests run also for the reference implementation
 
 # CONFIG
 MODELS=("chatgpt" "claude" "gemini")                                                                                                                            # List of models to test
 challenge="ascii_art"                                                                                                                                           # project to test
 prompt="2-few_shot"                                                                                                                                             # prompt to test ("1-zero_shot" "2-few_shot" "3-chain_of_thoughts-zero_shot" "4-chain_of_thoughts-few_shot" "5-role-zero_shot" "6-role-few_shot")
 iteration=2                                                                                                                                                     # Number of iterations of each prompt
+PROFILE=false                                                                                                                                                   # Save cProfile dumps of 6_time_behaviour (aggregated by code/profiler/main.py)
+WORKERS="auto"                                                                                                                                                  # Number of pytest worker processes for the functional correctness tests ("auto" = one per CPU core)
 
 
 # MAIN LOGIC
 echo "$challenge - $prompt - iteration [$iteration]"
 
 # Copy test files to the generated folder
-for test in "${ALLTESTS[@]}"
+for test in "${TESTS[@]}"
 do
     cp "$TESTS_FOLDER/$challenge/$test.py" "$GENERATED_FOLDER/$challenge/$prompt/iteration_$iteration/$test.py"
 done
 
+# Copy the reference implementation (baseline of the performance tests)
+if [ -f "$REFERENCE_FOLDER/$challenge.py" ]
+then
+    cp "$REFERENCE_FOLDER/$challenge.py" "$GENERATED_FOLDER/$challenge/$prompt/iteration_$iteration/reference.py"
+fi
+
 # Create necessary directories
 mkdir -p "$RESULTS_FOLDER/$challenge/$prompt/iteration_$iteration"
 
@@ -39,16 +47,35 @@ do
     done
 done
 
-# Pytest tests
-for pytest in "${PYTESTS[@]}"
+# Run the performance tests of the reference implementation
+if [ -f "$GENERATED_FOLDER/$challenge/$prompt/iteration_$iteration/reference.py" ]
+then
+    for test in "${BASELINE_TESTS[@]}"
+    do
+        python3 "$GENERATED_FOLDER/$challenge/$prompt/iteration_$iteration/$test.py" "reference" > "$RESULTS_FOLDER/$challenge/$prompt/iteration_$iteration/$test-reference.txt"
+    done
+fi
+
+# Profiling run of the time behaviour test
+if [ "$PROFILE" = true ]
+then
+    for model in "${MODELS[@]}"
+    do
+        python3 "$GENERATED_FOLDER/$challenge/$prompt/iteration_$iteration/6_time_behaviour.py" "$model" "$RESULTS_FOLDER/$challenge/$prompt/iteration_$iteration/profiles" > /dev/null
+    done
+fi
+
+# Pytest tests (one session for all the models, see code/tests/conftest.py)
+PYTEST_ARGS=("$TESTS_FOLDER/$challenge/5_functional_correctness.py" "--prompt=$prompt" "--iteration=$iteration" "--workers=$WORKERS")
+for model in "${MODELS[@]}"
 do
-    module_name=$(basename $pytest .py | cut -d'-' -f2)
-    echo "Testing module: $module_name" > "$RESULTS_FOLDER/$challenge/$prompt/iteration_$iteration/5_functional_correctness-$module_name.txt"
-    python3 -m pytest "$GENERATED_FOLDER/$challenge/$prompt/iteration_$iteration/$pytest.py" >> "$RESULTS_FOLDER/$challenge/$prompt/iteration_$iteration/5_functional_correctness-$module_name.txt"
+    PYTEST_ARGS+=("--model=$model")
 done
+python3 -m pytest "${PYTEST_ARGS[@]}" --generated-dir="$GENERATED_FOLDER" --results-dir="$RESULTS_FOLDER" > /dev/null
 
 # Remove test files from the generated folder
-for test in "${ALLTESTS[@]}"
+for test in "${TESTS[@]}"
 do
     rm "$GENERATED_FOLDER/$challenge/$prompt/iteration_$iteration/$test.py"
-done
\ No newline at end of file
+done
+rm -f "$GENERATED_FOLDER/$challenge/$prompt/iteration_$iteration/reference.py"
\ No newline at end of file
@@ -1,20 +1,16 @@
 """
 Check for correct implementation of the functions (internal)
-Running: pytest 3_functional_correctness.py
+Running: python -m pytest code/tests/calculator/5_functional_correctness.py (from the root of the repository)
+The tests run for every generated module, see conftest.py.
 Output: pytest report
 """
 
 import pytest
 
 
-# from chatgpt import Calculator
-# from claude import Calculator
-# from gemini import Calculator
-
-
 @pytest.fixture
-def calc():
-    return Calculator()
+def calc(implementation):
+    return implementation.Calculator()
 
 
 # ---------------------------------------------------------------------
@@ -1,8 +1,12 @@
 """
 Test of average operation execution time
 Output: average run time of the individual shape rendering operations
+Running: python 6_time_behaviour.py <module> [profile_dir]
+(with profile_dir, a cProfile dump is saved for every operation)
 """
 
+import cProfile
+import os
 import time
 import sys
 
@@ -12,7 +16,26 @@ from claude import Calculator as ClaudeCalculator
 from gemini import Calculator as GeminiCalculator
 
 
-def time_operation(instance, method, iterations, expression) -> None:
+def get_profile_file(profile_dir, module, operation) -> str:
+    """
+    Returns the path of the cProfile dump for the given module and operation.
+
+    Args:
+        profile_dir (str): The directory where the profiles are stored (None disables profiling).
+        module (str): The name of the tested module.
+        operation (str): The name of the profiled operation.
+
+    Returns:
+        str: The path to the .pstats file or None if profiling is disabled.
+    """
+    if not profile_dir:
+        return None
+
+    os.makedirs(profile_dir, exist_ok=True)
+    return os.path.join(profile_dir, f"6_time_behaviour-{module}-{operation}.pstats")
+
+
+def time_operation(instance, method, iterations, expression, profile_file=None) -> None:
     """
     Times the execution of a specified method on a given instance over a number of iterations.
 
@@ -20,17 +43,27 @@ def time_operation(instance, method, iterations, expression) -> None:
         instance (object): The object instance on which the method will be called.
         method (str): The name of the method to be timed.
         iterations (int): The number of times the method will be called.
-        *args: Additional arguments to be passed to the method.
+        expression (str): The expression passed to the method.
+        profile_file (str): The path where the cProfile dump is saved (None disables profiling).
 
     Returns:
         None
     """
     try:
+        profiler = cProfile.Profile() if profile_file else None
+
         start_time = time.time()
+        if profiler:
+            profiler.enable()
         for _ in range(iterations):
             getattr(instance, method)(expression)
+        if profiler:
+            profiler.disable()
         end_time = time.time()
 
+        if profiler:
+            profiler.dump_stats(profile_file)
+
         print(
             f"Average time for {method} ({expression}): {((end_time - start_time) / iterations):.20f} seconds"
         )
@@ -38,7 +71,7 @@ def time_operation(instance, method, iterations, expression) -> None:
         print(f"Method {method} ({expression}) failed with error.")
 
 
-def test_operations(instance, iterations) -> None:
+def test_operations(instance, iterations, profile_dir=None) -> None:
     """
     Test the performance of various calculator operations.
     This function tests the performance of addition, subtraction, multiplication,
@@ -48,19 +81,30 @@ def test_operations(instance, iterations) -> None:
     Args:
         instance: An instance of the calculator class that has a 'calculate' method.
         iterations (int): The number of times each operation should be performed.
+        profile_dir (str): The directory for the cProfile dumps (None disables profiling).
 
     Returns:
         None
     """
     print(f"Testing {iterations} iterations of each operation\n")
 
-    time_operation(instance, "calculate", iterations, "1974349+7972327")
-    time_operation(instance, "calculate", iterations, "1974349-7972327")
-    time_operation(instance, "calculate", iterations, "1974349*7972327")
-    time_operation(instance, "calculate", iterations, "1974349/7972327")
-    time_operation(
-        instance, "calculate", iterations, "1974349+7972327-1974349*7972327/964"
-    )
+    module = instance.__class__.__module__
+    operations = [
+        ("calculate_add", "1974349+7972327"),
+        ("calculate_subtract", "1974349-7972327"),
+        ("calculate_multiply", "1974349*7972327"),
+        ("calculate_divide", "1974349/7972327"),
+        ("calculate_composite", "1974349+7972327-1974349*7972327/964"),
+    ]
+
+    for operation, expression in operations:
+        time_operation(
+            instance,
+            "calculate",
+            iterations,
+            expression,
+            get_profile_file(profile_dir, module, operation),
+        )
 
 
 if __name__ == "__main__":
@@ -69,12 +113,18 @@ if __name__ == "__main__":
         "claude": ClaudeCalculator,
         "gemini": GeminiCalculator,
     }
+    # the reference implementation is copied next to the generated modules only if it exists (see automatic.sh)
+    if sys.argv[1] == "reference":
+        from reference import Calculator as ReferenceCalculator
+
+        modules["reference"] = ReferenceCalculator
 
     if sys.argv[1] not in modules:
         raise ValueError(f"Invalid module name: {sys.argv[1]}")
 
     print(f"Testing module: {modules[sys.argv[1]].__module__}")
     try:
-        test_operations(modules[sys.argv[1]](), 100_000)
+        profile_dir = sys.argv[2] if len(sys.argv) > 2 else None
+        test_operations(modules[sys.argv[1]](), 100_000, profile_dir)
     except Exception as _:
         print(f"Module {modules[sys.argv[1]].__module__} failed with error.")
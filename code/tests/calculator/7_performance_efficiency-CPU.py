@@ -1,10 +1,12 @@
 """
 Test of CPU time taken by different operations
 Output: processor time of running operations over calculator
+(user/system time and OS counters from getrusage, process/thread time from the ns clocks)
 """
 
-import psutil
+import resource
 import sys
+import time
 
 
 from chatgpt import Calculator as ChatGPTCalculator
@@ -12,6 +14,19 @@ from claude import Calculator as ClaudeCalculator
 from gemini import Calculator as GeminiCalculator
 
 
+def get_max_rss(usage) -> int:
+    """
+    Returns the maximum resident set size from the resource usage in kilobytes.
+
+    Args:
+        usage (resource.struct_rusage): The resource usage of the process.
+
+    Returns:
+        int: The maximum resident set size in KB (ru_maxrss is in bytes on macOS).
+    """
+    return usage.ru_maxrss // 1024 if sys.platform == "darwin" else usage.ru_maxrss
+
+
 def measure_cpu_time(instance, method, iterations, expression) -> None:
     """
     Measures the CPU time taken by a specified method of a given instance over a number of iterations.
@@ -26,21 +41,37 @@ def measure_cpu_time(instance, method, iterations, expression) -> None:
         None
     """
     try:
-        process = psutil.Process()
-
-        cpu_times_before = process.cpu_times()
+        usage_before = resource.getrusage(resource.RUSAGE_SELF)
+        process_time_before = time.process_time_ns()
+        thread_time_before = time.thread_time_ns()
 
         for _ in range(iterations):
             getattr(instance, method)(expression)
 
-        cpu_times_after = process.cpu_times()
+        thread_time_after = time.thread_time_ns()
+        process_time_after = time.process_time_ns()
+        usage_after = resource.getrusage(resource.RUSAGE_SELF)
 
-        user_time = cpu_times_after.user - cpu_times_before.user
-        system_time = cpu_times_after.system - cpu_times_before.system
+        user_time = usage_after.ru_utime - usage_before.ru_utime
+        system_time = usage_after.ru_stime - usage_before.ru_stime
+        process_time = (process_time_after - process_time_before) / 1e9
+        thread_time = (thread_time_after - thread_time_before) / 1e9
 
         print(
             f"CPU time - {method} ({expression}): User time = {user_time:.20f}s, System time = {system_time:.20f}s"
         )
+        print(
+            f"CPU clock - {method} ({expression}): Process time = {process_time:.9f}s, Thread time = {thread_time:.9f}s"
+        )
+        print(
+            f"OS counters - {method} ({expression}): "
+            f"Minor page faults = {usage_after.ru_minflt - usage_before.ru_minflt}, "
+            f"Major page faults = {usage_after.ru_majflt - usage_before.ru_majflt}, "
+            f"Voluntary context switches = {usage_after.ru_nvcsw - usage_before.ru_nvcsw}, "
+            f"Involuntary context switches = {usage_after.ru_nivcsw - usage_before.ru_nivcsw}, "
+            f"Max RSS = {get_max_rss(usage_after)} KB, "
+            f"Max RSS growth = {get_max_rss(usage_after) - get_max_rss(usage_before)} KB"
+        )
     except Exception as _:
         print(f"Method {method} ({expression}) failed with error.")
 
@@ -75,6 +106,11 @@ if __name__ == "__main__":
         "claude": ClaudeCalculator,
         "gemini": GeminiCalculator,
     }
+    # the reference implementation is copied next to the generated modules only if it exists (see automatic.sh)
+    if sys.argv[1] == "reference":
+        from reference import Calculator as ReferenceCalculator
+
+        modules["reference"] = ReferenceCalculator
 
     if sys.argv[1] not in modules:
         raise ValueError(f"Invalid module name: {sys.argv[1]}")
@@ -131,6 +131,11 @@ if __name__ == "__main__":
         "claude": ClaudeCalculator,
         "gemini": GeminiCalculator,
     }
+    # the reference implementation is copied next to the generated modules only if it exists (see automatic.sh)
+    if sys.argv[1] == "reference":
+        from reference import Calculator as ReferenceCalculator
+
+        modules["reference"] = ReferenceCalculator
 
     if sys.argv[1] not in modules:
         raise ValueError(f"Invalid module name: {sys.argv[1]}")
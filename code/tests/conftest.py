@@ -0,0 +1,393 @@
+"""
+Pytest plugin for the functional correctness tests (5_functional_correctness.py)
+The tests of every challenge are parametrized over all generated modules (prompt x iteration x model),
+so the whole corpus is tested in a single pytest session. The modules can be split between several
+worker processes (--workers), every worker runs the tests of its share (--shard) of the modules.
+Running: python -m pytest code/tests [--workers N] (from the root of the repository)
+Output: results/{challenge}/{prompt}/iteration_{i}/5_functional_correctness-{model}.txt (pass/fail summary)
+        results/{challenge}/{prompt}/iteration_{i}/5_functional_correctness-{model}.csv (outcome and duration per test case)
+        results/{challenge}/functional_correctness-{outcomes,durations}.csv (module x test case matrices)
+"""
+
+import csv
+import importlib.util
+import os
+import subprocess
+import sys
+from collections import defaultdict
+
+import pytest
+
+
+# GENERATED_DIR - directory with the generated modules
+GENERATED_DIR = "generated/code"
+
+# RESULTS_DIR - directory where the results of the modules are saved
+RESULTS_DIR = "results"
+
+# PROMPTS, ITERATIONS, MODELS - generated modules which are tested by default
+PROMPTS = [
+    "1-zero_shot",
+    "2-few_shot",
+    "3-chain_of_thoughts-zero_shot",
+    "4-chain_of_thoughts-few_shot",
+    "5-role-zero_shot",
+    "6-role-few_shot",
+]
+ITERATIONS = 10
+MODELS = ["chatgpt", "claude", "gemini"]
+
+# RESULT_FILE - name of the result file of the module
+RESULT_FILE = "5_functional_correctness-{model}.txt"
+
+# CASES_FILE - name of the file with the outcome and the duration of every test case of the module
+CASES_FILE = "5_functional_correctness-{model}.csv"
+
+# MATRIX_FILE - name of the module x test case matrix of the challenge (outcomes or durations)
+MATRIX_FILE = "functional_correctness-{kind}.csv"
+
+
+# Helper functions
+def get_implementations(challenge: str, config: pytest.Config) -> list[tuple]:
+    """
+    Returns the generated modules of the challenge selected by the command line options.
+
+    Args:
+        challenge (str): The name of the challenge.
+        config (pytest.Config): The pytest configuration.
+
+    Returns:
+        list[tuple]: A list of (challenge, prompt, iteration, model) tuples.
+    """
+    prompts = config.getoption("prompts") or PROMPTS
+    iterations = config.getoption("iterations") or range(1, ITERATIONS + 1)
+    models = config.getoption("models") or MODELS
+
+    return [
+        (challenge, prompt, iteration, model) for prompt in prompts for iteration in iterations for model in models
+    ]
+
+
+def get_implementation_id(implementation: tuple) -> str:
+    """
+    Returns the readable identifier of the generated module used in the test names.
+
+    Args:
+        implementation (tuple): The (challenge, prompt, iteration, model) tuple.
+
+    Returns:
+        str: The identifier of the module (e.g. 1-zero_shot/iteration_1/chatgpt).
+    """
+    _, prompt, iteration, model = implementation
+    return f"{prompt}/iteration_{iteration}/{model}"
+
+
+def load_implementation(implementation: tuple, generated_dir: str):
+    """
+    Imports the generated module under a unique name, so modules with the same file name do not clash.
+
+    Args:
+        implementation (tuple): The (challenge, prompt, iteration, model) tuple.
+        generated_dir (str): The directory with the generated modules.
+
+    Returns:
+        module: The imported module.
+    """
+    challenge, prompt, iteration, model = implementation
+    path = f"{generated_dir}/{challenge}/{prompt}/iteration_{iteration}/{model}.py"
+    if not os.path.exists(path):
+        raise FileNotFoundError(f"File not found: {path}")
+
+    name = f"{challenge}-{prompt}-iteration_{iteration}-{model}"
+    spec = importlib.util.spec_from_file_location(name, path)
+    module = importlib.util.module_from_spec(spec)
+    sys.modules[name] = module
+    try:
+        spec.loader.exec_module(module)
+    except BaseException:
+        del sys.modules[name]
+        raise
+
+    return module
+
+
+def parse_shard(value: str) -> tuple:
+    """
+    Parses the value of the --shard option.
+
+    Args:
+        value (str): The shard in the format index/count (indexed from 1).
+
+    Returns:
+        tuple: The index (from 0) and the count of the shards.
+    """
+    index, _, count = value.partition("/")
+    try:
+        index, count = int(index), int(count)
+    except ValueError:
+        raise pytest.UsageError(f"Invalid shard: {value} (expected index/count, e.g. 1/4)")
+
+    if not 1 <= index <= count:
+        raise pytest.UsageError(f"Invalid shard: {value} (index must be between 1 and {count})")
+
+    return index - 1, count
+
+
+def get_workers(value: str) -> int:
+    """
+    Parses the value of the --workers option.
+
+    Args:
+        value (str): The number of workers or "auto" (one worker per CPU core).
+
+    Returns:
+        int: The number of workers.
+    """
+    if value == "auto":
+        return os.cpu_count() or 1
+
+    try:
+        return max(int(value), 1)
+    except ValueError:
+        raise pytest.UsageError(f"Invalid number of workers: {value}")
+
+
+def get_test_case(nodeid: str) -> str:
+    """
+    Returns the name of the test case without the parameters (e.g. test_square_large).
+
+    Args:
+        nodeid (str): The pytest node identifier of the test.
+
+    Returns:
+        str: The name of the test case.
+    """
+    return nodeid.split("::")[-1].split("[")[0]
+
+
+def write_matrices(challenge: str, results_dir: str) -> None:
+    """
+    Merges the test case files of all modules of the challenge into the outcome and duration matrices.
+    Rows are the modules (prompt, iteration, model), columns are the test cases.
+
+    Args:
+        challenge (str): The name of the challenge.
+        results_dir (str): The directory with the results.
+
+    Returns:
+        None
+    """
+    rows = []
+    test_cases = {}
+    for prompt in PROMPTS:
+        for iteration in range(1, ITERATIONS + 1):
+            for model in MODELS:
+                path = f"{results_dir}/{challenge}/{prompt}/iteration_{iteration}/{CASES_FILE.format(model=model)}"
+                if not os.path.exists(path):
+                    continue
+
+                with open(path, "r", encoding="utf-8", newline="") as file:
+                    cases = {row["test_case"]: row for row in csv.DictReader(file)}
+                test_cases.update(dict.fromkeys(cases))
+                rows.append((prompt, iteration, model, cases))
+
+    if not rows:
+        return
+
+    for kind, column in (("outcomes", "outcome"), ("durations", "duration")):
+        with open(f"{results_dir}/{challenge}/{MATRIX_FILE.format(kind=kind)}", "w", encoding="utf-8", newline="") as file:
+            writer = csv.writer(file)
+            writer.writerow(["prompt_type", "iteration", "model", *test_cases])
+            for prompt, iteration, model, cases in rows:
+                writer.writerow(
+                    [prompt, iteration, model, *(cases[name][column] if name in cases else "" for name in test_cases)]
+                )
+
+
+def format_summary(counts: dict, duration: float) -> str:
+    """
+    Formats the summary line of the module in the same way as pytest.
+
+    Args:
+        counts (dict): The number of the tests per outcome.
+        duration (float): The total duration of the tests in seconds.
+
+    Returns:
+        str: The summary line (e.g. "1 failed, 87 passed in 0.17s").
+    """
+    parts = [f"{counts[outcome]} {outcome}" for outcome in ("failed", "passed", "skipped") if counts[outcome]]
+    if counts["error"]:
+        parts.append(f"{counts['error']} error" + ("s" if counts["error"] > 1 else ""))
+
+    return f"{', '.join(parts) or 'no tests ran'} in {duration:.2f}s"
+
+
+# Pytest hooks
+def pytest_addoption(parser: pytest.Parser) -> None:
+    group = parser.getgroup("functional_correctness", "functional correctness of the generated modules")
+    group.addoption("--generated-dir", default=GENERATED_DIR, help="Directory with the generated modules.")
+    group.addoption("--results-dir", default=RESULTS_DIR, help="Directory where the results are saved.")
+    group.addoption("--prompt", action="append", dest="prompts", help="Test only the given prompt (repeatable).")
+    group.addoption(
+        "--iteration", action="append", type=int, dest="iterations", help="Test only the given iteration (repeatable)."
+    )
+    group.addoption("--model", action="append", dest="models", help="Test only the given model (repeatable).")
+    group.addoption("--shard", default=None, help="Run only the given share of the modules (index/count, e.g. 1/4).")
+    group.addoption("--workers", default="1", help="Number of worker processes or 'auto' (one per CPU core).")
+
+
+def pytest_configure(config: pytest.Config) -> None:
+    config.pluginmanager.register(FunctionalCorrectness(config), "functional_correctness")
+
+
+def pytest_generate_tests(metafunc: pytest.Metafunc) -> None:
+    if "implementation" not in metafunc.fixturenames:
+        return
+
+    implementations = get_implementations(metafunc.definition.path.parent.name, metafunc.config)
+    metafunc.parametrize(
+        "implementation",
+        implementations,
+        ids=[get_implementation_id(implementation) for implementation in implementations],
+        indirect=True,
+        scope="module",
+    )
+
+
+@pytest.fixture(scope="module")
+def implementation(request: pytest.FixtureRequest):
+    """
+    The generated module tested by the current test (imported once per module).
+    """
+    return load_implementation(request.param, request.config.getoption("generated_dir"))
+
+
+class FunctionalCorrectness:
+    """
+    Splits the generated modules between the workers and saves the results of every module.
+    """
+
+    def __init__(self, config: pytest.Config):
+        """
+        Initializes the plugin from the command line options.
+
+        Args:
+            config (pytest.Config): The pytest configuration.
+        """
+        self.config = config
+        self.shard = parse_shard(config.getoption("shard")) if config.getoption("shard") else None
+        self.workers = 1 if self.shard else get_workers(config.getoption("workers"))
+        self.implementations = {}
+        self.results = defaultdict(dict)
+
+    @pytest.hookimpl(trylast=True)
+    def pytest_collection_modifyitems(self, config: pytest.Config, items: list) -> None:
+        order = {}
+        for item in items:
+            callspec = getattr(item, "callspec", None)
+            if callspec is not None and "implementation" in callspec.params:
+                implementation = callspec.params["implementation"]
+                self.implementations[item.nodeid] = implementation
+                order.setdefault(implementation, len(order))
+
+        if self.shard is None:
+            return
+
+        index, count = self.shard
+        selected, deselected = [], []
+        for item in items:
+            implementation = self.implementations.get(item.nodeid)
+            if implementation is None or order[implementation] % count == index:
+                selected.append(item)
+            else:
+                deselected.append(item)
+
+        if deselected:
+            config.hook.pytest_deselected(items=deselected)
+            items[:] = selected
+
+    @pytest.hookimpl(tryfirst=True)
+    def pytest_runtestloop(self, session: pytest.Session):
+        if self.workers <= 1 or session.config.option.collectonly:
+            return None
+
+        arguments = [*self.config.invocation_params.args, "--workers=1", "-p", "no:cacheprovider"]
+        processes = [
+            subprocess.Popen(
+                [sys.executable, "-m", "pytest", *arguments, f"--shard={worker}/{self.workers}"],
+                cwd=self.config.invocation_params.dir,
+                stdout=subprocess.PIPE,
+                stderr=subprocess.STDOUT,
+                text=True,
+            )
+            for worker in range(1, self.workers + 1)
+        ]
+
+        reporter = session.config.pluginmanager.get_plugin("terminalreporter")
+        for worker, process in enumerate(processes, start=1):
+            output, _ = process.communicate()
+            lines = output.rstrip().splitlines()
+            reporter.write_line(f"Worker {worker}/{self.workers}: {lines[-1] if lines else 'no output'}")
+            if process.returncode == pytest.ExitCode.TESTS_FAILED:
+                session.testsfailed += 1
+            elif process.returncode not in (pytest.ExitCode.OK, pytest.ExitCode.NO_TESTS_COLLECTED):
+                session.testsfailed += 1
+                reporter.write(output)
+
+        return True
+
+    def pytest_runtest_logreport(self, report: pytest.TestReport) -> None:
+        implementation = self.implementations.get(report.nodeid)
+        if implementation is None:
+            return
+
+        result = self.results[implementation].setdefault(
+            report.nodeid, {"outcome": "passed", "duration": 0.0, "call_duration": 0.0, "message": ""}
+        )
+        result["duration"] += report.duration
+
+        if report.when == "call":
+            result["call_duration"] = report.duration
+            if report.failed:
+                result["outcome"] = "failed"
+            elif report.skipped:
+                result["outcome"] = "skipped"
+        elif report.failed:
+            result["outcome"] = "error"
+        elif report.skipped and result["outcome"] == "passed":
+            result["outcome"] = "skipped"
+
+        if report.failed and not result["message"]:
+            result["message"] = report.longrepr.reprcrash.message if hasattr(report.longrepr, "reprcrash") else ""
+
+    def pytest_sessionfinish(self, session: pytest.Session) -> None:
+        results_dir = self.config.getoption("results_dir")
+        for implementation, results in self.results.items():
+            challenge, prompt, iteration, model = implementation
+            directory = f"{results_dir}/{challenge}/{prompt}/iteration_{iteration}"
+            os.makedirs(directory, exist_ok=True)
+
+            counts = defaultdict(int)
+            for result in results.values():
+                counts[result["outcome"]] += 1
+
+            with open(f"{directory}/{RESULT_FILE.format(model=model)}", "w", encoding="utf-8") as file:
+                file.write(f"Testing module: {model}\n")
+                for nodeid, result in results.items():
+                    if result["outcome"] in ("failed", "error"):
+                        name = get_test_case(nodeid)
+                        message = result["message"].splitlines()[0] if result["message"] else ""
+                        file.write(f"{result['outcome'].upper()} {name} - {message}\n")
+                file.write(f"{format_summary(counts, sum(result['duration'] for result in results.values()))}\n")
+
+            # the duration of the call only, the import of the module is part of the setup of the first test
+            with open(f"{directory}/{CASES_FILE.format(model=model)}", "w", encoding="utf-8", newline="") as file:
+                writer = csv.writer(file)
+                writer.writerow(["test_case", "outcome", "duration"])
+                for nodeid, result in results.items():
+                    writer.writerow([get_test_case(nodeid), result["outcome"], result["call_duration"]])
+
+        # the workers write only the files of their modules, the matrices are merged once by the main process
+        if self.shard is None:
+            for challenge in sorted({implementation[0] for implementation in self.implementations.values()}):
+                write_matrices(challenge, results_dir)
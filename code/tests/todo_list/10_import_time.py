@@ -0,0 +1,108 @@
+"""
+Import time test
+Output: median import time of the module (python -X importtime) and of its direct dependencies
+"""
+
+import os
+import statistics
+import subprocess
+import sys
+from collections import defaultdict
+
+
+def parse_import_time(output: str, module: str) -> dict:
+    """
+    Parses the output of python -X importtime and returns the import times of the module and of its direct dependencies.
+    Dependencies imported already by another dependency are included in that dependency.
+
+    Args:
+        output (str): The stderr of the Python process started with -X importtime.
+        module (str): The name of the imported module.
+
+    Returns:
+        dict: A mapping of the name to the cumulative import time in microseconds
+              ("total" and "self" for the module itself).
+    """
+    times = {}
+    dependencies = {}
+    for line in output.splitlines():
+        if not line.startswith("import time:") or line.count("|") != 2:
+            continue
+
+        self_time, cumulative_time, name = line[len("import time:") :].split("|")
+        try:
+            self_time = int(self_time.strip())
+            cumulative_time = int(cumulative_time.strip())
+        except ValueError:
+            continue
+
+        level = (len(name) - len(name.lstrip(" ")) - 1) // 2
+        name = name.strip()
+
+        if level == 0:
+            if name == module:
+                times["total"] = cumulative_time
+                times["self"] = self_time
+                times.update(dependencies)
+            dependencies = {}
+        elif level == 1:
+            dependencies[name] = cumulative_time
+
+    return times
+
+
+def test_import_time(directory, module, repeats) -> dict:
+    """
+    Imports the module in fresh Python processes and returns the median import times.
+
+    Args:
+        directory (str): The directory with the module.
+        module (str): The name of the module to be imported.
+        repeats (int): The number of fresh processes.
+
+    Returns:
+        dict: A mapping of the name to the median import time in microseconds.
+    """
+    samples = defaultdict(list)
+    for repeat in range(repeats + 1):
+        process = subprocess.run(
+            [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+            cwd=directory,
+            stdin=subprocess.DEVNULL,
+            capture_output=True,
+            text=True,
+            timeout=60,
+        )
+        if process.returncode != 0:
+            raise ImportError(f"Module {module} cannot be imported.")
+
+        # the first run compiles the module to bytecode, so it is not measured
+        if repeat == 0:
+            continue
+
+        for name, value in parse_import_time(process.stderr, module).items():
+            samples[name].append(value)
+
+    return {name: int(statistics.median(values)) for name, values in samples.items()}
+
+
+if __name__ == "__main__":
+    modules = {"chatgpt": "chatgpt.py", "claude": "claude.py", "gemini": "gemini.py"}
+
+    if sys.argv[1] not in modules:
+        raise ValueError(f"Invalid module name: {sys.argv[1]}")
+
+    module_path = os.path.join(os.path.dirname(os.path.abspath(__file__)), modules[sys.argv[1]])
+    if not os.path.exists(module_path):
+        print(f"File not found: {modules[sys.argv[1]]}")
+        sys.exit(1)
+
+    print(f"Testing module: {sys.argv[1]}")
+    try:
+        times = test_import_time(os.path.dirname(module_path), sys.argv[1], 20)
+        print(f"Import time: {times.pop('total')} us")
+        print(f"Self import time: {times.pop('self')} us")
+        for name, value in sorted(times.items(), key=lambda item: item[1], reverse=True):
+            print(f"Import time of {name}: {value} us")
+    except Exception as _:
+        print(f"Module {sys.argv[1]} failed with error.")
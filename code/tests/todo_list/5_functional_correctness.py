@@ -1,20 +1,16 @@
 """
 Test for correct implementation of the functions (internal)
-Running: pytest 3_functional_correctness.py
+Running: python -m pytest code/tests/todo_list/5_functional_correctness.py (from the root of the repository)
+The tests run for every generated module, see conftest.py.
 Output: pytest report
 """
 
 import pytest
 
 
-# from chatgpt import TaskManager
-# from claude import TaskManager
-# from gemini import TaskManager
-
-
 @pytest.fixture
-def manager():
-    return TaskManager()
+def manager(implementation):
+    return implementation.TaskManager()
 
 
 @pytest.fixture(autouse=True)
@@ -1,8 +1,12 @@
 """
 Test of average operation execution time
 Output: average run time of the individual shape rendering operations
+Running: python 6_time_behaviour.py <module> [profile_dir]
+(with profile_dir, a cProfile dump is saved for every operation)
 """
 
+import cProfile
+import os
 import time
 import sys
 
@@ -12,7 +16,26 @@ from claude import TaskManager as ClaudeTaskManager
 from gemini import TaskManager as GeminiTaskManager
 
 
-def time_operation(instance, method, iterations, flag, *args) -> None:
+def get_profile_file(profile_dir, module, operation) -> str:
+    """
+    Returns the path of the cProfile dump for the given module and operation.
+
+    Args:
+        profile_dir (str): The directory where the profiles are stored (None disables profiling).
+        module (str): The name of the tested module.
+        operation (str): The name of the profiled operation.
+
+    Returns:
+        str: The path to the .pstats file or None if profiling is disabled.
+    """
+    if not profile_dir:
+        return None
+
+    os.makedirs(profile_dir, exist_ok=True)
+    return os.path.join(profile_dir, f"6_time_behaviour-{module}-{operation}.pstats")
+
+
+def time_operation(instance, method, iterations, flag, *args, profile_file=None) -> None:
     """
     Times the execution of a specified method on a given instance over a number of iterations.
 
@@ -20,13 +43,19 @@ def time_operation(instance, method, iterations, flag, *args) -> None:
         instance (object): The object instance on which the method will be called.
         method (str): The name of the method to be timed.
         iterations (int): The number of times the method will be called.
+        flag (bool): A flag indicating whether to format the arguments.
         *args: Additional arguments to be passed to the method.
+        profile_file (str): The path where the cProfile dump is saved (None disables profiling).
 
     Returns:
         None
     """
     try:
+        profiler = cProfile.Profile() if profile_file else None
+
         start_time = time.time()
+        if profiler:
+            profiler.enable()
         for i in range(iterations):
             if flag:
                 formated_args = [arg.format(i=i + 1) for arg in args]
@@ -35,8 +64,13 @@ def time_operation(instance, method, iterations, flag, *args) -> None:
                 getattr(instance, method)(*formated_args)
             else:
                 getattr(instance, method)()
+        if profiler:
+            profiler.disable()
         end_time = time.time()
 
+        if profiler:
+            profiler.dump_stats(profile_file)
+
         print(
             f"Average time for {method}: {((end_time - start_time) / iterations):.20f} seconds"
         )
@@ -44,27 +78,39 @@ def time_operation(instance, method, iterations, flag, *args) -> None:
         print(f"Method {method} failed with error.")
 
 
-def test_operations(instance, iterations) -> None:
+def test_operations(instance, iterations, profile_dir=None) -> None:
     """
     Tests various operations on a given instance for a specified number of iterations.
 
     Args:
         instance: The instance on which the operations will be performed.
         iterations (int): The number of times each operation will be performed.
+        profile_dir (str): The directory for the cProfile dumps (None disables profiling).
 
     Returns:
         None
     """
     print(f"Testing {iterations} iterations of each operation\n")
 
-    time_operation(
-        instance, "add", iterations, True, "task_name_{i}", "task_description_{i}"
-    )
-    time_operation(instance, "get_all", iterations, False)
-    time_operation(instance, "search", iterations, True, "task_name_{i}")
-    time_operation(instance, "search", iterations, True, "task_description_{i}")
-    time_operation(instance, "finish", iterations, True, "{i}")
-    time_operation(instance, "remove", iterations, True, "{i}")
+    module = instance.__class__.__module__
+    operations = [
+        ("add_task", "add", True, "task_name_{i}", "task_description_{i}"),
+        ("get_all_tasks", "get_all", False),
+        ("search_task-by_name", "search", True, "task_name_{i}"),
+        ("search_task-by_description", "search", True, "task_description_{i}"),
+        ("finish_task", "finish", True, "{i}"),
+        ("remove_task", "remove", True, "{i}"),
+    ]
+
+    for operation, method, flag, *args in operations:
+        time_operation(
+            instance,
+            method,
+            iterations,
+            flag,
+            *args,
+            profile_file=get_profile_file(profile_dir, module, operation),
+        )
 
 
 if __name__ == "__main__":
@@ -73,12 +119,18 @@ if __name__ == "__main__":
         "claude": ClaudeTaskManager,
         "gemini": GeminiTaskManager,
     }
+    # the reference implementation is copied next to the generated modules only if it exists (see automatic.sh)
+    if sys.argv[1] == "reference":
+        from reference import TaskManager as ReferenceTaskManager
+
+        modules["reference"] = ReferenceTaskManager
 
     if sys.argv[1] not in modules:
         raise ValueError(f"Invalid module name: {sys.argv[1]}")
 
     print(f"Testing module: {modules[sys.argv[1]].__module__}")
     try:
-        test_operations(modules[sys.argv[1]](), 10_000)
+        profile_dir = sys.argv[2] if len(sys.argv) > 2 else None
+        test_operations(modules[sys.argv[1]](), 10_000, profile_dir)
     except Exception as _:
         print(f"Module {modules[sys.argv[1]].__module__} failed with error.")
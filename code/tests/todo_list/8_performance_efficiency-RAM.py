@@ -191,6 +191,11 @@ if __name__ == "__main__":
         "claude": ClaudeTaskManager,
         "gemini": GeminiTaskManager,
     }
+    # the reference implementation is copied next to the generated modules only if it exists (see automatic.sh)
+    if sys.argv[1] == "reference":
+        from reference import TaskManager as ReferenceTaskManager
+
+        modules["reference"] = ReferenceTaskManager
 
     if sys.argv[1] not in modules:
         raise ValueError(f"Invalid module name: {sys.argv[1]}")